@@ -0,0 +1,144 @@
+"""
+Prices tender projects without the GUI, e.g. for overnight repricing or regression runs.
+
+    python batch_pricing.py 12 15 specs/site_a.json --format xlsx --output reports
+    python batch_pricing.py --all --workers 4 --as-of "1404/05/01"
+    python batch_pricing.py 12 --sweep "fan.motors.fan.power=[110000, 132000]" --sweep "project_info.l_voltage=[380, 400]"
+    python batch_pricing.py --set-rate USD=1050000 --set-rate EUR=1180000
+
+Sources are saved project ids or JSON files of project_electrical_specs. Exits with 1
+when a source could not be loaded or priced. With --sweep every source is priced for every
+combination of the given spec overrides instead (see sweep_controller). --set-rate saves
+exchange rates (BASE_CURRENCY per unit, effective now) before pricing; it can run alone.
+"""
+import argparse
+import json
+import sys
+
+from controllers.tender_application.batch_pricing_controller import (
+    OUTPUT_FORMATS, load_all_jobs, load_job, price_jobs, write_results
+)
+from controllers.tender_application.sweep_controller import sweep, write_sweeps
+from models.exchange_rate import get_exchange_rates, insert_exchange_rate_to_db
+from utils.migrations import run_migrations
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Price GriinPower projects without the GUI.")
+    parser.add_argument("sources", nargs="*", help="saved project ids or project_electrical_specs JSON files")
+    parser.add_argument("--all", action="store_true", help="price every saved project")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="output format (default: csv)")
+    parser.add_argument("--output", default="pricing", help="output directory (default: ./pricing)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--as-of", default=None, help='exchange rates in effect at a Jalali date, e.g. "1404/05/01"')
+    parser.add_argument("--sweep", action="append", default=[], metavar="PATH=VALUES",
+                        help="spec key path and a JSON list of values to try, e.g. fan.motors.fan.power=[110000,132000]")
+    parser.add_argument("--set-rate", action="append", default=[], metavar="CUR=RATE",
+                        help="save an exchange rate in BASE_CURRENCY per unit, e.g. USD=1050000")
+    args = parser.parse_args(argv)
+    if not args.sources and not args.all and not args.set_rate:
+        parser.error("give project ids or JSON files, --all or --set-rate")
+
+    args.rates = {}
+    for option in args.set_rate:
+        currency, _, rate = option.partition("=")
+        try:
+            rate = float(rate)
+        except ValueError:
+            rate = None
+        if not currency.strip() or rate is None or rate <= 0:
+            parser.error(f"--set-rate expects CUR=RATE with a positive rate, got {option}")
+        args.rates[currency.strip().upper()] = rate
+
+    args.overrides = {}
+    for option in args.sweep:
+        path, _, values = option.partition("=")
+        try:
+            values = json.loads(values)
+        except ValueError:
+            values = None
+        if not path or not isinstance(values, list):
+            parser.error(f"--sweep expects PATH=[JSON values], got {option}")
+        args.overrides[path] = values
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    success, message = run_migrations()
+    if not success:
+        print(message, file=sys.stderr)
+        return 1
+
+    for currency, rate in args.rates.items():
+        success, message = insert_exchange_rate_to_db(currency, rate)
+        if not success:
+            print(message, file=sys.stderr)
+            return 1
+        print(f"saved rate {currency} = {rate:,.2f}")
+    if not args.sources and not args.all:
+        return 0
+
+    failed = False
+    jobs = []
+    if args.all:
+        success, all_jobs = load_all_jobs()
+        if success:
+            jobs.extend(all_jobs)
+        else:
+            print(all_jobs, file=sys.stderr)
+            failed = True
+    for source in args.sources:
+        success, job = load_job(source)
+        if success:
+            jobs.append(job)
+        else:
+            print(job, file=sys.stderr)
+            failed = True
+
+    success, rates = get_exchange_rates(args.as_of)
+    if not success:
+        print(rates, file=sys.stderr)
+        return 1
+
+    if args.overrides:
+        return 1 if sweep_jobs(jobs, args, rates) or failed else 0
+
+    results = price_jobs(jobs, rates, workers=args.workers)
+    for label, success, result in results:
+        if success:
+            print(f"{label}: total {result['totals']['total']:,.2f}")
+            for error in result["errors"]:
+                print(f"{label}: {error}", file=sys.stderr)
+        else:
+            print(f"❌ {label} failed:\n{result}", file=sys.stderr)
+            failed = True
+
+    for path in write_results(results, args.output, args.format):
+        print(f"written {path}")
+    return 1 if failed else 0
+
+
+def sweep_jobs(jobs, args, rates):
+    """Sweeps every job over args.overrides and writes the results; returns True when one failed."""
+    failed = False
+    sweeps = []
+    for label, specs in jobs:
+        success, result = sweep(specs, args.overrides, rates)
+        if success:
+            print(f"{label}: total {result['total'].min():,.2f} ~ {result['total'].max():,.2f} "
+                  f"over {result['total'].size} combinations")
+            for error in result["errors"]:
+                print(f"{label}: {error}", file=sys.stderr)
+            sweeps.append((label, result))
+        else:
+            print(f"❌ {label} failed: {result}", file=sys.stderr)
+            failed = True
+
+    for path in write_sweeps(sweeps, args.output, args.format):
+        print(f"written {path}")
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,9 +11,28 @@ DATABASE_DIR = os.path.join(DATABASE_DIR, 'GriinPower.db')
 DATABASE_PATH = f'sqlite:///{DATABASE_DIR}'
 print(DATABASE_PATH)
 
+# Memory-mapped catalog snapshot (see models/catalog_snapshot.py)
+CATALOG_SNAPSHOT_PATH = os.path.join(BASE_DIR, 'data', 'catalog.snapshot')
+
+# Database engine profile
+DATABASE_ECHO = os.environ.get("GRIINPOWER_SQL_ECHO", "0") == "1"  # opt-in SQL logging
+DATABASE_POOL_SIZE = 5  # UI thread + background workers
+DATABASE_MAX_OVERFLOW = 5
+DATABASE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,  # negative = KiB
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,  # ms
+}
+
 # Application settings
 APP_NAME = "Electronic Component Manager"
 APP_VERSION = "1.0.0"
 
 COSNUS_PI = 0.85
 ETA = 0.93
+
+# Currency every BOM total is normalized to (see models/exchange_rate.py)
+BASE_CURRENCY = "IRR"
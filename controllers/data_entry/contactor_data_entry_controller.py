@@ -6,8 +6,9 @@ from bs4 import BeautifulSoup
 
 from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
 
+from models.bulk_import import bulk_upsert_components
 from models.component_suppliers import insert_component_suppliers_to_db
-from models.items.contactor import get_all_contactors, insert_contactor_to_db
+from models.items.contactor import get_all_contactors, insert_contactor_to_db, contactor_attributes
 from models.supplier import get_supplier_by_name
 
 
@@ -135,22 +136,23 @@ class ContactorDataEntryController:
 
     def save_contactors(self, contactors_list):
 
-        for contactor in contactors_list:
-            success, contactor_id = insert_contactor_to_db(
-                rated_current=contactor["rated_current"],
-                coil_voltage=contactor["coil_voltage"],
-                brand=contactor["brand"],
-                order_number=contactor["order_number"],
-                created_by_id=2, # System
-            )
-            if not success:
-                return False, "Failed to save contactor"
-
-            success, result = insert_component_suppliers_to_db(
-                component_id=contactor_id, supplier_id=contactor["supplier_id"],
-                price=contactor["price"], currency="IRR", created_by_id=2
-            )
-            if not success:
-                return False, "Failed to save price"
+        items = [
+            {
+                "attributes": contactor_attributes(
+                    rated_current=contactor["rated_current"],
+                    coil_voltage=contactor["coil_voltage"],
+                    brand=contactor["brand"],
+                    order_number=contactor["order_number"],
+                ),
+                "supplier_id": contactor["supplier_id"],
+                "price": contactor["price"],
+                "currency": "IRR",
+            }
+            for contactor in contactors_list
+        ]
+        success, counts = bulk_upsert_components("Contactor", items, created_by_id=2)  # System
+        if not success:
+            return False, counts
 
-        return True, "✅ Contactor Saved successfully"
\ No newline at end of file
+        return True, (f"✅ Contactor Saved successfully\n"
+                      f"inserted: {counts['inserted']}, updated: {counts['updated']}, unchanged: {counts['unchanged']}")
\ No newline at end of file
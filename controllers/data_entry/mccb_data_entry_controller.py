@@ -5,8 +5,9 @@ import requests
 from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
 from bs4 import BeautifulSoup
 
+from models.bulk_import import bulk_upsert_components
 from models.component_suppliers import insert_component_suppliers_to_db
-from models.items.mccb import get_all_mccbs, insert_mccb_to_db
+from models.items.mccb import get_all_mccbs, insert_mccb_to_db, mccb_attributes
 from models.supplier import get_supplier_by_name
 
 
@@ -171,25 +172,23 @@ class MCCBDataEntryController:
 
     def save_mccbs(self, mccbs_list):
 
-        for mccb in mccbs_list:
-            success, mccb_id = insert_mccb_to_db(
-                rated_current=mccb["rated_current"],
-                breaking_capacity=mccb["breaking_capacity"],
-                brand=mccb["brand"],
-                order_number=mccb["order_number"],
-                created_by_id=2,  # System
-            )
-            if not success:
-                return False, "Failed to save mccb"
-
-            success, result = insert_component_suppliers_to_db(
-                component_id=mccb_id,
-                supplier_id=mccb["supplier_id"],
-                price=mccb["price"],
-                currency="IRR",
-                created_by_id=2
-            )
-            if not success:
-                return False, "Failed to save price"
+        items = [
+            {
+                "attributes": mccb_attributes(
+                    rated_current=mccb["rated_current"],
+                    breaking_capacity=mccb["breaking_capacity"],
+                    brand=mccb["brand"],
+                    order_number=mccb["order_number"],
+                ),
+                "supplier_id": mccb["supplier_id"],
+                "price": mccb["price"],
+                "currency": "IRR",
+            }
+            for mccb in mccbs_list
+        ]
+        success, counts = bulk_upsert_components("MCCB", items, created_by_id=2)  # System
+        if not success:
+            return False, counts
 
-        return True, "✅ MCCB Saved successfully"
+        return True, (f"✅ MCCB Saved successfully\n"
+                      f"inserted: {counts['inserted']}, updated: {counts['updated']}, unchanged: {counts['unchanged']}")
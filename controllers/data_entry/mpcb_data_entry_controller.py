@@ -7,8 +7,9 @@ from bs4 import BeautifulSoup
 from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
 
 
+from models.bulk_import import bulk_upsert_components
 from models.component_suppliers import insert_component_suppliers_to_db
-from models.items.mpcb import get_all_mpcbs, insert_mpcb_to_db
+from models.items.mpcb import get_all_mpcbs, insert_mpcb_to_db, mpcb_attributes
 from models.supplier import get_supplier_by_name
 
 
@@ -169,24 +170,25 @@ class MPCBDataEntryController:
 
     def save_mpcbs(self, mpcbs_list):
 
-        for mpcb in mpcbs_list:
-            success, mpcb_id = insert_mpcb_to_db(
-                min_current=mpcb["min_current"],
-                max_current=mpcb["max_current"],
-                breaking_capacity=mpcb["breaking_capacity"],
-                trip_class=mpcb["trip_class"],
-                brand=mpcb["brand"],
-                order_number=mpcb["order_number"],
-                created_by_id=2, # System
-            )
-            if not success:
-                return False, "Failed to save mpcb"
-
-            success, result = insert_component_suppliers_to_db(
-                component_id=mpcb_id, supplier_id=mpcb["supplier_id"],
-                price=mpcb["price"], currency="IRR", created_by_id=2
-            )
-            if not success:
-                return False, "Failed to save price"
+        items = [
+            {
+                "attributes": mpcb_attributes(
+                    min_current=mpcb["min_current"],
+                    max_current=mpcb["max_current"],
+                    breaking_capacity=mpcb["breaking_capacity"],
+                    trip_class=mpcb["trip_class"],
+                    brand=mpcb["brand"],
+                    order_number=mpcb["order_number"],
+                ),
+                "supplier_id": mpcb["supplier_id"],
+                "price": mpcb["price"],
+                "currency": "IRR",
+            }
+            for mpcb in mpcbs_list
+        ]
+        success, counts = bulk_upsert_components("MPCB", items, created_by_id=2)  # System
+        if not success:
+            return False, counts
 
-        return True, "✅ MPCB Saved successfully"
+        return True, (f"✅ MPCB Saved successfully\n"
+                      f"inserted: {counts['inserted']}, updated: {counts['updated']}, unchanged: {counts['unchanged']}")
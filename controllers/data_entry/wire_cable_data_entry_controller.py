@@ -9,8 +9,9 @@ from bs4 import BeautifulSoup
 
 from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
 
+from models.bulk_import import bulk_upsert_components
 from models.component_suppliers import insert_component_suppliers_to_db
-from models.items.wire_cable import insert_wire_cable_to_db
+from models.items.wire_cable import insert_wire_cable_to_db, wire_cable_attributes
 from models.supplier import get_supplier_by_name
 
 
@@ -169,22 +170,22 @@ class WireCableDataEntryController:
 
     def save_wire_cables(self, wire_cables_list):
 
-        for wire_cable in wire_cables_list:
-            success, wire_cable_id = insert_wire_cable_to_db(type=wire_cable['type'],
-                                                             l_number=wire_cable['l_number'],
-                                                             l_size=wire_cable['l_size'],
-                                                             brand=wire_cable['brand'],
-                                                             note=wire_cable['note'],
-                                                             created_by_id=2,  # System
-                                                             )
-            if not success:
-                return False, "Failed to save wire_cable"
-
-            success, result = insert_component_suppliers_to_db(
-                component_id=wire_cable_id, supplier_id=wire_cable["supplier_id"],
-                price=wire_cable["price"], currency="IRR", created_by_id=2
-            )
-            if not success:
-                return False, "Failed to save price"
+        items = [
+            {
+                "attributes": wire_cable_attributes(type=wire_cable['type'],
+                                                    l_number=wire_cable['l_number'],
+                                                    l_size=wire_cable['l_size'],
+                                                    brand=wire_cable['brand'],
+                                                    note=wire_cable['note']),
+                "supplier_id": wire_cable["supplier_id"],
+                "price": wire_cable["price"],
+                "currency": "IRR",
+            }
+            for wire_cable in wire_cables_list
+        ]
+        success, counts = bulk_upsert_components("WireCable", items, created_by_id=2)  # System
+        if not success:
+            return False, counts
 
-        return True, "✅ WireCable Saved successfully"
\ No newline at end of file
+        return True, (f"✅ WireCable Saved successfully\n"
+                      f"inserted: {counts['inserted']}, updated: {counts['updated']}, unchanged: {counts['unchanged']}")
\ No newline at end of file
@@ -0,0 +1,79 @@
+import threading
+
+from models.catalog import export_catalog_snapshot, is_catalog_snapshot_current, load_full_catalog
+from models.option_index import get_option_index
+from models.supplier import get_all_suppliers
+
+
+class CatalogPrefetch:
+    """
+    Singleton that warms the catalog, the supplier list and the option index on a worker
+    thread right after login, so the first windows do not load them on the UI thread.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(CatalogPrefetch, cls).__new__(cls)
+            cls._instance._thread = None
+            cls._instance._done = threading.Event()
+            cls._instance._results = {}
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="catalog-prefetch", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        try:
+            self._results["suppliers"] = get_all_suppliers()
+            self._results["options"] = get_option_index()
+            self._results["catalog"] = _warm_catalog()
+        finally:
+            self._done.set()
+
+    def is_done(self):
+        return self._thread is None or self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Blocks until the prefetch finished; returns at once when it already has (or never started)."""
+        if self._thread is None:
+            return True
+        return self._done.wait(timeout)
+
+    def take(self, name, loader):
+        """
+        Returns a prefetched (success, result) pair once, then falls back to calling loader(),
+        so later windows see changes such as newly added suppliers.
+        """
+        with self._lock:
+            result = self._results.pop(name, None) if self._done.is_set() else None
+        if result is None or not result[0]:
+            return loader()
+        return result
+
+    def catalog_status(self):
+        """
+        Returns (False, message) once after the catalog warm-up failed; (True, None) otherwise,
+        also while the prefetch is still running or when it never started.
+        """
+        with self._lock:
+            return self._results.pop("catalog", (True, None)) if self._done.is_set() else (True, None)
+
+
+def _warm_catalog():
+    """
+    Loads the whole catalog and keeps the snapshot file fresh for the next start-up.
+    Returns (True, None) or (False, message); lookups fall back to the database on failure.
+    """
+    try:
+        load_full_catalog()
+        if not is_catalog_snapshot_current():
+            success, result = export_catalog_snapshot()
+            if not success:
+                return False, result
+        return True, None
+    except Exception as e:
+        return False, f"❌ Catalog prefetch failed: {str(e)}"
@@ -1,6 +1,5 @@
 import math
 import re
-from copy import deepcopy
 
 from controllers.tender_application.panel_controller import PanelController
 
@@ -16,8 +15,8 @@ class BagfilterController(PanelController):
     Specialized controller for bagfilter panel.
     """
 
-    def __init__(self):
-        super().__init__("bagfilter")
+    def __init__(self, electrical_specs=None, motors=None):
+        super().__init__("bagfilter", electrical_specs, motors)
 
     def build_panel(self):
         """
@@ -103,7 +102,7 @@ class BagfilterController(PanelController):
 
     def choose_electrical_panel(self):
 
-        success, electrical_panel = get_electrical_panel_by_spec(type="Electrical Panel")
+        success, electrical_panel = self.lookup(get_electrical_panel_by_spec, type="Electrical Panel")
         if success:
             self.add_to_panel(
                 type="Electrical Panel",
@@ -112,6 +111,7 @@ class BagfilterController(PanelController):
                 specifications=f"{electrical_panel.width}mm x {electrical_panel.height}mm x {electrical_panel.depth}mm",
                 quantity=1,
                 price=electrical_panel.get("price", 0),
+                currency=electrical_panel.get("currency", ""),
                 last_price_update=f"{electrical_panel.get('supplier_name', '')}\n{electrical_panel.get('date', '')}",
                 note=""
             )
@@ -131,7 +131,7 @@ class BagfilterController(PanelController):
         if qty <= 0:
             return
 
-        success, item = get_general_by_spec(comp_type, specification)
+        success, item = self.lookup(get_general_by_spec, comp_type, specification)
         display_type = f"{comp_type} {specification}".strip()
 
         if success:
@@ -142,6 +142,7 @@ class BagfilterController(PanelController):
                 specifications=item.get("specification", ""),
                 quantity=qty,
                 price=item.get("price", 0),
+                currency=item.get("currency", ""),
                 last_price_update=f"{item.get('supplier_name', '')}\n{item.get('date', '')}",
                 note=""
             )
@@ -181,12 +182,12 @@ class BagfilterController(PanelController):
         """
         total_current = 0.0
 
-        for section in self.electrical_specs.values():
+        for section_name, section in self.electrical_specs.items():
             motors = section.get("motors", {})
             for motor_name, motor_data in motors.items():
                 try:
                     qty = motor_data.get("qty", 0)
-                    current = motor_data.get("motor", 0).current
+                    current = self.get_motor(section_name, motor_name).current
                     total_current += qty * current
                 except Exception:
                     pass
@@ -194,8 +195,8 @@ class BagfilterController(PanelController):
         if total_current == 0:
             return
 
-        success, mccb = get_mccb_by_current(rated_current=total_current,
-                                            brands=self.electrical_specs["project_info"]["proj_avl"])
+        success, mccb = self.lookup(get_mccb_by_current, rated_current=total_current,
+                                    brands=self.electrical_specs["project_info"]["proj_avl"])
         if success:
             self.add_to_panel(
                 type="MCCB INPUT PANEL",
@@ -206,6 +207,7 @@ class BagfilterController(PanelController):
                 ),
                 quantity=1,
                 price=mccb['price'],
+                currency=mccb['currency'],
                 last_price_update=f"{mccb['supplier_name']}\n{mccb['date']}",
                 note=""
             )
@@ -229,22 +231,24 @@ class BagfilterController(PanelController):
 
         cards = max(1, (total + 15) // 16)  # 16-channel cards
         if io_type == "DI":
-            success, card = get_general_by_spec(type="DI Module", specification="16")
+            success, card = self.lookup(get_general_by_spec, type="DI Module", specification="16")
         elif io_type == "DO":
-            success, card = get_general_by_spec(type="DO Module", specification="16")
+            success, card = self.lookup(get_general_by_spec, type="DO Module", specification="16")
         elif io_type == "AI":
-            success, card = get_general_by_spec(type="AI Module", specification="16")
+            success, card = self.lookup(get_general_by_spec, type="AI Module", specification="16")
         elif io_type == "AO":
-            success, card = get_general_by_spec(type="AO Module", specification="16")
+            success, card = self.lookup(get_general_by_spec, type="AO Module", specification="16")
 
         if success:
             price = card["price"] or 0
             effective_date = f"{card['supplier_name']}\n{card['date']}" or "Not Found"
             brand = card["brand"]
+            currency = card["currency"]
         else:
             price = 0
             effective_date = f"❌ Channel card not found"
             brand = ""
+            currency = ""
 
         self.add_to_panel(
             type=f"{io_type} 16 Channel",
@@ -252,13 +256,14 @@ class BagfilterController(PanelController):
             specifications=f"Total: {total}",
             quantity=cards,
             price=price,
+            currency=currency,
             last_price_update=effective_date,
             note="\n".join(notes)
         )
         return cards
 
     def calculate_plc_io_requirements(self, total_do, total_di, total_ao, total_ai):
-        instruments = deepcopy(self.electrical_specs["bagfilter"]["instruments"])
+        instruments = self.electrical_specs["bagfilter"]["instruments"]
 
         di_notes = [f"Initial DI: {total_di}"] if total_di else []
         ai_notes = [f"Initial AI: {total_ai}"] if total_ai else []
@@ -301,7 +306,7 @@ class BagfilterController(PanelController):
                 self.calculate_and_add_io(io["general_name"], io["count"], io["notes"])
 
         if total_20pin > 0:
-            success, pin_card = get_general_by_spec(type="Front Connector", specification="20")
+            success, pin_card = self.lookup(get_general_by_spec, type="Front Connector", specification="20")
             if success:
                 self.add_to_panel(
                     type="Front Connector 20Pin",
@@ -309,6 +314,7 @@ class BagfilterController(PanelController):
                     order_number=pin_card["order_number"],
                     quantity=total_20pin,
                     price=pin_card['price'],
+                    currency=pin_card['currency'],
                     last_price_update=f"{pin_card['supplier_name']}\n{pin_card['date']}",
                     note="Total connectors for all 16CH cards"
                 )
@@ -342,7 +348,7 @@ class BagfilterController(PanelController):
                 else instrument_name
             name = "vibration_transmitter" if name == "bearing_vibration_transmitter" else name
 
-            success, instrument = get_instrument_by_spec(name.replace('_', ' ').title())
+            success, instrument = self.lookup(get_instrument_by_spec, name.replace('_', ' ').title())
 
             if success:
                 self.add_to_panel(
@@ -352,6 +358,7 @@ class BagfilterController(PanelController):
                     specifications="",
                     quantity=qty,
                     price=instrument["price"],
+                    currency=instrument["currency"],
                     last_price_update=f"{instrument['supplier_name']}\n{instrument['date']}",
                 )
             else:
@@ -378,7 +385,7 @@ class BagfilterController(PanelController):
 
             if manifold_qty > 0 and manifold_ways:
 
-                success, manifold_obj = get_instrument_by_spec(type=manifold_ways)
+                success, manifold_obj = self.lookup(get_instrument_by_spec, type=manifold_ways)
                 if success:
                     self.add_to_panel(
                         type=manifold_ways,
@@ -386,6 +393,7 @@ class BagfilterController(PanelController):
                         order_number=manifold_obj['order_number'],
                         quantity=qty,
                         price=manifold_obj['price'],
+                        currency=manifold_obj['currency'],
                         last_price_update=f"{manifold_obj['supplier_name']}\n{manifold_obj['date']}",
                         note=f"manifold for {instrument_name.replace('_', ' ').title()}")
                 else:
@@ -401,13 +409,14 @@ class BagfilterController(PanelController):
 
             # ------------ Calibration ------------
             if "transmitter" in name and qty != 0:
-                success, calibration = get_instrument_by_spec(type="Calibration")
+                success, calibration = self.lookup(get_instrument_by_spec, type="Calibration")
                 if success:
                     self.add_to_panel(
                         type="CALIBRATION",
                         brand=calibration['brand'],
                         quantity=qty,
                         price=calibration['price'],
+                        currency=calibration['currency'],
                         last_price_update=f"{calibration['supplier_name']}\n{calibration['date']}",
                         note=f"calibration for {instrument_name.replace('_', ' ').title()}"
                     )
@@ -459,7 +468,8 @@ class BagfilterController(PanelController):
             protocol_filters["has_hart"] = True
         # else no protocol filters added, so these are optional
 
-        success, plc = get_plc_by_spec(
+        success, plc = self.lookup(
+            get_plc_by_spec,
             series=series,
             **protocol_filters
         )
@@ -472,6 +482,7 @@ class BagfilterController(PanelController):
                 specifications="",
                 quantity=1,
                 price=float(plc.get('price', 0)),
+                currency=plc.get('currency', ''),
                 last_price_update=f"{plc.get('supplier_name', '')}\n{plc.get('date', '')}",
                 note=(
                     f"Series: {plc.get('series', '')}, "
@@ -0,0 +1,164 @@
+"""
+Headless pricing of whole projects, without Qt.
+
+A job is (label, project_electrical_specs); load_job() reads one from a JSON file or a saved
+project id. price_jobs() prices the jobs in worker processes (each project is priced
+from its own read-only specs snapshot) and write_results() writes the BOMs and totals
+as csv, xlsx or json.
+"""
+import json
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from controllers.tender_application.installation_controller import InstallationController
+from controllers.tender_application.lookup_cache_controller import LookupCache
+from controllers.tender_application.panel_build_controller import PANEL_CONTROLLERS, build_panels
+from controllers.tender_application.project_session_controller import freeze_specs, motors_in_specs
+from models.exchange_rate import convert_amount, convert_currency
+from models.projects import get_all_project, get_project
+
+
+OUTPUT_FORMATS = ("csv", "xlsx", "json")
+
+
+def load_job(source):
+    """
+    Returns (True, (label, specs)) for a saved project id ("12") or a JSON file holding
+    project_electrical_specs, or (False, message).
+    """
+    if str(source).isdigit():
+        success, project = get_project(project_id=int(source))
+        if not success:
+            return False, f"❌ Project {source}: {project}"
+        return True, (f"project-{project.id}", json.loads(project.project_electrical_specs))
+
+    try:
+        with open(source, encoding="utf-8") as file:
+            specs = json.load(file)
+    except (OSError, ValueError) as e:
+        return False, f"❌ {source}: {str(e)}"
+    if "project_electrical_specs" in specs:  # an exported project row
+        specs = specs["project_electrical_specs"]
+        specs = json.loads(specs) if isinstance(specs, str) else specs
+    return True, (os.path.splitext(os.path.basename(source))[0], specs)
+
+
+def load_all_jobs():
+    """Returns (True, jobs) for every saved project, or (False, message)."""
+    success, projects = get_all_project()
+    if not success:
+        return False, projects
+    return True, [(f"project-{project.id}", json.loads(project.project_electrical_specs)) for project in projects]
+
+
+def price_project(specs, rates):
+    """
+    Builds every panel of one project and returns {"panels": {name: DataFrame in
+    BASE_CURRENCY}, "totals": {name: total}, "errors": [messages]}.
+    """
+    electrical_specs = freeze_specs(specs)
+    lookup_cache = LookupCache(electrical_specs["project_info"]["proj_avl"])
+
+    # the bagfilter and installation panels read the motors the other panels build
+    others = [name for name in PANEL_CONTROLLERS if name != "bagfilter_panel"]
+    panels, built_motors, electric_motor_price = build_panels(
+        electrical_specs, with_electric_motor=bool(electrical_specs["fan"]["status"]), lookup_cache=lookup_cache,
+        names=others)
+    motors = {**motors_in_specs(electrical_specs), **built_motors}
+    boms, _, _ = build_panels(electrical_specs, motors, lookup_cache=lookup_cache, names=["bagfilter_panel"])
+    boms.update(panels)
+    boms["installation_panel"] = InstallationController(electrical_specs, motors).build_panel()
+
+    result = {"panels": {}, "totals": {}, "errors": []}
+    for name, bom in boms.items():
+        df = bom.to_frame()
+        success, converted = convert_currency(df, rates)
+        if success:
+            df = converted
+        else:
+            result["errors"].append(f"{name}: {converted}")
+        result["panels"][name] = df.astype({"type": object, "brand": object, "currency": object})
+        result["totals"][name] = float(df["total_price"].sum())
+
+    if electric_motor_price is not None:
+        price, _, currency = electric_motor_price
+        success, converted = convert_amount(price, currency, rates)
+        if success:
+            price = converted
+        else:
+            result["errors"].append(f"electric_motor: {converted}")
+        result["totals"]["electric_motor"] = float(price)
+    result["totals"]["total"] = sum(result["totals"].values())
+    return result
+
+
+def _price_job(job, rates):
+    label, specs = job
+    try:
+        return label, True, price_project(specs, rates)
+    except Exception:
+        return label, False, traceback.format_exc()
+
+
+def price_jobs(jobs, rates, workers=None):
+    """
+    Prices the jobs on up to workers processes (default: one per CPU) and returns
+    [(label, success, result or traceback)] in job order.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        return [_price_job(job, rates) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(_price_job, jobs, [rates] * len(jobs)))
+
+
+def write_results(results, output_dir, output_format="csv"):
+    """
+    Writes the priced projects to output_dir and returns the written paths:
+    csv --> boms.csv and totals.csv, xlsx --> pricing.xlsx (BOM and Totals sheets),
+    json --> pricing.json ({project: {"panels", "totals", "errors"}}).
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    priced = [(label, result) for label, success, result in results if success]
+
+    if output_format == "json":
+        path = os.path.join(output_dir, "pricing.json")
+        document = {
+            label: {
+                "panels": {name: df.to_dict("records") for name, df in result["panels"].items()},
+                "totals": result["totals"],
+                "errors": result["errors"],
+            }
+            for label, result in priced
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(document, file, ensure_ascii=False, indent=1, default=str)
+        return [path]
+
+    frames = [df.assign(project=label, panel=name)
+              for label, result in priced for name, df in result["panels"].items()]
+    boms = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["project", "panel"])
+    boms = boms[["project", "panel"] + [column for column in boms.columns if column not in ("project", "panel")]]
+    totals = pd.DataFrame(
+        [{"project": label, "panel": name, "total_price": total}
+         for label, result in priced for name, total in result["totals"].items()],
+        columns=["project", "panel", "total_price"],
+    )
+
+    if output_format == "xlsx":
+        path = os.path.join(output_dir, "pricing.xlsx")
+        with pd.ExcelWriter(path, engine="openpyxl") as writer:
+            boms.to_excel(writer, sheet_name="BOM", index=False)
+            totals.to_excel(writer, sheet_name="Totals", index=False)
+        return [path]
+
+    paths = [os.path.join(output_dir, "boms.csv"), os.path.join(output_dir, "totals.csv")]
+    boms.to_csv(paths[0], index=False, encoding="utf-8-sig")
+    totals.to_csv(paths[1], index=False, encoding="utf-8-sig")
+    return paths
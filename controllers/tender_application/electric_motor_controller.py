@@ -1,18 +1,23 @@
+from controllers.tender_application.lookup_cache_controller import LookupCache
 from controllers.tender_application.project_session_controller import ProjectSession
 from models.items.electric_motor import get_motor_by_spec
 
 
 class ElectricMotorController():
 
-    def __init__(self):
-        self.electrical_specs = ProjectSession().project_electrical_specs
+    def __init__(self, electrical_specs=None):
+        # a read-only snapshot (freeze_specs) of the project to price, by default the open project's
+        self.electrical_specs = electrical_specs if electrical_specs is not None else ProjectSession().snapshot()
+        # replaced by the build's shared cache, like the panel controllers'
+        self.lookup_cache = LookupCache(self.electrical_specs["project_info"]["proj_avl"])
 
     def calculate_price(self):
         motor = self.electrical_specs["fan"]["motors"]["fan"]
         voltage = self.electrical_specs["project_info"]["l_voltage"]
         brand = motor["brand"]
 
-        success, electric_motor = get_motor_by_spec(
+        success, electric_motor = self.lookup_cache.lookup(
+            get_motor_by_spec,
             power=motor["power"],
             rpm=motor["rpm"],
             brand=brand,
@@ -25,9 +30,10 @@ class ElectricMotorController():
             thermal_protection=motor["thermal_protection"],
         )
         if success:
-            return electric_motor.component_supplier.price, f"{electric_motor.component_supplier.supplier.name}\n{electric_motor.component_supplier.date}",
+            return (electric_motor["price"], f"{electric_motor['supplier_name']}\n{electric_motor['date']}",
+                    electric_motor["currency"])
         elif success == False:
             # show_message(electric_motor, title="Error")
-            return 0, ""
+            return 0, "", ""
 
 
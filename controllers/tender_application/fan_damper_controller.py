@@ -9,8 +9,8 @@ class FanDamperController(PanelController):
     Specialized controller for building a fan_damper panel.
     """
 
-    def __init__(self):
-        super().__init__("fan_damper")
+    def __init__(self, electrical_specs=None, motors=None):
+        super().__init__("fan_damper", electrical_specs, motors)
 
     def build_panel(self):
         """
@@ -20,7 +20,7 @@ class FanDamperController(PanelController):
         damper_config = self.electrical_specs["damper"]["motors"]["damper"]
         damper = Motor(damper_config["power"], usage="Damper")
         damper.current = self.calculate_motor_current(power=damper.power)
-        self.electrical_specs["damper"]["motors"]["damper"]["motor"] = damper
+        self.add_motor("damper", "damper", damper)
 
         if damper_config["start_type"] == "Pneumatic":
             damper.mpcb_qty = 0
@@ -53,7 +53,7 @@ class FanDamperController(PanelController):
             fan_voltage = self.electrical_specs["project_info"]["m_voltage"]
         fan.current = self.calculate_motor_current(power=fan.power, volt=fan_voltage)
 
-        self.electrical_specs["fan"]["motors"]["fan"]["motor"] = fan
+        self.add_motor("fan", "fan", fan)
         fan.start_type = fan_config["start_type"]
         if fan_config["start_type"] == "Delta/Star":
             fan.contactor_qty = 3
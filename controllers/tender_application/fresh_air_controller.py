@@ -7,8 +7,8 @@ class FreshAirController(PanelController):
     Specialized controller for building a fresh air panel.
     """
 
-    def __init__(self):
-        super().__init__("fresh_air")
+    def __init__(self, electrical_specs=None, motors=None):
+        super().__init__("fresh_air", electrical_specs, motors)
 
     def build_panel(self):
         """
@@ -20,7 +20,7 @@ class FreshAirController(PanelController):
 
         freshair_motor = Motor(motors_config["freshair_motor"]["power"], usage="Fresh Air Motor")
         freshair_motor.current = self.calculate_motor_current(power=freshair_motor.power)
-        self.electrical_specs["fresh_air"]["motors"]["freshair_motor"]["motor"] = freshair_motor
+        self.add_motor("fresh_air", "freshair_motor", freshair_motor)
         if motors_config["freshair_motor"]["start_type"] == "VFD":
             freshair_motor.plc_ai = 1
             freshair_motor.plc_ao = 1
@@ -33,7 +33,7 @@ class FreshAirController(PanelController):
 
         fresh_air_flap = Motor(motors_config["fresh_air_flap"]["power"], usage="Fresh Air Flap")
         fresh_air_flap.current = self.calculate_motor_current(power=fresh_air_flap.power)
-        self.electrical_specs["fresh_air"]["motors"]["fresh_air_flap"]["motor"] = fresh_air_flap
+        self.add_motor("fresh_air", "fresh_air_flap", fresh_air_flap)
         if motors_config["fresh_air_flap"]["start_type"] == "Pneumatic":
             fresh_air_flap.mpcb_qty = 0
             fresh_air_flap.mccb_qty = 1
@@ -59,7 +59,7 @@ class FreshAirController(PanelController):
 
         emergency_flap = Motor(motors_config["emergency_flap"]["power"], usage="Emergency Flap")
         emergency_flap.current = self.calculate_motor_current(power=emergency_flap.power)
-        self.electrical_specs["fresh_air"]["motors"]["emergency_flap"]["motor"] = emergency_flap
+        self.add_motor("fresh_air", "emergency_flap", emergency_flap)
         if motors_config["fresh_air_flap"]["start_type"] == "Pneumatic":
             emergency_flap.mpcb_qty = 0
             emergency_flap.mccb_qty = 1
@@ -84,14 +84,7 @@ class FreshAirController(PanelController):
         motor_objects.append((emergency_flap, motors_config["emergency_flap"]["qty"]))
 
         # ----------------------- Add Components for Motors -----------------------
-        for motor, qty in motor_objects:
-            self.choose_contactor(motor, qty)
-        for motor, qty in motor_objects:
-            self.choose_mpcb(motor, qty)
-        for motor, qty in motor_objects:
-            self.choose_mccb(motor, qty)
-        for motor, qty in motor_objects:
-            self.choose_bimetal(motor, qty)
+        self.choose_motor_protection(motor_objects)
 
         # ----------------------- Calculate and add PLC I/O requirements -----------------------
         instruments = self.electrical_specs["fresh_air"]["instruments"]
@@ -5,8 +5,8 @@ from models.abs_motor import Motor
 class HopperHeaterController(PanelController):
     """Controller for hopper heater panel components."""
 
-    def __init__(self):
-        super().__init__("hopper_heater")
+    def __init__(self, electrical_specs=None, motors=None):
+        super().__init__("hopper_heater", electrical_specs, motors)
 
     def build_panel(self):
         """
@@ -27,15 +27,12 @@ class HopperHeaterController(PanelController):
                               selector_switch_qty=0,
                               signal_lamp_24v_qty=0)
         hopper_heater.current = self.calculate_motor_current(power=hopper_heater.power)
-        self.electrical_specs["hopper_heater"]["motors"]["elements"]["motor"] = hopper_heater
+        self.add_motor("hopper_heater", "elements", hopper_heater)
         motor_objects = [(hopper_heater, motors_config["elements"]["qty"])]
         motor_objects[0][0].temperature_meter = 2
 
         # ----------------------- Add Components for Motors -----------------------
-        for motor, qty in motor_objects:
-            self.choose_contactor(motor, qty)
-        for motor, qty in motor_objects:
-            self.choose_mccb(motor, qty)
+        self.choose_motor_protection(motor_objects, kinds=("Contactor", "MCCB"))
         # bi_metal???
 
         # ----------------------- Calculate and add PLC I/O requirements -----------------------
@@ -14,8 +14,8 @@ class InstallationController(PanelController):
     Specialized controller for bagfilter panel.
     """
 
-    def __init__(self):
-        super().__init__("installation")
+    def __init__(self, electrical_specs=None, motors=None):
+        super().__init__("installation", electrical_specs, motors)
 
     def build_panel(self):
         """
@@ -88,7 +88,7 @@ class InstallationController(PanelController):
         total_lcb_for_speed_qty = sum(motors_lcb.values())
         notes = "\n".join(f"{qty}x{motor}" for motor, qty in motors_lcb.items() if qty > 0)
 
-        success, lcb = get_electrical_panel_by_spec(type="Local Box")
+        success, lcb = self.lookup(get_electrical_panel_by_spec, type="Local Box")
         if success:
             self.add_to_panel(
                 type="Local Box",
@@ -97,6 +97,7 @@ class InstallationController(PanelController):
                 specifications=f"{lcb['width']}mm x {lcb['height']}mm x {lcb['depth']}mm",
                 quantity=total_lcb_for_speed_qty,
                 price=lcb['price'],
+                currency=lcb['currency'],
                 last_price_update=f"{lcb['supplier_name']}\n{lcb['date']}",
                 note=notes
             )
@@ -114,7 +115,7 @@ class InstallationController(PanelController):
 
     def choose_jb(self):
 
-        success, jb = get_electrical_panel_by_spec(type="Junction Box", width=200, height=200, depth=120)
+        success, jb = self.lookup(get_electrical_panel_by_spec, type="Junction Box", width=200, height=200, depth=120)
         if success:
             self.add_to_panel(
                 type="Junction Box",
@@ -123,6 +124,7 @@ class InstallationController(PanelController):
                 specifications=f"200mm x 200mm x 120mm",
                 quantity=self.total_motors_qty,
                 price=jb['price'],
+                currency=jb['currency'],
                 last_price_update=f"{jb['supplier_name']}\n{jb['date']}",
                 note=""
             )
@@ -144,7 +146,7 @@ class InstallationController(PanelController):
             return
 
         # choose gland for valves
-        success, gland = get_general_by_spec("Gland", specification="PG16")
+        success, gland = self.lookup(get_general_by_spec, "Gland", specification="PG16")
         if success:
             self.add_to_panel(
                 type="Gland",
@@ -153,6 +155,7 @@ class InstallationController(PanelController):
                 specifications="PG16",
                 quantity=self.n_valves * 2,
                 price=gland["price"],
+                currency=gland["currency"],
                 last_price_update=f"{gland.get('supplier_name', '')}\n{gland.get('date', '')}",
                 note=f"{self.n_valves} Valves"
             )
@@ -169,7 +172,7 @@ class InstallationController(PanelController):
             )
 
         # choose gland for airtank
-        success, gland = get_general_by_spec("Gland", specification="PG21")
+        success, gland = self.lookup(get_general_by_spec, "Gland", specification="PG21")
         if success:
             self.add_to_panel(
                 type="Gland",
@@ -178,6 +181,7 @@ class InstallationController(PanelController):
                 specifications="PG21",
                 quantity=self.n_airtank * 2,
                 price=gland["price"],
+                currency=gland["currency"],
                 last_price_update=f"{gland.get('supplier_name', '')}\n{gland.get('date', '')}",
                 note=f"{self.n_airtank} Air Tank"
             )
@@ -194,7 +198,7 @@ class InstallationController(PanelController):
             )
 
         # choose cable 3x1.5 for valves
-        success, cable = get_wire_cable_by_spec("Cable", 3, 1.5)
+        success, cable = self.lookup(get_wire_cable_by_spec, "Cable", 3, 1.5)
         if success:
             self.add_to_panel(
                 type="Valve Cable",
@@ -203,6 +207,7 @@ class InstallationController(PanelController):
                 specifications=f"{cable['l_number']}x{cable['l_size']}mm²",
                 quantity=self.n_valves * 2,
                 price=cable["price"],
+                currency=cable["currency"],
                 last_price_update=f"{cable.get('supplier_name', '')}\n{cable.get('date', '')}",
                 note=f"{self.n_valves} Valves"
             )
@@ -219,7 +224,7 @@ class InstallationController(PanelController):
             )
 
         # flexible conduit
-        success, conduit = get_wire_cable_by_spec("FlexibleConduit", 1)
+        success, conduit = self.lookup(get_wire_cable_by_spec, "FlexibleConduit", 1)
         if success:
             self.add_to_panel(
                 type="Flexible Conduit",
@@ -228,6 +233,7 @@ class InstallationController(PanelController):
                 specifications=f"{conduit['l_number']}x{conduit['l_size']}mm²",
                 quantity=self.n_valves * 2,
                 price=conduit["price"],
+                currency=conduit["currency"],
                 last_price_update=f"{conduit.get('supplier_name', '')}\n{conduit.get('date', '')}",
                 note=f"{self.n_valves} Valves"
             )
@@ -255,7 +261,7 @@ class InstallationController(PanelController):
             return
 
         # choose cable
-        success, cable = get_wire_cable_by_spec("Cable", 10, 1.5)
+        success, cable = self.lookup(get_wire_cable_by_spec, "Cable", 10, 1.5)
         if success:
             self.add_to_panel(
                 type="Signal Cable To Airtanks",
@@ -264,6 +270,7 @@ class InstallationController(PanelController):
                 specifications=f"{cable['l_number']}x{cable['l_size']}mm²",
                 quantity=total_length,
                 price=cable["price"],
+                currency=cable["currency"],
                 last_price_update=f"{cable.get('supplier_name', '')}\n{cable.get('date', '')}",
                 note=f"Structure: {width}m x {height}m x {depth}m\nC.C.R: {ccr}m"
             )
@@ -293,7 +300,7 @@ class InstallationController(PanelController):
         if total_length == 0:
             return
 
-        success, cable = get_wire_cable_by_spec("Cable", 7, 1.5, brand=None, note=None)
+        success, cable = self.lookup(get_wire_cable_by_spec, "Cable", 7, 1.5, brand=None, note=None)
         if success:
             self.add_to_panel(
                 type=f"Signal Cable To Motors",
@@ -302,6 +309,7 @@ class InstallationController(PanelController):
                 specifications="7x1.5mm²",
                 quantity=total_length,
                 price=cable['price'],
+                currency=cable['currency'],
                 last_price_update=f"{cable['supplier_name']}\n{cable['date']}",
                 note=f"For {self.total_motors_qty} Motors"
             )
@@ -333,12 +341,12 @@ class InstallationController(PanelController):
         correction_factor = 1.6 / (sqrt(3) * volt * COSNUS_PI * ETA)
 
         motor_objects = []
-        for section in self.electrical_specs.values():
+        for section_name, section in self.electrical_specs.items():
             motors = section.get("motors", {})
             for motor_name, motor_data in motors.items():
                 try:
                     qty = motor_data.get("qty", 0)
-                    motor = motor_data.get("motor", 0)
+                    motor = self.get_motor(section_name, motor_name)
                     motor_objects.append((motor, qty))
                 except Exception:
                     pass
@@ -362,7 +370,7 @@ class InstallationController(PanelController):
             if total_len == 0:
                 continue
 
-            success, cable = get_wire_cable_by_spec("Cable", 4, size_mm, brand=None, note=None)
+            success, cable = self.lookup(get_wire_cable_by_spec, "Cable", 4, size_mm, brand=None, note=None)
             if success:
                 self.add_to_panel(
                     type=f"Power Cable To Motors",
@@ -371,6 +379,7 @@ class InstallationController(PanelController):
                     specifications=f"4x{size_mm}mm²",
                     quantity=total_len,
                     price=cable['price'],
+                    currency=cable['currency'],
                     last_price_update=f"{cable['supplier_name']}\n{cable['date']}",
                     note="\n".join(data["notes"])
                 )
@@ -399,7 +408,7 @@ class InstallationController(PanelController):
             ladder_size = 400  # mm
 
         ladder_length = round(self.electrical_specs["installation"]["height"] * 1.5, 2)  # ~ ladder_cover_length
-        success, ladder = get_wire_cable_by_spec("Ladder", l_number=1, l_size=ladder_size)
+        success, ladder = self.lookup(get_wire_cable_by_spec, "Ladder", l_number=1, l_size=ladder_size)
         if success:
             self.add_to_panel(
                 type=f"Ladder",
@@ -408,6 +417,7 @@ class InstallationController(PanelController):
                 specifications=f"{ladder_size}mm²",
                 quantity=ladder_length,
                 price=ladder['price'],
+                currency=ladder['currency'],
                 last_price_update=f"{ladder['supplier_name']}\n{ladder['date']}",
                 note=f"For {self.n_airtank} Air Tanks")
 
@@ -424,7 +434,7 @@ class InstallationController(PanelController):
 
             print(ladder)
 
-        success, ladder_cover = get_wire_cable_by_spec("LadderCover", l_number=1, l_size=ladder_size)
+        success, ladder_cover = self.lookup(get_wire_cable_by_spec, "LadderCover", l_number=1, l_size=ladder_size)
         if success:
             self.add_to_panel(
                 type=f"Ladder Cover",
@@ -433,6 +443,7 @@ class InstallationController(PanelController):
                 specifications=f"{ladder_size}mm²",
                 quantity=ladder_length,
                 price=ladder_cover['price'],
+                currency=ladder_cover['currency'],
                 last_price_update=f"{ladder_cover['supplier_name']}\n{ladder_cover['date']}",
                 note=f"For {self.n_airtank} Air Tanks")
 
@@ -454,7 +465,7 @@ class InstallationController(PanelController):
         n_connectors = int(self.electrical_specs["installation"]["height"] * 1.5 / 2) * 2
         n_screw = n_connectors * 16
 
-        success, connector = get_general_by_spec(type="Ladder Connector")
+        success, connector = self.lookup(get_general_by_spec, type="Ladder Connector")
         if success:
             self.add_to_panel(
                 type=f"Ladder Connector",
@@ -463,6 +474,7 @@ class InstallationController(PanelController):
                 specifications="",
                 quantity=n_connectors,
                 price=connector['price'],
+                currency=connector['currency'],
                 last_price_update=f"{connector['supplier_name']}\n{connector['date']}",
                 note="")
         else:
@@ -476,7 +488,7 @@ class InstallationController(PanelController):
                 last_price_update="❌ Ladder Connector not found",
                 note=f"For {self.n_airtank} Air Tanks")
 
-        success, screw = get_general_by_spec(type="Ladder Screw")
+        success, screw = self.lookup(get_general_by_spec, type="Ladder Screw")
         if success:
             self.add_to_panel(
                 type=f"Ladder Screw",
@@ -485,6 +497,7 @@ class InstallationController(PanelController):
                 specifications="",
                 quantity=n_screw,
                 price=screw['price'],
+                currency=screw['currency'],
                 last_price_update=f"{screw['supplier_name']}\n{screw['date']}",
                 note=f"For {n_connectors} Ladder Connector")
         else:
@@ -503,7 +516,7 @@ class InstallationController(PanelController):
             return
 
         n_support_u     = round(self.electrical_specs["installation"]["height"] * 1.3 , 2)
-        success, support_u = get_general_by_spec(type="Support U", specification="8")
+        success, support_u = self.lookup(get_general_by_spec, type="Support U", specification="8")
         if success:
             self.add_to_panel(
                 type=f"Support U8",
@@ -512,6 +525,7 @@ class InstallationController(PanelController):
                 specifications="",
                 quantity=n_support_u,
                 price=support_u['price'],
+                currency=support_u['currency'],
                 last_price_update=f"{support_u['supplier_name']}\n{support_u['date']}",
                 note=f"For {self.electrical_specs['installation']['height']} Height")
         else:
@@ -526,7 +540,7 @@ class InstallationController(PanelController):
                 note=f"For {self.electrical_specs['installation']['height']} Height")
 
         n_support_l     = round(self.electrical_specs["installation"]["height"] * 0.6 , 2)
-        success, support_l = get_general_by_spec(type="Support L", specification="5")
+        success, support_l = self.lookup(get_general_by_spec, type="Support L", specification="5")
         if success:
             self.add_to_panel(
                 type=f"Support L5",
@@ -535,6 +549,7 @@ class InstallationController(PanelController):
                 specifications="",
                 quantity=n_support_l,
                 price=support_l['price'],
+                currency=support_l['currency'],
                 last_price_update=f"{support_l['supplier_name']}\n{support_l['date']}",
                 note=f"For Ladder_Height/1.5 x 0.6 Height")
         else:
@@ -550,7 +565,7 @@ class InstallationController(PanelController):
 
 
         n_support_screw = self.electrical_specs["installation"]["height"] * 8
-        success, support_screw = get_general_by_spec(type="Support Screw", specification="8")
+        success, support_screw = self.lookup(get_general_by_spec, type="Support Screw", specification="8")
         if success:
             self.add_to_panel(
                 type=f"Support Screw",
@@ -559,6 +574,7 @@ class InstallationController(PanelController):
                 specifications="",
                 quantity=n_support_screw,
                 price=support_screw['price'],
+                currency=support_screw['currency'],
                 last_price_update=f"{support_screw['supplier_name']}\n{support_screw['date']}",
                 note=f"For Ladder_Height/1.5 x 8")
         else:
@@ -573,7 +589,7 @@ class InstallationController(PanelController):
                 note=f"For Ladder_Height/1.5 x 8")
 
         n_riser = 2
-        success, riser = get_general_by_spec(type="Riser")
+        success, riser = self.lookup(get_general_by_spec, type="Riser")
         if success:
             self.add_to_panel(
                 type=f"Riser",
@@ -582,6 +598,7 @@ class InstallationController(PanelController):
                 specifications="",
                 quantity=n_riser,
                 price=riser['price'],
+                currency=riser['currency'],
                 last_price_update=f"{riser['supplier_name']}\n{riser['date']}",
                 note=f"According to ladder size")
         else:
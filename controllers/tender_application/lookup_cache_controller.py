@@ -0,0 +1,70 @@
+import inspect
+import threading
+from collections import defaultdict
+from concurrent.futures import Future
+
+from models.items.resolver import freeze_key
+
+
+class LookupCache:
+    """
+    Build-scoped memo of the models/items *_by_* lookups.
+
+    Calls are keyed by (function, arguments bound to the function's signature with
+    defaults applied, proj_avl), so get_wire_cable_by_spec("Wire", 1, 1.5) and
+    get_wire_cable_by_spec(type="Wire", l_number=1, l_size=1.5) share one entry.
+    One instance is shared by every controller of a build, across threads: the first
+    caller of a key runs the lookup, concurrent callers of the same key wait for it.
+    Results are shared, so callers must not modify them.
+    """
+
+    def __init__(self, proj_avl=()):
+        self.proj_avl = freeze_key(proj_avl)
+        self._results = {}
+        self._signatures = {}
+        self._lock = threading.Lock()
+        self._hits = defaultdict(int)
+        self._misses = defaultdict(int)
+
+    def lookup(self, function, *args, **kwargs):
+        key = (function, self._normalize(function, args, kwargs), self.proj_avl)
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if owner:
+                future = self._results[key] = Future()
+                self._misses[function.__name__] += 1
+            else:
+                self._hits[function.__name__] += 1
+
+        if owner:
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+        return future.result()
+
+    def stats(self):
+        """
+        Returns {"hits", "misses", "functions": {function name: (hits, misses)}}.
+        """
+        with self._lock:
+            names = sorted(set(self._hits) | set(self._misses))
+            return {
+                "hits": sum(self._hits.values()),
+                "misses": sum(self._misses.values()),
+                "functions": {name: (self._hits[name], self._misses[name]) for name in names},
+            }
+
+    def __repr__(self):
+        stats = self.stats()
+        return f"LookupCache(hits={stats['hits']}, misses={stats['misses']})"
+
+    def _normalize(self, function, args, kwargs):
+        signature = self._signatures.get(function)
+        if signature is None:
+            signature = self._signatures[function] = inspect.signature(function)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return freeze_key(bound.arguments)
+
@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from controllers.tender_application.bagfilter_controller import BagfilterController
+from controllers.tender_application.electric_motor_controller import ElectricMotorController
+from controllers.tender_application.fan_damper_controller import FanDamperController
+from controllers.tender_application.fresh_air_controller import FreshAirController
+from controllers.tender_application.hopper_heater_controller import HopperHeaterController
+from controllers.tender_application.lookup_cache_controller import LookupCache
+from controllers.tender_application.project_session_controller import ProjectSession, motors_in_specs
+from controllers.tender_application.spec_change_controller import SpecChangeTracker, affected_panels
+from controllers.tender_application.transport_controller import TransportController
+from controllers.tender_application.vibration_controller import VibrationController
+
+# panel name -> (controller, spec sections whose motor objects the controller creates)
+PANEL_CONTROLLERS = {
+    "bagfilter_panel": (BagfilterController, ()),
+    "fan_damper_panel": (FanDamperController, ("damper", "fan")),
+    "transport_panel": (TransportController, ("transport",)),
+    "fresh_air_panel": (FreshAirController, ("fresh_air",)),
+    "vibration_panel": (VibrationController, ("vibration",)),
+    "hopper_heater_panel": (HopperHeaterController, ("hopper_heater",)),
+}
+
+# spec section -> panel whose controller creates its motor objects
+SECTION_PANELS = {section: name for name, (_, sections) in PANEL_CONTROLLERS.items() for section in sections}
+
+MAX_WORKERS = len(PANEL_CONTROLLERS) + 1  # + electric motor price
+
+
+def build_panels(electrical_specs=None, motors=None, with_electric_motor=False, lookup_cache=None, names=None):
+    """
+    Builds the result panels concurrently and returns ({panel name: panel},
+    {(section, motor name): Motor built}, electric motor price or None).
+
+    electrical_specs is a read-only snapshot (freeze_specs), by default the open project's;
+    every controller reads the same snapshot and nothing is written to it, so builds of
+    several projects can run at once. motors are the Motor objects of an earlier build that
+    panels spanning sections read (default: the ones stored in the specs). names limits the
+    build to some of the panels (default: all of them). Lookups go through the shared
+    catalog cache or a pooled session per call, memoized for the whole build in lookup_cache
+    (a new LookupCache by default).
+    """
+    if electrical_specs is None:
+        electrical_specs = ProjectSession().snapshot()
+    if motors is None:
+        motors = motors_in_specs(electrical_specs)
+    if lookup_cache is None:
+        lookup_cache = LookupCache(electrical_specs["project_info"]["proj_avl"])
+    if names is None:
+        names = PANEL_CONTROLLERS.keys()
+
+    controllers = {}
+    for name in names:
+        controller_class, _ = PANEL_CONTROLLERS[name]
+        controller = controller_class(electrical_specs, motors)
+        controller.lookup_cache = lookup_cache
+        controllers[name] = controller
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="panel-build") as pool:
+        futures = {name: pool.submit(controller.build_panel) for name, controller in controllers.items()}
+        motor_future = None
+        if with_electric_motor:
+            motor_controller = ElectricMotorController(electrical_specs)
+            motor_controller.lookup_cache = lookup_cache
+            motor_future = pool.submit(motor_controller.calculate_price)
+
+        # result() re-raises a controller's exception here, as the sequential build did
+        panels = {name: future.result() for name, future in futures.items()}
+        electric_motor_price = motor_future.result() if motor_future else None
+
+    built_motors = {}
+    for controller in controllers.values():
+        built_motors.update(controller.built_motors)
+    return panels, built_motors, electric_motor_price
+
+
+def store_motors(electrical_specs, built_motors):
+    """
+    Stores the Motor objects of a build in the open project's specs, where the installation
+    panel and the next bagfilter build read them. A motor that came out different is marked
+    in SpecChangeTracker, so the other panels reading it are rebuilt.
+    """
+    tracker = SpecChangeTracker()
+    for (section, motor_name), motor in built_motors.items():
+        motor_data = electrical_specs[section]["motors"][motor_name]
+        if not _same_motor(motor_data.get("motor"), motor):
+            readers = affected_panels([section, "motors", motor_name, "motor"])
+            tracker.mark_panels_dirty(readers - {SECTION_PANELS[section]})
+        motor_data["motor"] = motor
+
+
+def _same_motor(a, b):
+    return getattr(a, "__dict__", a) == getattr(b, "__dict__", b)
@@ -1,7 +1,9 @@
 from math import sqrt
 from collections import defaultdict
 from config import COSNUS_PI, ETA
-from controllers.tender_application.project_session_controller import ProjectSession
+from controllers.tender_application.lookup_cache_controller import LookupCache
+from controllers.tender_application.project_session_controller import ProjectSession, motors_in_specs
+from models.bom import BOM
 from models.items.bimetal import get_bimetal_by_current
 from models.items.contactor import get_contactor_by_current
 from models.items.electrical_panel import get_electrical_panel_by_spec
@@ -9,6 +11,7 @@ from models.items.general import get_general_by_spec
 from models.items.instrument import get_instrument_by_spec
 from models.items.mccb import get_mccb_by_current
 from models.items.mpcb import get_mpcb_by_current
+from models.items.resolver import resolve_specs
 from models.items.vfd_softstarter import get_vfd_softstarter_by_power
 from models.items.wire_cable import get_wire_cable_by_spec
 
@@ -18,51 +21,93 @@ class PanelController:
     Base controller class for building electrical panels from tender_application specifications.
     """
 
-    def __init__(self, panel_type):
+    def __init__(self, panel_type, electrical_specs=None, motors=None):
         """
         Initialize the panel controller with a specific panel type.
+
+        electrical_specs is a read-only snapshot (freeze_specs) of the project to price, by
+        default the open project's; motors maps (section, motor name) to the Motor objects
+        built by other panels, by default the ones stored in the specs. The controller never
+        writes either: the motors it builds go to self.built_motors.
         """
         self.panel_type = panel_type
         self.panel = self._create_empty_panel()
-        self.electrical_specs = ProjectSession().project_electrical_specs
+        if electrical_specs is None:
+            electrical_specs = ProjectSession().snapshot()
+        self.electrical_specs = electrical_specs
+        self.motors = motors if motors is not None else motors_in_specs(electrical_specs)
+        self.built_motors = {}
+        # replaced by one shared cache when several controllers make up a build
+        self.lookup_cache = LookupCache(self.electrical_specs["project_info"]["proj_avl"])
 
     def _create_empty_panel(self):
         """
-        Initializes and returns an empty panel dictionary to collect all components.
-        """
-        return {
-            "type": [],
-            "brand": [],
-            "order_number": [],
-            "specifications": [],
-            "quantity": [],
-            "price": [],
-            "total_price": [],
-            "last_price_update": [],
-            "note": []
-        }
+        Initializes and returns an empty columnar BOM to collect all components.
+        """
+        return BOM()
+
+    def add_motor(self, section, motor_name, motor):
+        """
+        Records a Motor built for one of the project's motors.
+        """
+        self.built_motors[(section, motor_name)] = motor
+
+    def get_motor(self, section, motor_name):
+        """
+        Returns the Motor of one of the project's motors: built by this panel, else given.
+        """
+        return self.built_motors.get((section, motor_name), self.motors.get((section, motor_name)))
+
+    def lookup(self, function, *args, **kwargs):
+        """
+        Runs a models/items lookup through the build's lookup cache.
+        """
+        return self.lookup_cache.lookup(function, *args, **kwargs)
 
     def add_to_panel(self, *, type, brand="", order_number="", specifications="",
-                     quantity=0, price=0, last_price_update="", note=""):
+                     quantity=0, price=0, currency="", last_price_update="", note=""):
         """
-        Adds a new entry to the panel dictionary.
+        Adds a new row to the panel BOM.
         All parameters must be passed by keyword for clarity.
+        Prices stay in the supplier's currency (blank = BASE_CURRENCY); totals are
+        normalized per panel with models.exchange_rate.convert_currency.
         """
-        total_price = quantity * price
-
-        self.panel["type"].append(type)
-        self.panel["brand"].append(brand)
-        self.panel["specifications"].append(specifications)
-        self.panel["quantity"].append(quantity)
-        self.panel["price"].append(price)
-        self.panel["total_price"].append(total_price)
-        self.panel["last_price_update"].append(last_price_update)
-        self.panel["note"].append(note)
-        self.panel["order_number"].append(order_number)
+        self.panel.append(type=type, brand=brand, order_number=order_number, specifications=specifications,
+                          quantity=quantity, price=price, total_price=quantity * price, currency=currency,
+                          last_price_update=last_price_update, note=note)
 
     """ ------------------------------------- Contactor/MPCB/MCCB/BiMetal ------------------------------------- """
 
-    def choose_contactor(self, motor, qty):
+    def choose_motor_protection(self, motor_objects, kinds=("Contactor", "MPCB", "MCCB", "Bimetal")):
+        """
+        Adds contactor/MPCB/MCCB/bimetal entries for all motors, resolved in one catalog pass.
+        Rows are added kind by kind, in the same order as calling each choose_* per motor.
+        """
+        choosers = {
+            "Contactor": self.choose_contactor,
+            "MPCB": self.choose_mpcb,
+            "MCCB": self.choose_mccb,
+            "Bimetal": self.choose_bimetal,
+        }
+        # the motors each choose_* skips
+        quantities = {"Contactor": "contactor_qty", "MPCB": "mpcb_qty", "MCCB": "mccb_qty", "Bimetal": "bimetal_qty"}
+        needed = [
+            (kind, [(motor, qty) for motor, qty in motor_objects
+                    if qty != 0 and motor.current != 0 and getattr(motor, quantities[kind]) != 0])
+            for kind in kinds
+        ]
+
+        brands = self.electrical_specs["project_info"]["proj_avl"]
+        results = iter(resolve_specs((
+            (kind, {"rated_current": motor.current, "brands": brands})
+            for kind, motors in needed
+            for motor, _ in motors
+        ), cache=self.lookup_cache))
+        for kind, motors in needed:
+            for motor, qty in motors:
+                choosers[kind](motor, qty, resolved=next(results))
+
+    def choose_contactor(self, motor, qty, resolved=None):
         """
         Adds a contactor entry to the panel based on motor current specifications.
         """
@@ -70,8 +115,11 @@ class PanelController:
             return
         total_qty = qty * motor.contactor_qty
 
-        success, contactor = get_contactor_by_current(rated_current=motor.current,
-                                                      brands=self.electrical_specs["project_info"]["proj_avl"])
+        if resolved:
+            success, contactor = resolved
+        else:
+            success, contactor = self.lookup(get_contactor_by_current, rated_current=motor.current,
+                                             brands=self.electrical_specs["project_info"]["proj_avl"])
         if success:
             self.add_to_panel(
                 type=f"Comector",
@@ -80,6 +128,7 @@ class PanelController:
                 specifications=f"Current: {contactor['rated_current']}A",
                 quantity=total_qty,
                 price=contactor['price'],
+                currency=contactor['currency'],
                 last_price_update=f"{contactor['supplier_name']}\n{contactor['date']}",
                 note=f"{total_qty} x Motor Current: {motor.current}A {motor.usage}"
             )
@@ -96,7 +145,7 @@ class PanelController:
             )
             print(contactor)
 
-    def choose_mpcb(self, motor, qty):
+    def choose_mpcb(self, motor, qty, resolved=None):
         """
         Adds an MPCB entry to the panel based on motor current specifications.
         """
@@ -104,8 +153,11 @@ class PanelController:
             return
         total_qty = qty * motor.mpcb_qty
 
-        success, mpcb = get_mpcb_by_current(rated_current=motor.current,
-                                            brands=self.electrical_specs["project_info"]["proj_avl"])
+        if resolved:
+            success, mpcb = resolved
+        else:
+            success, mpcb = self.lookup(get_mpcb_by_current, rated_current=motor.current,
+                                        brands=self.electrical_specs["project_info"]["proj_avl"])
         if success:
             self.add_to_panel(
                 type=f"MPCB",
@@ -115,6 +167,7 @@ class PanelController:
                                f"Breaking Capacity: {mpcb['breaking_capacity']}, Trip Class: {mpcb['trip_class']}",
                 quantity=total_qty,
                 price=mpcb['price'],
+                currency=mpcb['currency'],
                 last_price_update=f"{mpcb['supplier_name']}\n{mpcb['date']}",
                 note=f"{total_qty} x Motor Current: {motor.current}A {motor.usage}"
             )
@@ -131,7 +184,7 @@ class PanelController:
             )
             print(mpcb)
 
-    def choose_mccb(self, motor, qty):
+    def choose_mccb(self, motor, qty, resolved=None):
         """
         Adds an MCCB entry to the panel based on motor current specifications.
         """
@@ -139,8 +192,11 @@ class PanelController:
             return
         total_qty = qty * motor.mccb_qty
 
-        success, mccb = get_mccb_by_current(rated_current=motor.current,
-                                            brands=self.electrical_specs["project_info"]["proj_avl"])
+        if resolved:
+            success, mccb = resolved
+        else:
+            success, mccb = self.lookup(get_mccb_by_current, rated_current=motor.current,
+                                        brands=self.electrical_specs["project_info"]["proj_avl"])
         if success:
             self.add_to_panel(
                 type=f"MCCB",
@@ -149,6 +205,7 @@ class PanelController:
                 specifications=f"Current: {mccb['rated_current']}A\nBreaking Capacity:{mccb['breaking_capacity']}KA",
                 quantity=total_qty,
                 price=mccb['price'],
+                currency=mccb['currency'],
                 last_price_update=f"{mccb['supplier_name']}\n{mccb['date']}",
                 note=f"{total_qty} x Motor Current: {motor.current}A {motor.usage}"
             )
@@ -165,7 +222,7 @@ class PanelController:
             )
             print(mccb)
 
-    def choose_bimetal(self, motor, qty):
+    def choose_bimetal(self, motor, qty, resolved=None):
         """
         Adds a bimetal entry to the panel based on motor current specifications.
         """
@@ -173,8 +230,11 @@ class PanelController:
             return
         total_qty = qty * motor.bimetal_qty
 
-        success, bimetal = get_bimetal_by_current(rated_current=motor.current,
-                                                  brands=self.electrical_specs["project_info"]["proj_avl"])
+        if resolved:
+            success, bimetal = resolved
+        else:
+            success, bimetal = self.lookup(get_bimetal_by_current, rated_current=motor.current,
+                                           brands=self.electrical_specs["project_info"]["proj_avl"])
 
         if success:
             self.add_to_panel(
@@ -186,6 +246,7 @@ class PanelController:
                     f"Trip Time: {bimetal['trip_time']} sec"),
                 quantity=total_qty,
                 price=bimetal['price'],
+                currency=bimetal['currency'],
                 last_price_update=f"{bimetal['supplier_name']}\n{bimetal['date']}",
                 note=f"{total_qty} x Motor Current: {motor.current}A {motor.usage}"
             )
@@ -209,8 +270,8 @@ class PanelController:
         if total_qty == 0:
             return
 
-        success, vfd = get_vfd_softstarter_by_power(type="VFD", power=motor.power,
-                                                    brands=self.electrical_specs["project_info"]["proj_avl"])
+        success, vfd = self.lookup(get_vfd_softstarter_by_power, type="VFD", power=motor.power,
+                                   brands=self.electrical_specs["project_info"]["proj_avl"])
 
         if success:
             if success:
@@ -221,6 +282,7 @@ class PanelController:
                     specifications=f"Power: {vfd['power']}",
                     quantity=total_qty,
                     price=vfd['price'],
+                    currency=vfd['currency'],
                     last_price_update=f"{vfd['supplier_name']}\n{vfd['date']}",
                     note=f"{total_qty} x Motor Current: {motor.current}A {motor.usage}"
                 )
@@ -244,8 +306,8 @@ class PanelController:
         if total_qty == 0:
             return
 
-        success, soft_starter = get_vfd_softstarter_by_power(type="SoftStarter", power=motor.power,
-                                                             brands=self.electrical_specs["project_info"]["proj_avl"])
+        success, soft_starter = self.lookup(get_vfd_softstarter_by_power, type="SoftStarter", power=motor.power,
+                                            brands=self.electrical_specs["project_info"]["proj_avl"])
         if success:
             if success:
                 self.add_to_panel(
@@ -255,6 +317,7 @@ class PanelController:
                     specifications=f"Power: {soft_starter['power']}",
                     quantity=total_qty,
                     price=soft_starter['price'],
+                    currency=soft_starter['currency'],
                     last_price_update=f"{soft_starter['supplier_name']}\n{soft_starter['date']}",
                     note=f"{total_qty} x Motor Current: {motor.current}A {motor.usage}"
                 )
@@ -273,8 +336,8 @@ class PanelController:
 
     """ ------------------------------------- Generals ------------------------------------- """
 
-    def process_item(self, motor_objects, attr_name, comp_type, specification=""):
-        success, item = get_general_by_spec(comp_type, specification)
+    def process_item(self, motor_objects, attr_name, comp_type, specification="", resolved=None):
+        success, item = resolved if resolved else self.lookup(get_general_by_spec, comp_type, specification)
 
         total_qty = 0
         notes = []
@@ -293,6 +356,7 @@ class PanelController:
                     specifications=item.get("specification", ""),
                     quantity=round(total_qty, 2),
                     price=item.get("price", 0),
+                    currency=item.get("currency", ""),
                     last_price_update=f"{item.get('supplier_name', '')}\n{item.get('date', '')}",
                     note="\n".join(notes)
                 )
@@ -312,31 +376,37 @@ class PanelController:
         """
         Adds general accessories like terminals, buttons, etc. based on motor needs.
         """
-
-        self.process_item(motor_objects=motor_objects, attr_name="terminal_4_qty", comp_type="Terminal",
-                          specification="4")
-        self.process_item(motor_objects=motor_objects, attr_name="terminal_6_qty", comp_type="Terminal",
-                          specification="6")
-        self.process_item(motor_objects=motor_objects, attr_name="contactor_aux_contact_qty",
-                          comp_type="Contactor Aux Contact")
-        self.process_item(motor_objects=motor_objects, attr_name="mpcb_mccb_aux_contact_qty",
-                          comp_type="MCCB Aux Contact")
-        self.process_item(motor_objects=motor_objects, attr_name="mpcb_mccb_aux_contact_qty",
-                          comp_type="MPCB Aux Contact")
-        self.process_item(motor_objects=motor_objects, attr_name="relay_1no_1nc_qty", comp_type="Relay",
-                          specification="1")
-        self.process_item(motor_objects=motor_objects, attr_name="relay_2no_2nc_qty", comp_type="Relay",
-                          specification="2")
-        self.process_item(motor_objects=motor_objects, attr_name="button_qty", comp_type="Button")
-        self.process_item(motor_objects=motor_objects, attr_name="selector_switch_qty", comp_type="Selector Switch")
+        # (motor attribute, general type, specification)
+        general_items = [
+            ("terminal_4_qty", "Terminal", "4"),
+            ("terminal_6_qty", "Terminal", "6"),
+            ("contactor_aux_contact_qty", "Contactor Aux Contact", ""),
+            ("mpcb_mccb_aux_contact_qty", "MCCB Aux Contact", ""),
+            ("mpcb_mccb_aux_contact_qty", "MPCB Aux Contact", ""),
+            ("relay_1no_1nc_qty", "Relay", "1"),
+            ("relay_2no_2nc_qty", "Relay", "2"),
+            ("button_qty", "Button", ""),
+            ("selector_switch_qty", "Selector Switch", ""),
+        ]
+        signal_lamp = ("signal_lamp_24v_qty", "Signal Lamp", "24")
+
+        results = resolve_specs((
+            ("General", {"type": comp_type, "specification": specification})
+            for _, comp_type, specification in general_items + [signal_lamp]
+        ), cache=self.lookup_cache)
+
+        for (attr_name, comp_type, specification), resolved in zip(general_items, results):
+            self.process_item(motor_objects=motor_objects, attr_name=attr_name, comp_type=comp_type,
+                              specification=specification, resolved=resolved)
 
         self.choose_duct_cover(motor_objects)
         self.choose_miniatory_rail(motor_objects)
 
         has_hmi = True if self.electrical_specs["bagfilter"]["touch_panel"] else False
         if not has_hmi:
-            self.process_item(motor_objects=motor_objects, attr_name="signal_lamp_24v_qty", comp_type="Signal Lamp",
-                              specification="24")
+            attr_name, comp_type, specification = signal_lamp
+            self.process_item(motor_objects=motor_objects, attr_name=attr_name, comp_type=comp_type,
+                              specification=specification, resolved=results[-1])
 
     def choose_electrical_panel(self, total_motors):
         """
@@ -357,8 +427,8 @@ class PanelController:
             width, height, depth = 120, 200, 30
             qty = 2
 
-        success, electrical_panel = get_electrical_panel_by_spec(type="Electrical Panel", width=width, height=height,
-                                                                 depth=depth)
+        success, electrical_panel = self.lookup(get_electrical_panel_by_spec, type="Electrical Panel",
+                                                width=width, height=height, depth=depth)
         if success:
             self.add_to_panel(
                 type="Electrical Panel",
@@ -367,6 +437,7 @@ class PanelController:
                 specifications=f"{width}mm x {height}mm x {depth}mm",
                 quantity=qty,
                 price=electrical_panel.get("price", 0),
+                currency=electrical_panel.get("currency", ""),
                 last_price_update=f"{electrical_panel.get('supplier_name', '')}\n{electrical_panel.get('date', '')}",
                 note=f"total motors: {total_motors}"
             )
@@ -400,7 +471,7 @@ class PanelController:
                 else instrument_name
             name = "vibration_transmitter" if name == "bearing_vibration_transmitter" else name
 
-            success, instrument = get_instrument_by_spec(name.replace('_', ' ').title())
+            success, instrument = self.lookup(get_instrument_by_spec, name.replace('_', ' ').title())
 
             if success:
                 self.add_to_panel(
@@ -410,6 +481,7 @@ class PanelController:
                     specifications="",
                     quantity=qty,
                     price=instrument["price"],
+                    currency=instrument["currency"],
                     last_price_update=f"{instrument['supplier_name']}\n{instrument['date']}",
                 )
             else:
@@ -437,7 +509,7 @@ class PanelController:
             if manifold_qty > 0 and manifold_ways:
                 formatted_name = f"{manifold_ways} WAYS MANIFOLD"
 
-                success, manifold_obj = get_instrument_by_spec(type=manifold_ways)
+                success, manifold_obj = self.lookup(get_instrument_by_spec, type=manifold_ways)
                 if success:
                     self.add_to_panel(
                         type=formatted_name,
@@ -445,6 +517,7 @@ class PanelController:
                         order_number=manifold_obj['order_number'],
                         quantity=qty,
                         price=manifold_obj['price'],
+                        currency=manifold_obj['currency'],
                         last_price_update=f"{manifold_obj['supplier_name']}\n{manifold_obj['date']}",
                         note=f"manifold for {instrument_name.replace('_', ' ').title()}")
                 else:
@@ -460,13 +533,14 @@ class PanelController:
 
             # ------------ Calibration ------------
             if "transmitter" in name and qty != 0:
-                success, calibration = get_instrument_by_spec(type="Calibration")
+                success, calibration = self.lookup(get_instrument_by_spec, type="Calibration")
                 if success:
                     self.add_to_panel(
                         type="CALIBRATION",
                         brand=calibration['brand'],
                         quantity=qty,
                         price=calibration['price'],
+                        currency=calibration['currency'],
                         last_price_update=f"{calibration['supplier_name']}\n{calibration['date']}",
                         note=f"calibration for {instrument_name.replace('_', ' ').title()}"
                     )
@@ -511,15 +585,24 @@ class PanelController:
         if instruments:
             total_di, total_ai = self.calculate_instruments_io(instruments, total_di, total_ai, di_notes, ai_notes)
 
+        # Cards and front connector resolved together
+        di_card, do_card, ai_card, ao_card, front_connector = resolve_specs([
+            ("General", {"type": "DI Module", "specification": "16"}),
+            ("General", {"type": "DO Module", "specification": "16"}),
+            ("General", {"type": "AI Module", "specification": "16"}),
+            ("General", {"type": "AO Module", "specification": "16"}),
+            ("General", {"type": "Front Connector", "specification": "20"}),
+        ], cache=self.lookup_cache)
+
         # Cards calculation
-        di_cards = self.calculate_and_add_io("DI", total_di, di_notes)
-        do_cards = self.calculate_and_add_io("DO", total_do, do_notes)
-        ai_cards = self.calculate_and_add_io("AI", total_ai, ai_notes)
-        ao_cards = self.calculate_and_add_io("AO", total_ao, ao_notes)
+        di_cards = self.calculate_and_add_io("DI", total_di, di_notes, resolved=di_card)
+        do_cards = self.calculate_and_add_io("DO", total_do, do_notes, resolved=do_card)
+        ai_cards = self.calculate_and_add_io("AI", total_ai, ai_notes, resolved=ai_card)
+        ao_cards = self.calculate_and_add_io("AO", total_ao, ao_notes, resolved=ao_card)
 
         total_20pin = di_cards + do_cards + ai_cards + ao_cards
         if total_20pin > 0:
-            success, pin_card = get_general_by_spec(type="Front Connector", specification="20")
+            success, pin_card = front_connector
             if success:
                 self.add_to_panel(
                     type=f"Front Connector 20Pins",
@@ -527,6 +610,7 @@ class PanelController:
                     order_number=pin_card["order_number"],
                     quantity=total_20pin,
                     price=pin_card['price'],
+                    currency=pin_card['currency'],
                     last_price_update=f"{pin_card['supplier_name']}\n{pin_card['date']}",
                     note="Total connectors for all 16CH cards"
                 )
@@ -542,28 +626,32 @@ class PanelController:
                     note="Total connectors for all 16CH cards"
                 )
 
-    def calculate_and_add_io(self, io_type, total, notes):
+    def calculate_and_add_io(self, io_type, total, notes, resolved=None):
         if total <= 0:
             return 0
 
         cards = max(1, (total + 15) // 16)  # 16-channel cards
-        if io_type == "DI":
-            success, card = get_general_by_spec(type="DI Module", specification="16")
+        if resolved:
+            success, card = resolved
+        elif io_type == "DI":
+            success, card = self.lookup(get_general_by_spec, type="DI Module", specification="16")
         elif io_type == "DO":
-            success, card = get_general_by_spec(type="DO Module", specification="16")
+            success, card = self.lookup(get_general_by_spec, type="DO Module", specification="16")
         elif io_type == "AI":
-            success, card = get_general_by_spec(type="AI Module", specification="16")
+            success, card = self.lookup(get_general_by_spec, type="AI Module", specification="16")
         elif io_type == "AO":
-            success, card = get_general_by_spec(type="AO Module", specification="16")
+            success, card = self.lookup(get_general_by_spec, type="AO Module", specification="16")
 
         if success:
             price = card["price"] or 0
             effective_date = f"{card['supplier_name']}\n{card['date']}" or "Not Found"
             brand = card["brand"]
+            currency = card["currency"]
         else:
             price = 0
             effective_date = f"❌ Channel card not found"
             brand = ""
+            currency = ""
 
         self.add_to_panel(
             type=f"{io_type} 16 Channel",
@@ -571,6 +659,7 @@ class PanelController:
             specifications=f"Total: {total}",
             quantity=cards,
             price=price,
+            currency=currency,
             last_price_update=effective_date,
             note="\n".join(notes)
         )
@@ -628,7 +717,7 @@ class PanelController:
 
 
         if rail_length > 0:
-            success, rail = get_wire_cable_by_spec("MiniatoryRail", 1)
+            success, rail = self.lookup(get_wire_cable_by_spec, "MiniatoryRail", 1)
             if success:
                 self.add_to_panel(
                     type="Miniatory Rail",
@@ -637,6 +726,7 @@ class PanelController:
                     specifications=rail["note"],
                     quantity=rail_length,
                     price=rail['price'],
+                    currency=rail['currency'],
                     last_price_update=f"{rail['supplier_name']}\n{rail['date']}",
                     note="\n".join(rail_notes)
                 )
@@ -665,7 +755,7 @@ class PanelController:
 
 
         if duct_length > 0:
-            success, duct = get_wire_cable_by_spec("DuctCover", 1)
+            success, duct = self.lookup(get_wire_cable_by_spec, "DuctCover", 1)
             if success:
                 self.add_to_panel(
                     type="Duct & Cover",
@@ -674,6 +764,7 @@ class PanelController:
                     specifications=duct["note"],
                     quantity=duct_length,
                     price=duct['price'],
+                    currency=duct['currency'],
                     last_price_update=f"{duct['supplier_name']}\n{duct['date']}",
                     note="\n".join(duct_notes)
                 )
@@ -713,7 +804,7 @@ class PanelController:
                     busbar_notes.append(f"{motor_busbar_length} m for {motor.usage}")
 
         if wire_length > 0:
-            success, cable = get_wire_cable_by_spec("Wire", 1, 1.6, brand=None, note=None)
+            success, cable = self.lookup(get_wire_cable_by_spec, "Wire", 1, 1.6, brand=None, note=None)
             if success:
                 self.add_to_panel(
                     type="Internal Power Panel Wire",
@@ -722,6 +813,7 @@ class PanelController:
                     specifications="Size: 1x1.6 mm²",
                     quantity=wire_length,
                     price=cable['price'],
+                    currency=cable['currency'],
                     last_price_update=f"{cable['supplier_name']}\n{cable['date']}",
                     note="\n".join(wire_notes)
                 )
@@ -740,7 +832,7 @@ class PanelController:
 
         if busbar_length > 0:
 
-            success, cable = get_wire_cable_by_spec("Busbar", 1)
+            success, cable = self.lookup(get_wire_cable_by_spec, "Busbar", 1)
             if success:
                 self.add_to_panel(
                     type="Internal Power Busbar",
@@ -749,6 +841,7 @@ class PanelController:
                     specifications="For motors > 45kW",
                     quantity=busbar_length,
                     price=cable['price'],
+                    currency=cable['currency'],
                     last_price_update=f"{cable['supplier_name']}\n{cable['date']}",
                     note="\n".join(busbar_notes))
             else:
@@ -782,7 +875,7 @@ class PanelController:
         if total_length == 0:
             return
 
-        success, cable = get_wire_cable_by_spec("Wire", 1, 1.5, brand=None, note=None)
+        success, cable = self.lookup(get_wire_cable_by_spec, "Wire", 1, 1.5, brand=None, note=None)
         if success:
             self.add_to_panel(
                 type=f"Internal Signal Panel Wire",
@@ -791,6 +884,7 @@ class PanelController:
                 specifications="Size: 1x1.5 mm²",
                 quantity=total_length,
                 price=cable['price'],
+                currency=cable['currency'],
                 last_price_update=f"{cable['supplier_name']}\n{cable['date']}",
                 note="\n".join(notes)
             )
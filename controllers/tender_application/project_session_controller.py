@@ -1,3 +1,6 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from models.abs_motor import Motor
 
 
@@ -155,3 +158,32 @@ class ProjectSession:
                                                       },
                                                       }
         return cls._instance
+
+    def snapshot(self):
+        """
+        Returns a read-only copy of project_electrical_specs for the pricing controllers.
+        """
+        return freeze_specs(self.project_electrical_specs)
+
+
+def freeze_specs(value):
+    """
+    Returns a read-only deep copy of electrical specs: dicts become MappingProxyType and
+    lists tuples; the copy no longer follows later edits of value.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_specs(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_specs(item) for item in value)
+    return value
+
+
+def motors_in_specs(electrical_specs):
+    """
+    Returns {(section, motor name): motor object} stored in the specs' "motor" entries.
+    """
+    return {
+        (section_name, motor_name): motor_data.get("motor")
+        for section_name, section in electrical_specs.items() if isinstance(section, Mapping)
+        for motor_name, motor_data in section.get("motors", {}).items()
+    }
@@ -0,0 +1,100 @@
+import threading
+
+from models.catalog_version import get_catalog_versions
+from utils.database import SessionLocal
+
+ANY_SECTION = "*"
+
+# result -> electrical_specs key paths it reads; a change at, above or below one of them affects it
+PANEL_DEPENDENCIES = {
+    "bagfilter_panel": (("project_info",), ("bagfilter",), (ANY_SECTION, "motors")),
+    "fan_damper_panel": (("project_info",), ("fan",), ("damper",)),
+    "transport_panel": (("project_info",), ("transport",)),
+    "fresh_air_panel": (("project_info",), ("fresh_air",)),
+    "vibration_panel": (("project_info",), ("vibration",)),
+    "hopper_heater_panel": (("project_info",), ("hopper_heater",)),
+    "installation_panel": (("project_info",), ("bagfilter",), ("installation",), (ANY_SECTION, "motors")),
+    "electric_motor": (("project_info",), ("fan",)),
+}
+
+
+def affected_panels(path_list):
+    """
+    Returns the names in PANEL_DEPENDENCIES whose result depends on the value at path_list.
+    """
+    path = tuple(path_list)
+    return {
+        name for name, dependencies in PANEL_DEPENDENCIES.items()
+        if any(_overlaps(path, dependency) for dependency in dependencies)
+    }
+
+
+def _overlaps(path, dependency):
+    # one path is a prefix of the other
+    return all(key == dep or dep == ANY_SECTION for key, dep in zip(path, dependency))
+
+
+class SpecChangeTracker:
+    """
+    Singleton that remembers which results are out of date since they were last built.
+
+    The tabs mark every electrical_specs path they write with mark_dirty(); the result
+    and installation tabs take_dirty() the results they show and rebuild only those,
+    keeping the others. Everything starts dirty, and a change of the component catalog
+    (catalog_version) makes everything dirty again.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SpecChangeTracker, cls).__new__(cls)
+            cls._instance._lock = threading.Lock()
+            cls._instance._dirty = set(PANEL_DEPENDENCIES)
+            cls._instance._catalog_versions = None
+        return cls._instance
+
+    def mark_dirty(self, path_list):
+        with self._lock:
+            self._dirty |= affected_panels(path_list)
+
+    def mark_panels_dirty(self, names):
+        with self._lock:
+            self._dirty |= set(names)
+
+    def mark_all_dirty(self):
+        with self._lock:
+            self._dirty = set(PANEL_DEPENDENCIES)
+
+    def is_dirty(self, name):
+        with self._lock:
+            return name in self._dirty
+
+    def catalog_versions(self):
+        """The catalog versions seen by the last take_dirty(), None when unknown."""
+        with self._lock:
+            return self._catalog_versions
+
+    def take_dirty(self, names):
+        """
+        Returns the dirty names among names and marks them clean; call it right before
+        rebuilding them.
+        """
+        self._check_catalog()
+        with self._lock:
+            dirty = self._dirty & set(names)
+            self._dirty -= dirty
+            return dirty
+
+    def _check_catalog(self):
+        session = SessionLocal()
+        try:
+            versions = get_catalog_versions(session)
+        except Exception:
+            versions = None  # unknown, rebuild
+        finally:
+            session.close()
+
+        with self._lock:
+            if versions is None or versions != self._catalog_versions:
+                self._dirty = set(PANEL_DEPENDENCIES)
+            self._catalog_versions = versions
@@ -0,0 +1,237 @@
+"""
+What-if sweeps: prices one project for every combination of a grid of spec overrides.
+
+The grid maps key paths of project_electrical_specs ("fan.motors.fan.power" or a tuple of keys)
+to the values to try, e.g. fan powers, motor qty or start_type, proj_avl brand lists or l_voltage.
+Each result (PANEL_DEPENDENCIES) is built once per combination of the axes it depends on, so a
+fan power axis rebuilds only the fan/damper, bagfilter and installation panels and the electric
+motor. Its prices form an array with length-1 dimensions along the other axes, and the price
+matrix is the NumPy broadcast sum of those arrays. All builds with the same brand list share one
+LookupCache.
+
+The whole catalog is loaded before the sweep, and the sweep runs again when catalog_version
+changed while it ran (a price saved meanwhile), so one matrix never mixes two catalog versions.
+"""
+import copy
+import itertools
+import os
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+from controllers.tender_application.electric_motor_controller import ElectricMotorController
+from controllers.tender_application.installation_controller import InstallationController
+from controllers.tender_application.lookup_cache_controller import LookupCache
+from controllers.tender_application.panel_build_controller import PANEL_CONTROLLERS
+from controllers.tender_application.project_session_controller import freeze_specs, motors_in_specs
+from controllers.tender_application.spec_change_controller import ANY_SECTION, PANEL_DEPENDENCIES, affected_panels
+from models.catalog import load_full_catalog
+from models.catalog_version import get_catalog_versions
+from models.exchange_rate import convert_amount, convert_currency
+from utils.database import SessionLocal
+
+
+RESULTS = {**{name: controller for name, (controller, _) in PANEL_CONTROLLERS.items()},
+           "installation_panel": InstallationController}
+MOTOR_OWNERS = tuple(name for name, (_, sections) in PANEL_CONTROLLERS.items() if sections)
+MOTOR_READERS = tuple(name for name, dependencies in PANEL_DEPENDENCIES.items()
+                      if (ANY_SECTION, "motors") in dependencies)
+MAX_ATTEMPTS = 3  # sweeps run while the catalog keeps changing
+
+
+def sweep(specs, overrides, rates):
+    """
+    Prices specs for every combination of overrides ({key path: [values]}).
+
+    Returns (True, {"axes": [(key path, values)], "panels": {name: price array},
+    "total": price array, "errors": [messages]}) with prices in BASE_CURRENCY and one array
+    dimension per axis, in the order of overrides; or (False, message).
+    """
+    axes = []
+    for path, values in overrides.items():
+        path = tuple(path.split(".")) if isinstance(path, str) else tuple(path)
+        values = list(values)
+        if not _has_path(specs, path):
+            return False, f"❌ Unknown spec path: {'.'.join(path)}"
+        if not values:
+            return False, f"❌ No values for {'.'.join(path)}"
+        axes.append((path, values))
+
+    for _ in range(MAX_ATTEMPTS):
+        try:
+            # read before loading, so a write racing with the load is seen below
+            versions = _catalog_versions()
+            load_full_catalog()
+            result = _Sweep(specs, axes, rates).run()
+            if _catalog_versions() == versions:
+                return True, result
+        except Exception as e:
+            return False, f"❌ Sweep failed: {str(e)}"
+    return False, f"❌ Sweep failed: the catalog changed during each of {MAX_ATTEMPTS} attempts"
+
+
+def sweep_frame(result):
+    """
+    Returns a sweep result as a DataFrame with one row per combination: a column per axis
+    (brand lists joined by ", "), one per result and the total.
+    """
+    shape = result["total"].shape
+    positions = np.indices(shape).reshape(len(shape), -1)
+    columns = {}
+    for (path, values), indices in zip(result["axes"], positions):
+        labels = [", ".join(map(str, value)) if isinstance(value, (list, tuple)) else value for value in values]
+        columns[".".join(path)] = [labels[i] for i in indices]
+    for name, prices in result["panels"].items():
+        columns[name] = prices.ravel()
+    columns["total"] = result["total"].ravel()
+    return pd.DataFrame(columns)
+
+
+class _Sweep:
+
+    def __init__(self, specs, axes, rates):
+        self.specs = specs
+        self.axes = axes
+        self.rates = rates
+        self.shape = tuple(len(values) for _, values in axes)
+        self.dims = self._result_dims()
+        self.errors = []
+        self._specs = {}
+        self._builds = {}
+        self._lookup_caches = {}
+
+    def run(self):
+        panels = {}
+        for name, dims in self.dims.items():
+            prices = np.zeros([size if axis in dims else 1 for axis, size in enumerate(self.shape)])
+            for combination in itertools.product(*(range(self.shape[axis]) for axis in dims)):
+                combination = dict(zip(dims, combination))
+                position = tuple(combination.get(axis, 0) for axis in range(len(self.shape)))
+                prices[position] = self._price(name, combination)
+            panels[name] = prices
+
+        # broadcast every result over the whole grid
+        total = np.zeros(self.shape)
+        for prices in panels.values():
+            total = total + prices
+        return {
+            "axes": self.axes,
+            "panels": {name: np.broadcast_to(prices, self.shape) for name, prices in panels.items()},
+            "total": total,
+            "errors": list(dict.fromkeys(self.errors)),
+        }
+
+    def _result_dims(self):
+        """{result name: axes it depends on}; panels reading motors also follow the motors' axes."""
+        paths = [path for path, _ in self.axes]
+        dims = {name: {axis for axis, path in enumerate(paths) if name in affected_panels(path)}
+                for name in PANEL_DEPENDENCIES}
+        motor_dims = set().union(*(dims[name] for name in MOTOR_OWNERS))
+        for name in MOTOR_READERS:
+            dims[name] |= motor_dims
+        return {name: tuple(sorted(axes)) for name, axes in dims.items()}
+
+    def _price(self, name, combination):
+        electrical_specs = self._specs_at(combination)
+        if name == "electric_motor":
+            if not electrical_specs["fan"]["status"]:
+                return 0.0
+            controller = ElectricMotorController(electrical_specs)
+            controller.lookup_cache = self._lookup_cache(electrical_specs["project_info"]["proj_avl"])
+            electric_motor_price = controller.calculate_price()
+            if electric_motor_price is None:
+                return 0.0
+            price, _, currency = electric_motor_price
+            success, converted = convert_amount(price, currency, self.rates)
+            if not success:
+                self.errors.append(f"electric_motor: {converted}")
+                return float(price)
+            return float(converted)
+
+        bom, _ = self._build(name, combination)
+        df = bom.to_frame()
+        success, converted = convert_currency(df, self.rates)
+        if success:
+            df = converted
+        else:
+            self.errors.append(f"{name}: {converted}")
+        return float(df["total_price"].sum())
+
+    def _build(self, name, combination):
+        """(BOM, built motors) of a result at a combination, built once per combination of its axes."""
+        combination = {axis: index for axis, index in combination.items() if axis in self.dims[name]}
+        key = (name, tuple(sorted(combination.items())))
+        if key not in self._builds:
+            electrical_specs = self._specs_at(combination)
+            motors = None
+            if name in MOTOR_READERS:
+                motors = motors_in_specs(electrical_specs)
+                for owner in MOTOR_OWNERS:
+                    motors.update(self._build(owner, combination)[1])
+            controller = RESULTS[name](electrical_specs, motors)
+            controller.lookup_cache = self._lookup_cache(electrical_specs["project_info"]["proj_avl"])
+            self._builds[key] = (controller.build_panel(), controller.built_motors)
+        return self._builds[key]
+
+    def _specs_at(self, combination):
+        """Read-only specs with the overrides of a combination ({axis: value index}) applied."""
+        key = tuple(sorted(combination.items()))
+        if key not in self._specs:
+            specs = copy.deepcopy(self.specs)
+            for axis, index in combination.items():
+                path, values = self.axes[axis]
+                _set_path(specs, path, copy.deepcopy(values[index]))
+            self._specs[key] = freeze_specs(specs)
+        return self._specs[key]
+
+    def _lookup_cache(self, proj_avl):
+        key = tuple(proj_avl)
+        if key not in self._lookup_caches:
+            self._lookup_caches[key] = LookupCache(proj_avl)
+        return self._lookup_caches[key]
+
+
+def _catalog_versions():
+    session = SessionLocal()
+    try:
+        return get_catalog_versions(session)
+    finally:
+        session.close()
+
+
+def _has_path(specs, path):
+    if not path:
+        return False
+    for key in path[:-1]:
+        specs = specs.get(key) if isinstance(specs, Mapping) else None
+    return isinstance(specs, Mapping) and path[-1] in specs
+
+
+def _set_path(specs, path, value):
+    for key in path[:-1]:
+        specs = specs[key]
+    specs[path[-1]] = value
+
+
+def write_sweeps(sweeps, output_dir, output_format="csv"):
+    """
+    Writes [(label, sweep result)] to output_dir and returns the written paths:
+    csv --> sweep.csv, xlsx --> sweep.xlsx, json --> sweep.json; one row per project and combination.
+    """
+    if output_format not in ("csv", "xlsx", "json"):
+        raise ValueError(f"Unknown output format: {output_format}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    frames = [sweep_frame(result).assign(project=label) for label, result in sweeps]
+    table = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["project"])
+    table = table[["project"] + [column for column in table.columns if column != "project"]]
+
+    path = os.path.join(output_dir, f"sweep.{output_format}")
+    if output_format == "xlsx":
+        table.to_excel(path, sheet_name="Sweep", index=False, engine="openpyxl")
+    elif output_format == "json":
+        table.to_json(path, orient="records", force_ascii=False, indent=1)
+    else:
+        table.to_csv(path, index=False, encoding="utf-8-sig")
+    return [path]
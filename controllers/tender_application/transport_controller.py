@@ -9,8 +9,8 @@ class TransportController(PanelController):
     Specialized controller for building a transport panel.
     """
 
-    def __init__(self):
-        super().__init__("transport")
+    def __init__(self, electrical_specs=None, motors=None):
+        super().__init__("transport", electrical_specs, motors)
 
     def build_panel(self):
         """
@@ -21,7 +21,7 @@ class TransportController(PanelController):
 
         rotary = Motor(motors_config["rotary"]["power"], usage="Rotary")
         rotary.current = self.calculate_motor_current(power=rotary.power)
-        self.electrical_specs["transport"]["motors"]["rotary"]["motor"] = rotary
+        self.add_motor("transport", "rotary", rotary)
 
         telescopic_chute = Motor(motors_config["telescopic_chute"]["power"],
                    usage="Telescopic Chute",
@@ -30,7 +30,7 @@ class TransportController(PanelController):
                    plc_di=7,
                    plc_do=2)
         telescopic_chute.current = self.calculate_motor_current(power=telescopic_chute.power)
-        self.electrical_specs["transport"]["motors"]["telescopic_chute"]["motor"] = telescopic_chute
+        self.add_motor("transport", "telescopic_chute", telescopic_chute)
 
         slide_gate = Motor(motors_config["slide_gate"]["power"],
                    usage="Slide Gate",
@@ -39,15 +39,15 @@ class TransportController(PanelController):
                    plc_di=7,
                    plc_do=2)
         slide_gate.current = self.calculate_motor_current(power=slide_gate.power)
-        self.electrical_specs["transport"]["motors"]["slide_gate"]["motor"] = slide_gate
+        self.add_motor("transport", "slide_gate", slide_gate)
 
         screw1 = Motor(motors_config["screw1"]["power"], usage="Screw1")
         screw1.current = self.calculate_motor_current(power=screw1.power)
-        self.electrical_specs["transport"]["motors"]["screw1"]["motor"] = screw1
+        self.add_motor("transport", "screw1", screw1)
 
         screw2 = Motor(motors_config["screw2"]["power"], usage="Screw2")
         screw2.current = self.calculate_motor_current(power=screw2.power)
-        self.electrical_specs["transport"]["motors"]["screw2"]["motor"] = screw2
+        self.add_motor("transport", "screw2", screw2)
 
         motor_objects = [
                             (rotary, motors_config["rotary"]["qty"]),
@@ -58,14 +58,7 @@ class TransportController(PanelController):
                         ]
 
         # ----------------------- Add Components for Motors -----------------------
-        for motor, qty in motor_objects:
-            self.choose_contactor(motor, qty)
-        for motor, qty in motor_objects:
-            self.choose_mpcb(motor, qty)
-        for motor, qty in motor_objects:
-            self.choose_mccb(motor, qty)
-        for motor, qty in motor_objects:
-            self.choose_bimetal(motor, qty)
+        self.choose_motor_protection(motor_objects)
 
         # ----------------------- Calculate and add PLC I/O requirements -----------------------
         instruments = self.electrical_specs["transport"]["instruments"]
@@ -8,8 +8,8 @@ class VibrationController(PanelController):
     Specialized controller for building a vibration panel.
     """
 
-    def __init__(self):
-        super().__init__("vibration")
+    def __init__(self, electrical_specs=None, motors=None):
+        super().__init__("vibration", electrical_specs, motors)
 
     def build_panel(self):
         """
@@ -22,18 +22,11 @@ class VibrationController(PanelController):
                           plc_di=4,
                           lcb_for_speed_qty=0)
         vibration.current = self.calculate_motor_current(power=vibration.power)
-        self.electrical_specs["vibration"]["motors"]["vibration"]["motor"] = vibration
+        self.add_motor("vibration", "vibration", vibration)
         motor_objects = [(vibration, motors_config["vibration"]["qty"])]
 
         # ----------------------- Add Components for Motors -----------------------
-        for motor, qty in motor_objects:
-            self.choose_contactor(motor, qty)
-        for motor, qty in motor_objects:
-            self.choose_mpcb(motor, qty)
-        for motor, qty in motor_objects:
-            self.choose_mccb(motor, qty)
-        for motor, qty in motor_objects:
-            self.choose_bimetal(motor, qty)
+        self.choose_motor_protection(motor_objects)
 
         # ----------------------- Calculate and add PLC I/O requirements -----------------------
         instruments = self.electrical_specs["vibration"]["instruments"]
@@ -7,10 +7,13 @@ from PyQt5.QtCore import QSettings
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QApplication, QMainWindow, QDialog
 
+from controllers.prefetch_controller import CatalogPrefetch
 from controllers.tender_application.project_session_controller import ProjectSession
 from controllers.user_session_controller import UserSession
 import json
+from models.catalog_snapshot import get_catalog_snapshot
 from utils.database import SessionLocal
+from utils.migrations import run_migrations
 from views.data_entry.data_entry_view import DataEntry
 from views.login_view import LoginView
 from views.message_box_view import show_message
@@ -104,6 +107,15 @@ class GriinPower(QMainWindow):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
+    # Bring the database schema up to date
+    success, result = run_migrations()
+    if not success:
+        show_message(result, "Error")
+        sys.exit(1)
+
+    # Map the catalog snapshot file, if one was exported
+    get_catalog_snapshot()
+
     # Initialize DB
     db_session = SessionLocal()
 
@@ -114,6 +126,9 @@ if __name__ == "__main__":
         session = QSettings("Griin", "GriinPower")
         username = session.value("last_username", "")
 
+        # warm catalog, suppliers and brands while the main window comes up
+        CatalogPrefetch().start()
+
         window = GriinPower()
         window.show()
         sys.exit(app.exec_())
@@ -9,7 +9,10 @@ __all__ = [
     "Project",
     "User",
     "Supplier",
-    "ComponentSupplier"
+    "ComponentSupplier",
+    "LatestPrice",
+    "CatalogVersion",
+    "ExchangeRate"
 ]
 
 from .components import Component
@@ -18,5 +21,8 @@ from .projects import Project
 from .user_model import User
 from .supplier import Supplier
 from .component_suppliers import ComponentSupplier
+from .latest_price import LatestPrice
+from .catalog_version import CatalogVersion
+from .exchange_rate import ExchangeRate
 
 
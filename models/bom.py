@@ -0,0 +1,120 @@
+"""
+Columnar bill of materials.
+
+The panel controllers append one row per component; the columns are kept as
+    quantity, price, total_price --> float64 arrays (grown by doubling, so append is amortized O(1))
+    type, brand, currency --> int32 codes into a per-column category list (-1 for None)
+    order_number, specifications, last_price_update, note --> plain lists
+to_frame() hands the arrays to pandas without copying them (numeric columns as array views,
+categorical columns as pandas Categoricals over the same codes).
+"""
+import numpy as np
+import pandas as pd
+
+
+COLUMNS = ("type", "brand", "order_number", "specifications", "quantity", "price", "total_price", "currency",
+           "last_price_update", "note")
+NUMERIC_COLUMNS = ("quantity", "price", "total_price")
+CATEGORICAL_COLUMNS = ("type", "brand", "currency")
+TEXT_COLUMNS = tuple(c for c in COLUMNS if c not in NUMERIC_COLUMNS + CATEGORICAL_COLUMNS)
+
+
+class BOM:
+
+    def __init__(self, capacity=32):
+        self._size = 0
+        self._capacity = capacity
+        self._numbers = {column: np.zeros(capacity, dtype=np.float64) for column in NUMERIC_COLUMNS}
+        self._codes = {column: np.zeros(capacity, dtype=np.int32) for column in CATEGORICAL_COLUMNS}
+        self._categories = {column: {} for column in CATEGORICAL_COLUMNS}  # value -> code, in first-seen order
+        self._texts = {column: [] for column in TEXT_COLUMNS}
+
+    def append(self, *, type, brand="", order_number="", specifications="", quantity=0, price=0, total_price=0,
+               currency="", last_price_update="", note=""):
+        if self._size == self._capacity:
+            self._grow()
+        row = self._size
+
+        numbers = self._numbers
+        numbers["quantity"][row] = quantity
+        numbers["price"][row] = np.nan if price is None else price
+        numbers["total_price"][row] = np.nan if total_price is None else total_price
+
+        for column, value in (("type", type), ("brand", brand), ("currency", currency)):
+            self._codes[column][row] = self._code(column, value)
+
+        texts = self._texts
+        texts["order_number"].append(order_number)
+        texts["specifications"].append(specifications)
+        texts["last_price_update"].append(last_price_update)
+        texts["note"].append(note)
+        self._size += 1
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, column):
+        """
+        Returns a column: a read-only array view for numbers, a list of values otherwise.
+        """
+        if column in self._numbers:
+            view = self._numbers[column][:self._size]
+            view.flags.writeable = False
+            return view
+        if column in self._codes:
+            categories = list(self._categories[column])
+            return [categories[code] if code >= 0 else None for code in self._codes[column][:self._size].tolist()]
+        return list(self._texts[column])
+
+    def total(self, column="total_price"):
+        """Sum of a numeric column; missing prices count as 0."""
+        return float(np.nansum(self._numbers[column][:self._size]))
+
+    def totals_by(self, category="type", column="total_price"):
+        """
+        Returns a Series {category value: sum of column}, in first-seen order.
+        """
+        codes = self._codes[category][:self._size]
+        values = np.nan_to_num(self._numbers[column][:self._size])
+        known = codes >= 0
+        codes, values = codes[known], values[known]
+        sums = np.bincount(codes, weights=values, minlength=len(self._categories[category]))
+        return pd.Series(sums, index=list(self._categories[category]), name=column)
+
+    def to_frame(self):
+        """
+        Returns the BOM as a DataFrame backed by the BOM's own arrays.
+        """
+        columns = {}
+        for column in COLUMNS:
+            if column in self._numbers:
+                columns[column] = self._numbers[column][:self._size]
+            elif column in self._codes:
+                columns[column] = pd.Categorical.from_codes(self._codes[column][:self._size],
+                                                            categories=pd.Index(list(self._categories[column]),
+                                                                                dtype=object))
+            else:
+                columns[column] = self._texts[column]
+        return pd.DataFrame(columns, copy=False)
+
+    def to_dict(self):
+        """{column: list of values}, the layout of the former panel dictionaries."""
+        return {column: self[column].tolist() if column in self._numbers else self[column] for column in COLUMNS}
+
+    def _code(self, column, value):
+        if value is None:
+            return -1  # missing, as in pandas.Categorical
+        categories = self._categories[column]
+        code = categories.get(value)
+        if code is None:
+            code = categories[value] = len(categories)
+        return code
+
+    def _grow(self):
+        self._capacity *= 2
+        for arrays in (self._numbers, self._codes):
+            for column, array in arrays.items():
+                grown = np.zeros(self._capacity, dtype=array.dtype)
+                grown[:self._size] = array[:self._size]
+                arrays[column] = grown
+
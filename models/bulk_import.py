@@ -0,0 +1,162 @@
+"""
+Bulk import of scraped price lists.
+
+Each item is a dict:
+    attributes --> {key: value} identifying attributes, already normalized the way insert_*_to_db stores them
+    supplier_id --> required
+    price --> required
+    currency --> optional, default "IRR"
+
+Components are de-duplicated against the fingerprint index. New components, their attributes
+and one dated price row per item are written with executemany in a single transaction.
+"""
+import jdatetime
+from sqlalchemy import insert, select, func
+
+from models import Component, ComponentAttribute, ComponentSupplier, LatestPrice
+from models.catalog import invalidate_catalog
+from utils.database import SessionLocal
+from utils.fingerprint import component_fingerprint
+from utils.jalali import jalali_to_epoch
+
+
+# SQLite host parameter limit is 999 on older builds
+_CHUNK = 500
+
+
+def bulk_upsert_components(component_type, items, created_by_id):
+    """
+    Upserts a whole scraped list of one component type.
+
+    Returns (True, {"inserted": n, "updated": n, "unchanged": n}) where
+        inserted --> new component with its first price
+        updated --> existing component whose current supplier/price/currency changed
+        unchanged --> existing component already at this price
+    or (False, message). Every item gets a dated price row, as with row-by-row saving, so a
+    price re-confirmed by each import stays a point of the price history (get_price_trend).
+    """
+    today_shamsi = jdatetime.datetime.today().strftime("%Y/%m/%d %H:%M")
+    date_epoch = jalali_to_epoch(today_shamsi)
+
+    # the last row wins when the list repeats a component, as with row-by-row saving
+    by_fingerprint = {}
+    for item in items:
+        fingerprint = component_fingerprint(component_type, item["attributes"])
+        by_fingerprint[fingerprint] = item
+
+    session = SessionLocal()
+    try:
+        existing_ids = _ids_by_fingerprint(session, list(by_fingerprint))
+        new_fingerprints = [fp for fp in by_fingerprint if fp not in existing_ids]
+
+        # ----------------------- new components and attributes -----------------------
+        if new_fingerprints:
+            session.execute(
+                insert(Component.__table__),
+                [{"type": component_type, "fingerprint": fp} for fp in new_fingerprints]
+            )
+            new_ids = _ids_by_fingerprint(session, new_fingerprints)
+
+            attribute_rows = []
+            for fp in new_fingerprints:
+                attributes = dict(by_fingerprint[fp]["attributes"])
+                attributes["created_by_id"] = str(created_by_id)
+                attributes["created_at"] = today_shamsi
+                attribute_rows.extend(
+                    {"component_id": new_ids[fp], "key": key, "value": value}
+                    for key, value in attributes.items()
+                    if value is not None
+                )
+            session.execute(insert(ComponentAttribute.__table__), attribute_rows)
+        else:
+            new_ids = {}
+
+        # ----------------------- price rows -----------------------
+        current_prices = _latest_prices(session, list(existing_ids.values()))
+        counts = {"inserted": len(new_ids), "updated": 0, "unchanged": 0}
+        price_rows = []
+        for fp, item in by_fingerprint.items():
+            row = {
+                "component_id": existing_ids.get(fp) or new_ids[fp],
+                "supplier_id": item["supplier_id"],
+                "price": float(item["price"]),
+                "currency": item.get("currency", "IRR"),
+                "date": today_shamsi,
+                "date_epoch": date_epoch,
+                "created_by_id": created_by_id,
+            }
+            if fp in existing_ids:
+                current = current_prices.get(row["component_id"])
+                if current == (row["supplier_id"], row["price"], row["currency"]):
+                    counts["unchanged"] += 1
+                else:
+                    counts["updated"] += 1
+            price_rows.append(row)
+
+        if price_rows:
+            session.execute(insert(ComponentSupplier.__table__), price_rows)
+            link_ids = _newest_price_ids(session, [row["component_id"] for row in price_rows])
+            session.execute(
+                LatestPrice.__table__.insert().prefix_with("OR REPLACE"),
+                [
+                    {
+                        "component_id": row["component_id"],
+                        "component_supplier_id": link_ids[row["component_id"]],
+                        "supplier_id": row["supplier_id"],
+                        "price": row["price"],
+                        "currency": row["currency"],
+                        "date": row["date"],
+                        "date_epoch": date_epoch,
+                    }
+                    for row in price_rows
+                ]
+            )
+
+        session.commit()
+        invalidate_catalog(component_type)
+        return True, counts
+
+    except Exception as e:
+        session.rollback()
+        return False, f"❌ Error in bulk import of {component_type}: {str(e)}"
+    finally:
+        session.close()
+
+
+def _chunks(values):
+    for start in range(0, len(values), _CHUNK):
+        yield values[start:start + _CHUNK]
+
+
+def _ids_by_fingerprint(session, fingerprints):
+    ids = {}
+    for chunk in _chunks(fingerprints):
+        rows = session.execute(
+            select(Component.id, Component.fingerprint).where(Component.fingerprint.in_(chunk))
+        )
+        ids.update({fingerprint: component_id for component_id, fingerprint in rows})
+    return ids
+
+
+def _latest_prices(session, component_ids):
+    prices = {}
+    for chunk in _chunks(component_ids):
+        rows = session.execute(
+            select(LatestPrice.component_id, LatestPrice.supplier_id, LatestPrice.price, LatestPrice.currency)
+            .where(LatestPrice.component_id.in_(chunk))
+        )
+        prices.update({component_id: (supplier_id, price, currency)
+                       for component_id, supplier_id, price, currency in rows})
+    return prices
+
+
+def _newest_price_ids(session, component_ids):
+    ids = {}
+    for chunk in _chunks(component_ids):
+        rows = session.execute(
+            select(ComponentSupplier.component_id, func.max(ComponentSupplier.id))
+            .where(ComponentSupplier.component_id.in_(chunk))
+            .group_by(ComponentSupplier.component_id)
+        )
+        ids.update(dict(rows.all()))
+    return ids
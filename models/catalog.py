@@ -0,0 +1,402 @@
+"""
+Process-wide catalog snapshot.
+
+A component type warmed with load_catalog() is held in memory as CatalogItem records
+(numeric attributes already parsed, current price read from latest_price) until an
+insert invalidates it. While a type is warm, models/component_query.py answers the
+models/items/*_by_* lookups from here instead of from SQL.
+
+Rating selections (contactor/MCCB ladders, MPCB/bimetal ranges) go through
+per-brand indexes built lazily on top of the snapshot.
+
+Writes from other processes are picked up through the catalog_version table: every
+load_catalog() first compares the per-type versions and drops only the types that changed.
+
+Types whose version matches the memory-mapped snapshot file (models/catalog_snapshot.py)
+are read from it instead of through the ORM.
+"""
+import re
+import threading
+from bisect import bisect_left
+
+from sqlalchemy.orm import joinedload, lazyload
+
+from models import Component, LatestPrice, Supplier
+from models.catalog_snapshot import get_catalog_snapshot, write_catalog_snapshot, close_catalog_snapshot
+from models.catalog_version import get_catalog_versions
+from models.components import get_component_types
+from utils.database import SessionLocal
+
+# plain decimal numbers; models/component_query.py's SQL accepts exactly the same
+NUMBER_PATTERN = re.compile(r"[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?")
+NUMBER_WHITESPACE = " \t\n\r\f\v"
+
+_catalog = {}
+_indexes = {}
+_versions = {}  # component type -> catalog_version it was loaded at
+_catalog_lock = threading.RLock()
+
+
+class CatalogItem:
+    """Pre-parsed, read-only view of one component and its latest price."""
+
+    __slots__ = ("id", "type", "attrs", "numbers", "supplier_name", "price", "currency", "date", "date_epoch")
+
+    def __init__(self, id, type, attrs, numbers, supplier_name="", price=0, currency="", date="", date_epoch=None):
+        self.id = id
+        self.type = type
+        self.attrs = attrs
+        self.numbers = numbers
+        self.supplier_name = supplier_name
+        self.price = price
+        self.currency = currency
+        self.date = date
+        self.date_epoch = date_epoch
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def number(self, key):
+        return self.numbers.get(key)
+
+
+def get_catalog(component_type):
+    """
+    Returns the cached CatalogItem list for a component type, loading it on first use.
+    """
+    with _catalog_lock:
+        items = _catalog.get(component_type)
+        if items is None:
+            items = _load_component_types([component_type])[component_type]
+            _catalog[component_type] = items
+        return items
+
+
+def load_catalog(component_types):
+    """
+    Warms the catalog for several component types with a single query.
+    Types that are already cached are not reloaded unless another process changed them.
+    """
+    with _catalog_lock:
+        refresh_catalog()
+        missing = [t for t in dict.fromkeys(component_types) if t not in _catalog]
+        if missing:
+            _catalog.update(_load_component_types(missing))
+
+
+def export_catalog_snapshot(path=None):
+    """
+    Writes every component type, as currently in the database, to the snapshot file.
+    Returns (True, number of components) or (False, message).
+    """
+    session = SessionLocal()
+    try:
+        versions = get_catalog_versions(session)
+        component_types = get_component_types(session)
+        items = {t: [] for t in component_types}
+        for item in _load_items(session, Component.type.in_(component_types)):
+            items[item.type].append(item)
+    except Exception as e:
+        return False, f"❌ Error reading catalog for snapshot: {str(e)}"
+    finally:
+        session.close()
+
+    try:
+        close_catalog_snapshot()
+        kwargs = {"path": path} if path else {}
+        write_catalog_snapshot(items, {t: versions.get(t, 0) for t in component_types}, **kwargs)
+        return True, sum(len(type_items) for type_items in items.values())
+    except OSError as e:
+        # another process may still map the old file (Windows refuses to replace it)
+        return False, f"❌ Error writing catalog snapshot: {str(e)}"
+
+
+def load_full_catalog():
+    """
+    Warms the catalog for every component type in the database.
+    """
+    session = SessionLocal()
+    try:
+        component_types = get_component_types(session)
+    finally:
+        session.close()
+    load_catalog(component_types)
+
+
+def is_catalog_snapshot_current():
+    """
+    True when the snapshot file exists and holds the current version of every component type.
+    """
+    snapshot = get_catalog_snapshot()
+    if snapshot is None:
+        return False
+    session = SessionLocal()
+    try:
+        versions = get_catalog_versions(session)
+    finally:
+        session.close()
+    return all(snapshot.is_current(t, version) for t, version in versions.items())
+
+
+def refresh_catalog():
+    """
+    Drops the cached component types whose catalog_version moved since they were loaded.
+    Returns the dropped types.
+    """
+    with _catalog_lock:
+        if not _catalog:
+            return []
+        session = SessionLocal()
+        try:
+            versions = get_catalog_versions(session)
+        finally:
+            session.close()
+        changed = [t for t in _catalog if versions.get(t, 0) != _versions.get(t, 0)]
+        for component_type in changed:
+            invalidate_catalog(component_type)
+        return changed
+
+
+def is_catalog_loaded(component_type):
+    with _catalog_lock:
+        return component_type in _catalog
+
+
+def load_catalog_items(component_ids):
+    """
+    Loads CatalogItem records for a few component ids without touching the snapshot.
+    Returns {component id: CatalogItem}.
+    """
+    session = SessionLocal()
+    try:
+        return {item.id: item for item in _load_items(session, Component.id.in_(list(component_ids)))}
+    finally:
+        session.close()
+
+
+def invalidate_catalog(component_type=None):
+    """
+    Drops one component type (or the whole catalog) so the next lookup reloads it.
+    """
+    with _catalog_lock:
+        if component_type is None:
+            _catalog.clear()
+            _indexes.clear()
+            _versions.clear()
+        else:
+            _catalog.pop(component_type, None)
+            _versions.pop(component_type, None)
+            for index_key in [k for k in _indexes if k[0] == component_type]:
+                del _indexes[index_key]
+
+
+def get_rating_ladder(component_type, rating_key):
+    """
+    Returns the per-brand RatingLadder over one numeric attribute of a component type.
+    """
+    with _catalog_lock:
+        index_key = (component_type, "ladder", rating_key)
+        ladder = _indexes.get(index_key)
+        if ladder is None:
+            ladder = RatingLadder(get_catalog(component_type), rating_key)
+            _indexes[index_key] = ladder
+        return ladder
+
+
+def get_interval_index(component_type, min_key="min_current", max_key="max_current"):
+    """
+    Returns the per-brand IntervalIndex over a min/max attribute pair of a component type.
+    """
+    with _catalog_lock:
+        index_key = (component_type, "interval", min_key, max_key)
+        index = _indexes.get(index_key)
+        if index is None:
+            index = IntervalIndex(get_catalog(component_type), min_key, max_key)
+            _indexes[index_key] = index
+        return index
+
+
+# ----------------------------------------------------------------------
+# Rating indexes
+# ----------------------------------------------------------------------
+
+def _group_by_brand(items):
+    """
+    Groups (position, item) pairs by brand; the None key holds every item.
+    Position is the catalog order, used to break ties the way a linear scan would.
+    """
+    groups = {None: []}
+    for position, item in enumerate(items):
+        groups[None].append((position, item))
+        groups.setdefault(item.get("brand"), []).append((position, item))
+    return groups
+
+
+def _brand_keys(groups, brands):
+    if not brands:
+        return [None]
+    return [brand for brand in dict.fromkeys(brands) if brand in groups]
+
+
+class RatingLadder:
+    """
+    Sorted rating arrays per brand for single-rating devices (contactor, MCCB).
+    first_at_least() bisects each requested brand's ladder for the smallest rating >= value.
+    """
+
+    def __init__(self, items, rating_key):
+        self._ladders = {}
+        for brand, entries in _group_by_brand(items).items():
+            rungs = sorted(
+                (item.number(rating_key), position, item)
+                for position, item in entries
+                if item.number(rating_key) is not None
+            )
+            self._ladders[brand] = ([rung[0] for rung in rungs], rungs)
+
+    def first_at_least(self, value, brands=None, order_number=None):
+        best = None
+        for brand in _brand_keys(self._ladders, brands):
+            ratings, rungs = self._ladders[brand]
+            for rung in rungs[bisect_left(ratings, value):]:
+                if order_number and rung[2].get("order_number") != order_number:
+                    continue
+                if best is None or rung[:2] < best[:2]:
+                    best = rung
+                break
+        return best[2] if best else None
+
+
+class IntervalIndex:
+    """
+    Elementary-interval index per brand for range devices (MPCB, bimetal).
+    Every endpoint and every gap between endpoints stores the tightest range covering it,
+    so tightest_covering() is a single bisect per requested brand.
+    """
+
+    def __init__(self, items, min_key, max_key):
+        self._min_key = min_key
+        self._max_key = max_key
+        self._entries = {}
+        self._indexes = {}
+        for brand, entries in _group_by_brand(items).items():
+            ranges = [
+                (item.number(max_key) - item.number(min_key), position, item)
+                for position, item in entries
+                if item.number(min_key) is not None and item.number(max_key) is not None
+            ]
+            self._entries[brand] = ranges
+            self._indexes[brand] = self._build(ranges)
+
+    def _build(self, ranges):
+        # segment 2*i is the endpoint bounds[i], segment 2*i+1 the open gap after it
+        bounds = sorted({r[2].number(self._min_key) for r in ranges} | {r[2].number(self._max_key) for r in ranges})
+        best = [None] * (2 * len(bounds))
+        for entry in ranges:
+            low = bisect_left(bounds, entry[2].number(self._min_key))
+            high = bisect_left(bounds, entry[2].number(self._max_key))
+            for segment in range(2 * low, 2 * high + 1):
+                if best[segment] is None or entry[:2] < best[segment][:2]:
+                    best[segment] = entry
+        return bounds, best
+
+    def tightest_covering(self, value, brands=None, order_number=None):
+        best = None
+        for brand in _brand_keys(self._indexes, brands):
+            if order_number:
+                candidate = min(
+                    (entry for entry in self._entries[brand]
+                     if entry[2].get("order_number") == order_number
+                     and entry[2].number(self._min_key) <= value <= entry[2].number(self._max_key)),
+                    key=lambda entry: entry[:2],
+                    default=None
+                )
+            else:
+                bounds, segments = self._indexes[brand]
+                i = bisect_left(bounds, value)
+                if i < len(bounds) and bounds[i] == value:
+                    candidate = segments[2 * i]
+                elif 0 < i < len(bounds):
+                    candidate = segments[2 * i - 1]
+                else:
+                    candidate = None
+            if candidate and (best is None or candidate[:2] < best[:2]):
+                best = candidate
+        return best[2] if best else None
+
+
+def _load_component_types(component_types):
+    session = SessionLocal()
+    try:
+        # read before loading, so a write racing with the load is seen by the next refresh
+        versions = get_catalog_versions(session)
+        _versions.update({t: versions.get(t, 0) for t in component_types})
+
+        loaded = {component_type: [] for component_type in component_types}
+        snapshot = get_catalog_snapshot()
+        from_database = []
+        for component_type in component_types:
+            if snapshot is not None and snapshot.is_current(component_type, versions.get(component_type, 0)):
+                loaded[component_type] = [CatalogItem(*row) for row in snapshot.rows(component_type)]
+            else:
+                from_database.append(component_type)
+
+        if from_database:
+            for item in _load_items(session, Component.type.in_(from_database)):
+                loaded[item.type].append(item)
+        return loaded
+    finally:
+        session.close()
+
+
+def _load_items(session, component_filter):
+    components = (
+        session.query(Component)
+        .filter(component_filter)
+        .options(joinedload(Component.attributes), lazyload(Component.suppliers))
+        .order_by(Component.id)
+        .all()
+    )
+    latest_prices = {
+        latest.component_id: (latest, supplier_name)
+        for latest, supplier_name in (
+            session.query(LatestPrice, Supplier.name)
+            .join(Component, Component.id == LatestPrice.component_id)
+            .outerjoin(Supplier, Supplier.id == LatestPrice.supplier_id)
+            .filter(component_filter)
+            .all()
+        )
+    }
+    return [_to_catalog_item(component, latest_prices.get(component.id)) for component in components]
+
+
+def _to_catalog_item(component, latest_price=None):
+    attrs = {attr.key: attr.value for attr in component.attributes}
+    numbers = {}
+    for key, value in attrs.items():
+        number = _parse_number(value)
+        if number is not None:
+            numbers[key] = number
+
+    if latest_price is None:
+        return CatalogItem(component.id, component.type, attrs, numbers)
+
+    latest, supplier_name = latest_price
+    return CatalogItem(
+        component.id,
+        component.type,
+        attrs,
+        numbers,
+        supplier_name=supplier_name or "",
+        price=latest.price,
+        currency=latest.currency,
+        date=str(latest.date),
+        date_epoch=latest.date_epoch,
+    )
+
+
+def _parse_number(value):
+    if value is None:
+        return None
+    text = str(value).replace('٬', '').replace(',', '').strip(NUMBER_WHITESPACE)
+    return float(text) if NUMBER_PATTERN.fullmatch(text) else None
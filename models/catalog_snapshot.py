@@ -0,0 +1,212 @@
+"""
+Columnar catalog snapshot file.
+
+Layout: 8-byte magic, 8-byte header length, a JSON header (format, per-type catalog
+versions, array directory), then 64-byte aligned raw arrays:
+    strings_blob / strings_offsets --> interned UTF-8 string table (types, brands, order numbers,
+                                       suppliers, currencies, dates and every other attribute value)
+    component_id, component_type, supplier, price, currency, date, date_epoch --> one entry per component,
+                                                                           id order (date_epoch NO_EPOCH when unknown)
+    attr_offsets --> CSR offsets of each component's attributes
+    attr_key, attr_value, attr_number --> one entry per attribute (number is NaN when not numeric)
+
+The arrays are opened with np.memmap, so every process on the workstation shares the
+same page cache. models.catalog.export_catalog_snapshot() writes the file; models.catalog
+reads a component type from it only while the type's catalog_version still matches.
+"""
+import json
+import os
+import struct
+import threading
+
+import numpy as np
+
+from config import CATALOG_SNAPSHOT_PATH
+
+
+SNAPSHOT_MAGIC = b"GPCATSNP"
+SNAPSHOT_FORMAT = 2
+NO_EPOCH = np.iinfo(np.int64).min
+_ALIGN = 64
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+class CatalogSnapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            magic, header_length = f.read(8), struct.unpack("<Q", f.read(8))[0]
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"Not a catalog snapshot: {path}")
+            header = json.loads(f.read(header_length).decode("utf-8"))
+        if header["format"] != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported catalog snapshot format: {header['format']}")
+
+        self.path = path
+        self.versions = header["versions"]
+        self._arrays = {
+            name: np.memmap(path, dtype=np.dtype(dtype), mode="r", offset=offset, shape=(length,))
+            if length else np.empty(0, dtype=np.dtype(dtype))
+            for name, (dtype, length, offset) in header["arrays"].items()
+        }
+        self._strings = None
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["_arrays"][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def strings(self):
+        """Decodes the interned string table once; ids index into the returned list."""
+        if self._strings is None:
+            blob = self.strings_blob.tobytes()
+            offsets = self.strings_offsets.tolist()
+            self._strings = [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+        return self._strings
+
+    def is_current(self, component_type, version):
+        return self.versions.get(component_type) == version
+
+    def rows(self, component_type):
+        """
+        Yields (id, type, attrs, numbers, supplier_name, price, currency, date, date_epoch) for one type,
+        in id order.
+        """
+        strings = self.strings()
+        try:
+            type_id = strings.index(component_type)
+        except ValueError:
+            return
+
+        attr_offsets = self.attr_offsets
+        attr_key, attr_value, attr_number = self.attr_key, self.attr_value, self.attr_number
+        for row in np.flatnonzero(self.component_type == type_id):
+            start, end = int(attr_offsets[row]), int(attr_offsets[row + 1])
+            keys = [strings[k] for k in attr_key[start:end].tolist()]
+            values = [strings[v] if v >= 0 else None for v in attr_value[start:end].tolist()]
+            numbers = attr_number[start:end].tolist()
+            price = float(self.price[row])
+            date_epoch = int(self.date_epoch[row])
+            yield (
+                int(self.component_id[row]),
+                component_type,
+                dict(zip(keys, values)),
+                {key: number for key, number in zip(keys, numbers) if number == number},  # NaN != NaN
+                strings[self.supplier[row]],
+                None if price != price else price,
+                strings[self.currency[row]],
+                strings[self.date[row]],
+                None if date_epoch == NO_EPOCH else date_epoch,
+            )
+
+
+def write_catalog_snapshot(items_by_type, versions, path=CATALOG_SNAPSHOT_PATH):
+    """
+    Writes CatalogItem lists ({type: [CatalogItem]}) and their catalog versions to a snapshot file.
+    The file is written next to the target and moved into place.
+    """
+    strings = {}
+
+    def intern(value):
+        return strings.setdefault(value, len(strings))
+
+    items = sorted((item for type_items in items_by_type.values() for item in type_items), key=lambda i: i.id)
+    columns = {name: [] for name in ("component_id", "component_type", "supplier", "price", "currency", "date",
+                                     "date_epoch", "attr_key", "attr_value", "attr_number")}
+    attr_offsets = [0]
+    for item in items:
+        columns["component_id"].append(item.id)
+        columns["component_type"].append(intern(item.type))
+        columns["supplier"].append(intern(item.supplier_name or ""))
+        columns["price"].append(np.nan if item.price is None else item.price)
+        columns["currency"].append(intern(item.currency or ""))
+        columns["date"].append(intern(item.date or ""))
+        columns["date_epoch"].append(NO_EPOCH if item.date_epoch is None else item.date_epoch)
+        for key, value in item.attrs.items():
+            columns["attr_key"].append(intern(key))
+            columns["attr_value"].append(-1 if value is None else intern(value))
+            number = item.number(key)
+            columns["attr_number"].append(np.nan if number is None else number)
+        attr_offsets.append(len(columns["attr_key"]))
+    for component_type in items_by_type:
+        intern(component_type)
+
+    encoded = [value.encode("utf-8") for value in strings]
+    arrays = {
+        "strings_blob": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "strings_offsets": np.cumsum([0] + [len(e) for e in encoded], dtype=np.int64),
+        "component_id": np.array(columns["component_id"], dtype=np.int64),
+        "component_type": np.array(columns["component_type"], dtype=np.int32),
+        "supplier": np.array(columns["supplier"], dtype=np.int32),
+        "price": np.array(columns["price"], dtype=np.float64),
+        "currency": np.array(columns["currency"], dtype=np.int32),
+        "date": np.array(columns["date"], dtype=np.int32),
+        "date_epoch": np.array(columns["date_epoch"], dtype=np.int64),
+        "attr_offsets": np.array(attr_offsets, dtype=np.int64),
+        "attr_key": np.array(columns["attr_key"], dtype=np.int32),
+        "attr_value": np.array(columns["attr_value"], dtype=np.int32),
+        "attr_number": np.array(columns["attr_number"], dtype=np.float64),
+    }
+
+    # offsets relative to the start of the data section
+    directory, position = {}, 0
+    for name, array in arrays.items():
+        position = -(-position // _ALIGN) * _ALIGN
+        directory[name] = [array.dtype.str, int(array.size), position]
+        position += array.nbytes
+
+    # the header stores absolute offsets, so its own length decides where the data starts
+    data_start = 0
+    while True:
+        header = {
+            "format": SNAPSHOT_FORMAT,
+            "versions": versions,
+            "arrays": {name: [dtype, size, offset + data_start] for name, (dtype, size, offset) in directory.items()},
+        }
+        encoded_header = json.dumps(header).encode("utf-8")
+        start = -(-(16 + len(encoded_header)) // _ALIGN) * _ALIGN
+        if start == data_start:
+            break
+        data_start = start
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(struct.pack("<Q", len(encoded_header)))
+        f.write(encoded_header)
+        for name, array in arrays.items():
+            f.seek(data_start + directory[name][2])
+            f.write(array.tobytes())
+    os.replace(temp_path, path)
+
+
+def get_catalog_snapshot(path=CATALOG_SNAPSHOT_PATH):
+    """
+    Returns the memory-mapped snapshot, opening it on first use, or None when there is
+    no usable snapshot file.
+    """
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.path != path:
+            try:
+                _snapshot = CatalogSnapshot(path) if os.path.exists(path) else None
+            except (OSError, ValueError, KeyError):
+                _snapshot = None
+        return _snapshot
+
+
+def close_catalog_snapshot():
+    """Drops the mapping, e.g. before the file is rewritten."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
+
+
+if __name__ == "__main__":
+    from models.catalog import export_catalog_snapshot
+
+    print(export_catalog_snapshot())
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String
+
+from models import Base
+
+
+class CatalogVersion(Base):
+    """
+    One counter per component type, bumped by database triggers whenever a component,
+    one of its attributes or one of its prices is written, by this process or any other.
+    """
+    __tablename__ = 'catalog_version'
+    component_type = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+def get_catalog_versions(session):
+    """
+    Returns {component type: version} with a single query on the small version table.
+    """
+    return dict(session.query(CatalogVersion.component_type, CatalogVersion.version))
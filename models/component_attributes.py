@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from models import Base
@@ -6,8 +6,11 @@ from models import Base
 
 class ComponentAttribute(Base):
     __tablename__ = 'component_attributes'
+    __table_args__ = (
+        Index("ix_component_attributes_key_value_component", "key", "value", "component_id"),
+    )
     id = Column(Integer, primary_key=True)
-    component_id = Column(Integer, ForeignKey('components.id'))
+    component_id = Column(Integer, ForeignKey('components.id'), index=True)
     key = Column(String)
     value = Column(String)
 
@@ -0,0 +1,242 @@
+"""
+Attribute query builder shared by the models/items/*_by_* lookups.
+
+A query collects filters and at most one ordering, then first() returns the winning
+CatalogItem (or None):
+    equals --> stored text equality (a non-string value never matches, as in Python)
+    equals_ignore_case --> case-insensitive text equality, a missing attribute counts as ""
+    one_of --> text IN (brand lists)
+    number_equals / number_between / has_number --> numeric attribute tests (CAST AS REAL)
+    at_least --> minimum satisfying value: smallest number >= value
+    covering --> tightest min/max range that contains value
+    latest --> newest current price (date_epoch; components without one come last)
+
+When the component type is warm in models.catalog the query is answered from the
+snapshot (rating ladders and interval indexes where the filters allow it). Otherwise
+it compiles to one SELECT with one aliased component_attributes join per key and
+ORDER BY ... LIMIT 1, so only the winning component is loaded.
+Ties are always broken by component id.
+"""
+from sqlalchemy import select, and_, case, cast, false, func, or_, Float
+
+from models import Component, ComponentAttribute, LatestPrice
+from models.catalog import (
+    NUMBER_WHITESPACE, get_catalog, get_interval_index, get_rating_ladder, is_catalog_loaded, load_catalog_items
+)
+from utils.database import SessionLocal
+
+
+class ComponentQuery:
+
+    def __init__(self, component_type):
+        self.component_type = component_type
+        self._filters = []
+        self._order = None
+
+    # ----------------------- filters -----------------------
+
+    def equals(self, key, value):
+        self._filters.append(("equals", key, value))
+        return self
+
+    def equals_ignore_case(self, key, value):
+        self._filters.append(("equals_ignore_case", key, str(value).lower()))
+        return self
+
+    def one_of(self, key, values):
+        self._filters.append(("one_of", key, tuple(values)))
+        return self
+
+    def number_equals(self, key, value):
+        self._filters.append(("number_equals", key, value))
+        return self
+
+    def number_between(self, key, low=None, high=None):
+        self._filters.append(("number_between", key, (low, high)))
+        return self
+
+    def has_number(self, key):
+        return self.number_between(key)
+
+    # ----------------------- orderings -----------------------
+
+    def at_least(self, key, value):
+        self.number_between(key, low=value)
+        self._order = ("minimum", key)
+        return self
+
+    def covering(self, value, min_key="min_current", max_key="max_current"):
+        self.number_between(min_key, high=value)
+        self.number_between(max_key, low=value)
+        self._order = ("range", min_key, max_key)
+        return self
+
+    def latest(self):
+        self._order = ("latest",)
+        return self
+
+    # ----------------------- execution -----------------------
+
+    def first(self):
+        if is_catalog_loaded(self.component_type):
+            return self._first_from_catalog()
+        return self._first_from_database()
+
+    def _first_from_catalog(self):
+        indexed = self._indexed_lookup()
+        if indexed is not None:
+            return indexed()
+
+        matches = [item for item in get_catalog(self.component_type) if self._matches(item)]
+        if not matches:
+            return None
+        if self._order is None:
+            return matches[0]
+        if self._order[0] == "latest":
+            return max(matches, key=lambda item: float("-inf") if item.date_epoch is None else item.date_epoch)
+        if self._order[0] == "minimum":
+            return min(matches, key=lambda item: item.number(self._order[1]))
+        min_key, max_key = self._order[1:]
+        return min(matches, key=lambda item: item.number(max_key) - item.number(min_key))
+
+    def _indexed_lookup(self):
+        """
+        Rating ladders and interval indexes answer brand/order number filtered selections
+        with a bisect; returns None when the filters need a full scan.
+        """
+        if self._order is None or self._order[0] not in ("minimum", "range"):
+            return None
+
+        brands, order_number = None, None
+        for kind, key, value in self._filters:
+            if kind == "one_of" and key == "brand" and brands is None:
+                brands = list(value)
+            elif kind == "equals" and key == "order_number" and order_number is None and value:
+                order_number = value
+            elif kind != "number_between":
+                return None
+
+        bounds = [(key, value) for kind, key, value in self._filters if kind == "number_between"]
+        if self._order[0] == "minimum":
+            key = self._order[1]
+            if len(bounds) != 1 or bounds[0][0] != key or bounds[0][1][1] is not None:
+                return None
+            ladder = get_rating_ladder(self.component_type, key)
+            return lambda: ladder.first_at_least(bounds[0][1][0], brands=brands, order_number=order_number)
+
+        min_key, max_key = self._order[1:]
+        if len(bounds) != 2 or (bounds[0][0], bounds[1][0]) != (min_key, max_key):
+            return None
+        value = bounds[0][1][1]
+        index = get_interval_index(self.component_type, min_key, max_key)
+        return lambda: index.tightest_covering(value, brands=brands, order_number=order_number)
+
+    def _matches(self, item):
+        for kind, key, value in self._filters:
+            if kind == "equals":
+                if item.get(key) != value:
+                    return False
+            elif kind == "equals_ignore_case":
+                if (item.get(key) or "").lower() != value:
+                    return False
+            elif kind == "one_of":
+                if item.get(key) not in value:
+                    return False
+            else:
+                number = item.number(key)
+                if number is None:
+                    return False
+                if kind == "number_equals" and number != value:
+                    return False
+                if kind == "number_between":
+                    low, high = value
+                    if (low is not None and number < low) or (high is not None and number > high):
+                        return False
+        return True
+
+    def _first_from_database(self):
+        attributes = {}
+
+        def attribute(key, outer=False):
+            if key not in attributes:
+                alias = ComponentAttribute.__table__.alias(f"attr_{len(attributes)}")
+                attributes[key] = (alias, outer)
+            return attributes[key][0].c.value
+
+        conditions = [Component.type == self.component_type]
+        for kind, key, value in self._filters:
+            if kind == "equals":
+                conditions.append(attribute(key) == value if isinstance(value, str) else false())
+            elif kind == "equals_ignore_case":
+                conditions.append(func.lower(func.coalesce(attribute(key, outer=True), "")) == value)
+            elif kind == "one_of":
+                conditions.append(attribute(key).in_([v for v in value if isinstance(v, str)]))
+            else:
+                number, is_number = _numeric(attribute(key))
+                conditions.append(is_number)
+                if kind == "number_equals":
+                    conditions.append(number == value if _is_number(value) else false())
+                if kind == "number_between":
+                    low, high = value
+                    if low is not None:
+                        conditions.append(number >= low)
+                    if high is not None:
+                        conditions.append(number <= high)
+
+        order_by = []
+        if self._order is not None and self._order[0] == "latest":
+            order_by.append(LatestPrice.date_epoch.desc())  # NULLs sort last
+        elif self._order is not None and self._order[0] == "minimum":
+            order_by.append(_numeric(attribute(self._order[1]))[0])
+        elif self._order is not None:
+            min_key, max_key = self._order[1:]
+            order_by.append(_numeric(attribute(max_key))[0] - _numeric(attribute(min_key))[0])
+        order_by.append(Component.id)
+
+        source = Component.__table__
+        for key, (alias, outer) in attributes.items():
+            on = and_(alias.c.component_id == Component.id, alias.c.key == key)
+            source = source.outerjoin(alias, on) if outer else source.join(alias, on)
+        if self._order is not None and self._order[0] == "latest":
+            source = source.outerjoin(LatestPrice.__table__, LatestPrice.component_id == Component.id)
+
+        statement = select(Component.id).select_from(source).where(*conditions).order_by(*order_by).limit(1)
+
+        session = SessionLocal()
+        try:
+            component_id = session.execute(statement).scalar()
+        finally:
+            session.close()
+
+        if component_id is None:
+            return None
+        return load_catalog_items([component_id]).get(component_id)
+
+
+def _numeric(value):
+    """
+    (number, is_number) expressions for a text attribute, parsed like models.catalog does:
+    thousand separators removed, surrounding whitespace trimmed, and only what matches
+    catalog.NUMBER_PATTERN ([+-]digits[.digits][e[+-]digits]) counts as a number, so
+    values such as ".", "+" or "e" are not CAST to 0.
+    """
+    cleaned = func.trim(func.replace(func.replace(value, ",", ""), "٬", ""), NUMBER_WHITESPACE)
+    unsigned = _without_sign(cleaned)
+    e = func.instr(func.lower(unsigned), "e")
+    mantissa = case((e > 0, func.substr(unsigned, 1, e - 1)), else_=unsigned)
+    exponent = _without_sign(func.substr(unsigned, e + 1))
+    is_number = and_(
+        mantissa.op("GLOB")("*[0-9]*"),
+        ~mantissa.op("GLOB")("*[^0-9.]*"),
+        ~mantissa.op("GLOB")("*.*.*"),
+        or_(e == 0, and_(exponent != "", ~exponent.op("GLOB")("*[^0-9]*"))),
+    )
+    return cast(cleaned, Float), is_number
+
+
+def _without_sign(text):
+    return case((func.substr(text, 1, 1).in_(("+", "-")), func.substr(text, 2)), else_=text)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float))
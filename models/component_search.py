@@ -0,0 +1,66 @@
+"""
+Full-text component search.
+
+component_search is an FTS5 table (trigram tokenizer, rowid = component id) over the
+order_number, brand, type, specification and note attributes plus the component type,
+kept in sync by triggers on component_attributes (see utils/migrations.py).
+Trigram matching finds any substring, so "LC1D" or "GV2ME" match anywhere in an order number.
+"""
+from sqlalchemy import text
+
+from utils.database import SessionLocal
+
+
+SEARCH_LIMIT = 50
+
+_SEARCH_SQL = """
+    SELECT s.rowid AS id, s.component_type, s.type, s.brand, s.order_number, s.specification, s.note,
+           sp.name AS supplier_name, lp.price, lp.currency, lp.date
+    FROM component_search s
+    LEFT JOIN latest_price lp ON lp.component_id = s.rowid
+    LEFT JOIN supplier sp ON sp.id = lp.supplier_id
+    WHERE {condition} {type_filter}
+    ORDER BY {order}
+    LIMIT :limit
+"""
+
+
+def search_components(query, component_type=None, limit=SEARCH_LIMIT):
+    """
+    Searches components by (partial) order number, brand, type, specification or note.
+
+    Returns (True, [row dicts]) ordered by relevance, or (False, message).
+    Queries shorter than three characters, which trigrams cannot index, fall back to LIKE.
+    """
+    query = (query or "").strip()
+    if not query:
+        return True, []
+
+    params = {"limit": limit}
+    if len(query) >= 3:
+        condition = "component_search MATCH :match"
+        order = "rank"
+        params["match"] = '"' + query.replace('"', '""') + '"'
+    else:
+        pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        condition = "(" + " OR ".join(
+            f"s.{column} LIKE :pattern ESCAPE '\\'"
+            for column in ("order_number", "brand", "type", "specification", "note", "component_type")
+        ) + ")"
+        order = "s.rowid"
+        params["pattern"] = pattern
+
+    type_filter = ""
+    if component_type is not None:
+        type_filter = "AND s.component_type = :component_type"
+        params["component_type"] = component_type
+
+    session = SessionLocal()
+    try:
+        statement = text(_SEARCH_SQL.format(condition=condition, type_filter=type_filter, order=order))
+        rows = session.execute(statement, params).mappings().all()
+        return True, [dict(row) for row in rows]
+    except Exception as e:
+        return False, f"❌ Error searching components: {str(e)}"
+    finally:
+        session.close()
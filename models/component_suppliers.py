@@ -1,30 +1,50 @@
 import jdatetime
 
 
-from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from models import Base, Component
+from models.latest_price import update_latest_price
 from utils.database import SessionLocal
+from utils.jalali import jalali_epoch_default
 
 today_shamsi = jdatetime.datetime.today().strftime("%Y/%m/%d %H:%M")
 
 
 class ComponentSupplier(Base):
     __tablename__ = 'component_supplier'
+    __table_args__ = (
+        Index("ix_component_supplier_component_date", "component_id", "date_epoch"),
+    )
     id = Column(Integer, primary_key=True)
-    component_id = Column(Integer, ForeignKey('components.id'))
+    component_id = Column(Integer, ForeignKey('components.id'), index=True)
     supplier_id = Column(Integer, ForeignKey('supplier.id'))
     price = Column(Float)
     currency = Column(String, default='IRR')
     date = Column(String, default=today_shamsi)
+    date_epoch = Column(Integer, default=jalali_epoch_default("date"))
     created_by_id = Column(Integer)
 
     supplier = relationship('Supplier', back_populates='components', lazy="joined")
     component = relationship('Component', back_populates='suppliers', lazy="joined")
 
 
+def get_latest_supplier_link(session, component_id):
+    """
+    Returns the newest ComponentSupplier row of a component (ORDER BY date_epoch, id ... LIMIT 1).
+    """
+    return (
+        session.query(ComponentSupplier)
+        .filter(ComponentSupplier.component_id == component_id)
+        .order_by(ComponentSupplier.date_epoch.desc(), ComponentSupplier.id.desc())
+        .first()
+    )
+
+
 def insert_component_suppliers_to_db(component_id, supplier_id, price, currency, created_by_id=None):
+    from models.catalog import invalidate_catalog  # models.catalog imports this module
+
     session = SessionLocal()
     try:
         component = session.get(Component, component_id)
@@ -37,8 +57,11 @@ def insert_component_suppliers_to_db(component_id, supplier_id, price, currency,
         )
 
         component.suppliers.append(supplier_link)
+        session.flush()  # Assign ID and default date
+        update_latest_price(session, get_latest_supplier_link(session, component_id))
 
         session.commit()
+        invalidate_catalog(component.type)
         return True, None
 
     except Exception as e:
@@ -47,5 +70,3 @@ def insert_component_suppliers_to_db(component_id, supplier_id, price, currency,
 
     finally:
         session.close()
-
-
@@ -1,13 +1,58 @@
 from sqlalchemy import Column, Integer, String
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import relationship
 
 from models import Base
+from utils.fingerprint import component_fingerprint
 
 
 class Component(Base):
     __tablename__ = 'components'
     id = Column(Integer, primary_key=True)
-    type = Column(String)
+    type = Column(String, index=True)
+    fingerprint = Column(String, unique=True, index=True)
 
     attributes = relationship('ComponentAttribute', back_populates='component', cascade="all, delete-orphan", lazy="joined")
     suppliers = relationship('ComponentSupplier', back_populates='component', cascade='all, delete-orphan', lazy="joined")
+
+
+def get_component_types(session):
+    """
+    Returns every component type present in the database.
+    """
+    return [component_type for (component_type,) in session.query(Component.type).distinct() if component_type]
+
+
+def fingerprint_component(component):
+    """
+    Computes and stores the fingerprint of a (not yet saved) component from its attributes.
+    """
+    component.fingerprint = component_fingerprint(
+        component.type, {attr.key: attr.value for attr in component.attributes}
+    )
+    return component.fingerprint
+
+
+def find_component_by_fingerprint(session, fingerprint):
+    """
+    Returns the id of the component with this fingerprint, or None.
+    """
+    row = session.query(Component.id).filter(Component.fingerprint == fingerprint).first()
+    return row[0] if row else None
+
+
+def add_component_or_get_existing(session, component):
+    """
+    Adds and commits a fingerprinted component. If an identical component was committed
+    in the meantime, the unique index rejects this one and the existing id is returned.
+    """
+    session.add(component)
+    try:
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        existing_id = find_component_by_fingerprint(session, component.fingerprint)
+        if existing_id is None:
+            raise
+        return existing_id
+    return component.id
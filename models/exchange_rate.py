@@ -0,0 +1,136 @@
+"""
+Dated exchange rates and currency normalization of BOM tables.
+
+Each row holds the value of one unit of a currency in BASE_CURRENCY from its date on;
+get_exchange_rates() returns the rates in effect at a date as {currency: rate} with a
+single query, and convert_currency() converts every price column of a panel DataFrame
+with one vectorized multiplication. Currency codes are compared case-insensitively
+("usd" == "USD"); rates are stored upper-case. Rates are entered with
+batch_pricing.py --set-rate USD=1050000.
+
+A build reads the rates once and passes the same dict to every conversion, so all panels
+of one result use the same rates.
+"""
+import jdatetime
+import pandas as pd
+from sqlalchemy import Column, Integer, String, Float, Index
+
+from config import BASE_CURRENCY
+from models import Base
+from utils.database import SessionLocal
+from utils.jalali import jalali_epoch_default, jalali_to_epoch
+
+
+PRICE_COLUMNS = ("price", "total_price")
+
+
+class ExchangeRate(Base):
+    __tablename__ = 'exchange_rate'
+    __table_args__ = (
+        Index("ix_exchange_rate_currency_date", "currency", "date_epoch"),
+    )
+    id = Column(Integer, primary_key=True)
+    currency = Column(String, nullable=False)
+    rate = Column(Float, nullable=False)  # BASE_CURRENCY per unit
+    date = Column(String, default=lambda: jdatetime.datetime.today().strftime("%Y/%m/%d %H:%M"))
+    date_epoch = Column(Integer, default=jalali_epoch_default("date"))
+    created_by_id = Column(Integer)
+
+
+def insert_exchange_rate_to_db(currency, rate, date=None, created_by_id=None):
+    """
+    Saves a rate, effective from date (Jalali "1404/03/28 11:36", default now).
+    """
+    session = SessionLocal()
+    try:
+        exchange_rate = ExchangeRate(currency=currency.upper(), rate=float(rate), created_by_id=created_by_id)
+        if date is not None:
+            exchange_rate.date = date
+        session.add(exchange_rate)
+        session.commit()
+        return True, None
+    except Exception as e:
+        session.rollback()
+        return False, f"❌ Error saving exchange rate: {str(e)}"
+    finally:
+        session.close()
+
+
+def get_exchange_rates(as_of=None):
+    """
+    Returns (True, {currency: rate}) with the newest rate of each currency dated at or
+    before as_of (Jalali date or epoch seconds, default: all rates), BASE_CURRENCY always 1.0.
+    """
+    session = SessionLocal()
+    try:
+        query = session.query(ExchangeRate.currency, ExchangeRate.rate)
+        if as_of is not None:
+            epoch = as_of if isinstance(as_of, (int, float)) else jalali_to_epoch(as_of)
+            if epoch is None:
+                return False, f"❌ Unrecognized date: {as_of}"
+            query = query.filter(ExchangeRate.date_epoch <= epoch)
+
+        # the newest row of each currency is read last
+        rates = _normalize_rates(query.order_by(ExchangeRate.date_epoch, ExchangeRate.id))
+        rates[BASE_CURRENCY.upper()] = 1.0
+        return True, rates
+    except Exception as e:
+        return False, f"❌ Error loading exchange rates: {str(e)}"
+    finally:
+        session.close()
+
+
+def convert_currency(df, rates, target=BASE_CURRENCY, columns=PRICE_COLUMNS):
+    """
+    Converts the price columns of a DataFrame with a "currency" column to target.
+    Rows without a currency are taken to be in BASE_CURRENCY.
+
+    Returns (True, converted copy) with currency set to target, or (False, message)
+    naming the currencies that have no rate.
+    """
+    rates = _normalize_rates(rates.items())
+    target = target.upper()
+    if target not in rates:
+        return False, f"❌ No exchange rate for {target}"
+
+    if "currency" in df.columns:
+        currencies = normalize_currencies(df["currency"])
+    else:
+        currencies = pd.Series(BASE_CURRENCY, index=df.index)
+    factors = currencies.map(rates) / rates[target]
+
+    missing = sorted(set(currencies[factors.isna()]))
+    if missing:
+        return False, f"❌ No exchange rate for {', '.join(missing)}"
+
+    converted = df.copy()
+    for column in columns:
+        if column in converted.columns:
+            converted[column] = converted[column].astype(float) * factors
+    converted["currency"] = target
+    return True, converted
+
+
+def normalize_currencies(currencies):
+    """
+    Returns a Series of currency codes upper-cased, with missing or empty codes as BASE_CURRENCY.
+    """
+    currencies = currencies.astype(object)  # also accepts a categorical column
+    return currencies.mask(currencies.isna() | (currencies == ""), BASE_CURRENCY).str.upper()
+
+
+def convert_amount(amount, currency, rates, target=BASE_CURRENCY):
+    """
+    Scalar counterpart of convert_currency(); returns (True, amount) or (False, message).
+    """
+    rates = _normalize_rates(rates.items())
+    currency = (currency or BASE_CURRENCY).upper()
+    target = target.upper()
+    if currency not in rates or target not in rates:
+        return False, f"❌ No exchange rate for {currency if currency not in rates else target}"
+    return True, amount * rates[currency] / rates[target]
+
+
+def _normalize_rates(rates):
+    # (currency, rate) pairs --> {CURRENCY: rate}, later pairs win
+    return {currency.upper(): rate for currency, rate in rates}
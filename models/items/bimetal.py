@@ -2,8 +2,11 @@ from sqlalchemy.orm import joinedload
 import jdatetime
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import get_user_names
 
 """
 attribute_keys:
@@ -18,6 +21,7 @@ attribute_keys:
 
 def get_all_bimetals():
     session = SessionLocal()
+    user_names = get_user_names(session)
 
     attribute_keys = [
         "min_current", "max_current", "class", "trip_time",
@@ -41,9 +45,7 @@ def get_all_bimetals():
 
         created_by = ""
         if created_by_id:
-            user = session.query(User).filter_by(id=int(created_by_id)).first()
-            if user:
-                created_by = f"{user.first_name} {user.last_name}"
+            created_by = user_names.get(int(created_by_id), created_by)
 
         for supplier in bimetal.suppliers:
             bimetal_data = {
@@ -65,82 +67,36 @@ def get_all_bimetals():
 
 def get_bimetal_by_current(rated_current, brands=[], order_number=None):
     brands = [b.lower() for b in brands]
-    session = SessionLocal()
     try:
         current_val = float(rated_current)
 
-        bimetals = (
-            session.query(Component)
-            .filter(Component.type == "Bimetal")
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-            .all()
-        )
-
-        matching_bimetals = []
-
-        for bimetal in bimetals:
-            attr_dict = {attr.key: attr.value for attr in bimetal.attributes}
-
-            try:
-                min_c = float(attr_dict.get("min_current", -1))
-                max_c = float(attr_dict.get("max_current", -1))
-            except ValueError:
-                continue
-
-            # بررسی تطابق جریان با بازه
-            if not (min_c <= current_val <= max_c):
-                continue
-
-            # بررسی برند
-            brand = attr_dict.get("brand")
-            if brands and brand not in brands:
-                continue
-
-            # بررسی شماره سفارش
-            if order_number and attr_dict.get("order_number") != order_number:
-                continue
-
-            matching_bimetals.append({
-                "component": bimetal,
-                "attr_dict": attr_dict,
-                "range": max_c - min_c,
-                "latest_supplier": max(bimetal.suppliers, key=lambda s: s.date if s.date else "", default=None)
-            })
-
-        if not matching_bimetals:
-            return False, "❌ Bimetal not found"
-
         # انتخاب بی‌متال با کمترین بازه جریان
-        best_match = min(
-            matching_bimetals,
-            key=lambda item: item["range"]
-        )
+        query = ComponentQuery("Bimetal").covering(current_val)
+        if brands:
+            query.one_of("brand", brands)
+        if order_number:
+            query.equals("order_number", order_number)
+        best_match = query.first()
+        if best_match is None:
+            return False, "❌ Bimetal not found"
 
-        supplier = best_match["latest_supplier"]
-        attr = best_match["attr_dict"]
         result = {
-            "id": best_match["component"].id,
-            "min_current": attr.get("min_current"),
-            "max_current": attr.get("max_current"),
-            "class": attr.get("class"),
-            "trip_time": attr.get("trip_time"),
-            "brand": attr.get("brand"),
-            "order_number": attr.get("order_number"),
-            "supplier_name": supplier.supplier.name if supplier else "",
-            "price": supplier.price if supplier else 0,
-            "currency": supplier.currency if supplier else "",
-            "date": str(supplier.date) if supplier else "",
+            "id": best_match.id,
+            "min_current": best_match.get("min_current"),
+            "max_current": best_match.get("max_current"),
+            "class": best_match.get("class"),
+            "trip_time": best_match.get("trip_time"),
+            "brand": best_match.get("brand"),
+            "order_number": best_match.get("order_number"),
+            "supplier_name": best_match.supplier_name,
+            "price": best_match.price,
+            "currency": best_match.currency,
+            "date": best_match.date,
         }
         return True, result
 
     except Exception as e:
-        session.rollback()
         return False, f"❌ Failed in get_bimetal_by_current:\n{str(e)}"
-    finally:
-        session.close()
 
 
 def insert_bimetal_to_db(
@@ -156,25 +112,6 @@ def insert_bimetal_to_db(
     current_user = UserSession()
     session = SessionLocal()
     try:
-        existing_components = (
-            session.query(Component)
-            .filter(Component.type == "Bimetal")
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for component in existing_components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-            if (
-                attr_dict.get("brand") == brand and
-                attr_dict.get("order_number") == order_number and
-                attr_dict.get("min_current") == min_current and
-                attr_dict.get("max_current") == max_current and
-                attr_dict.get("class") == _class and
-                attr_dict.get("trip_time") == trip_time
-            ):
-                return True, component.id
-
         new_bimetal = Component(
             type="Bimetal",
             attributes=[
@@ -188,10 +125,13 @@ def insert_bimetal_to_db(
                 ComponentAttribute(key='created_at', value=today_shamsi),
             ]
         )
-        session.add(new_bimetal)
-        session.flush()
-        session.commit()
-        return True, new_bimetal.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_bimetal))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_bimetal)
+        invalidate_catalog("Bimetal")
+        return True, component_id
 
     except Exception as e:
         session.rollback()
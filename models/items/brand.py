@@ -1,19 +1,14 @@
-from sqlalchemy import select, distinct
+from models.option_index import get_all_options, get_options
 
-from models import ComponentAttribute
-from utils.database import SessionLocal
 
-
-def get_all_brands():
-    session = SessionLocal()
+def get_all_brands(component_type=None, subtype=None):
+    """
+    Returns (True, brands) of one component type (and subtype), or of all types,
+    read from the option index.
+    """
     try:
-        results = session.execute(
-            select(distinct(ComponentAttribute.value))
-            .where(ComponentAttribute.key == "brand")
-        ).scalars().all()
-        return True, results
+        if component_type is None:
+            return True, get_all_options("brand")
+        return True, get_options(component_type, "brand", subtype)
     except Exception as e:
-        session.rollback()
         return False, f"❌ Error in get brands: {str(e)}"
-    finally:
-        session.close()
@@ -3,8 +3,11 @@ from sqlalchemy.orm import joinedload
 
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import get_user_names
 
 """
 attribute_keys:
@@ -18,6 +21,7 @@ attribute_keys:
 
 def get_all_contactors():
     session = SessionLocal()
+    user_names = get_user_names(session)
 
     attribute_keys = [
         "rated_current", "coil_voltage", "brand", "order_number", "created_by_id"
@@ -41,9 +45,7 @@ def get_all_contactors():
         for supplier in contactor.suppliers:
             created_by_id = supplier.created_by_id
             if created_by_id:
-                user = session.query(User).filter_by(id=int(created_by_id)).first()
-                if user:
-                    created_by = f"{user.first_name} {user.last_name}"
+                created_by = user_names.get(int(created_by_id), created_by)
 
             contactor_data = {
                 "id": contactor.id,
@@ -64,120 +66,69 @@ def get_all_contactors():
 
 def get_contactor_by_current(rated_current, brands=[], order_number=None):
     brands = [b.lower() for b in brands]
-    session = SessionLocal()
     try:
         current_val = float(rated_current)
         min_val = current_val * 1.25
 
-        contactors = (
-            session.query(Component)
-            .filter(Component.type == "Contactor")
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-            .all()
-        )
-
-        matching_contactors = []
-
-        for contactor in contactors:
-            attr_dict = {attr.key: attr.value for attr in contactor.attributes}
-
-            rc = float(attr_dict.get("rated_current", -1))
-            brand = attr_dict.get("brand")
-
-            if rc < min_val:
-                continue
-
-            if brands and brand not in brands:
-                continue
-
-            if order_number and attr_dict.get("order_number") != order_number:
-                continue
-
-            matching_contactors.append({
-                "component": contactor,
-                "attr_dict": attr_dict,
-                "rated_current": rc,
-                "latest_supplier": max(contactor.suppliers, key=lambda s: s.date if s.date else "", default=None)
-            })
-
-        if not matching_contactors:
+        query = ComponentQuery("Contactor").at_least("rated_current", min_val)
+        if brands:
+            query.one_of("brand", brands)
+        if order_number:
+            query.equals("order_number", order_number)
+        best_match = query.first()
+        if best_match is None:
             return False, "❌ Contactor not found"
 
-        best_match = min(
-            matching_contactors,
-            key=lambda item: item["rated_current"]
-        )
-
-        supplier = best_match["latest_supplier"]
-        attr = best_match["attr_dict"]
         result = {
-            "id": best_match["component"].id,
-            "rated_current": float(attr.get("rated_current")),
-            "coil_voltage": float(attr.get("coil_voltage")),
-            "brand": attr.get("brand"),
-            "order_number": attr.get("order_number"),
-            "supplier_name": supplier.supplier.name if supplier else "",
-            "price": int(supplier.price) if supplier else 0,
-            "currency": supplier.currency if supplier else "",
-            "date": str(supplier.date) if supplier else "",
+            "id": best_match.id,
+            "rated_current": best_match.number("rated_current"),
+            "coil_voltage": float(best_match.get("coil_voltage")),
+            "brand": best_match.get("brand"),
+            "order_number": best_match.get("order_number"),
+            "supplier_name": best_match.supplier_name,
+            "price": int(best_match.price),
+            "currency": best_match.currency,
+            "date": best_match.date,
         }
         return True, result
 
     except Exception as e:
-        session.rollback()
         return {"error": str(e)}
-    finally:
-        session.close()
+
+
+def contactor_attributes(brand, order_number, rated_current, coil_voltage):
+    """
+    Identifying attributes of a contactor, normalized the way insert_contactor_to_db stores them.
+    """
+    return {
+        "brand": brand.lower(),
+        "order_number": order_number,
+        "rated_current": str(float(rated_current)),
+        "coil_voltage": str(float(coil_voltage)),
+    }
 
 
 def insert_contactor_to_db(brand, order_number, rated_current, coil_voltage, created_by_id=None):
-    brand = brand.lower()
     today_shamsi = jdatetime.datetime.today().strftime("%Y/%m/%d %H:%M")
     current_user = UserSession()
     session = SessionLocal()
 
-    rated_current = str(float(rated_current))
-    coil_voltage = str(float(coil_voltage))
-
     try:
-        # Query only components of type "Contactor" with matching attributes
-        existing_components = (
-            session.query(Component)
-            .filter(Component.type == "Contactor")
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for component in existing_components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-            if (
-                attr_dict.get("brand") == brand and
-                attr_dict.get("order_number") == order_number and
-                attr_dict.get("rated_current") == rated_current and
-                attr_dict.get("coil_voltage") == coil_voltage
-            ):
-                return True, component.id  # Match found
-
-        # No match found, create new component
         created_by_id = created_by_id if created_by_id else str(current_user.id)
+        attributes = contactor_attributes(brand, order_number, rated_current, coil_voltage)
+        attributes["created_by_id"] = created_by_id
+        attributes["created_at"] = today_shamsi
         new_contactor = Component(
             type="Contactor",
-            attributes=[
-                ComponentAttribute(key="brand", value=brand),
-                ComponentAttribute(key="order_number", value=order_number),
-                ComponentAttribute(key="rated_current", value=rated_current),
-                ComponentAttribute(key="coil_voltage", value=coil_voltage),
-                ComponentAttribute(key="created_by_id", value=created_by_id),
-                ComponentAttribute(key="created_at", value=today_shamsi),
-            ]
+            attributes=[ComponentAttribute(key=key, value=value) for key, value in attributes.items()]
         )
-        session.add(new_contactor)
-        session.flush()  # Assign ID
-        session.commit()
-        return True, new_contactor.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_contactor))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_contactor)
+        invalidate_catalog("Contactor")
+        return True, component_id
 
     except Exception as e:
         session.rollback()
@@ -3,8 +3,11 @@ from sqlalchemy.orm import joinedload
 
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import get_user_names
 
 """
 attribute_keys:
@@ -26,6 +29,7 @@ attribute_keys:
 
 def get_all_motors():
     session = SessionLocal()
+    user_names = get_user_names(session)
 
     attribute_keys = [
         "power", "rpm", "voltage", "start_type", "cooling_method", "ip_rating",
@@ -50,9 +54,7 @@ def get_all_motors():
 
         created_by = ""
         if created_by_id:
-            user = session.query(User).filter_by(id=int(created_by_id)).first()
-            if user:
-                created_by = f"{user.first_name} {user.last_name}"
+            created_by = user_names.get(int(created_by_id), created_by)
 
         for supplier in motor.suppliers:
             motor_data = {
@@ -87,7 +89,6 @@ def get_motor_by_spec(
         is_routine=None,
 ):
     brand = brand.lower() if brand else brand
-    session = SessionLocal()
     try:
         power_val = float(power)
         rpm_val = int(rpm)
@@ -96,100 +97,60 @@ def get_motor_by_spec(
         min_power = power_val
         max_power = power_val * 1.1  # 10% margin
 
-        motors = (
-            session.query(Component)
-            .filter(Component.type == "Motor")
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-            .all()
-        )
-
-        matching_motors = []
-
-        for motor in motors:
-            attr_dict = {attr.key: attr.value for attr in motor.attributes}
-
-            try:
-                motor_power = float(attr_dict.get("power", -1))
-                motor_rpm = int(attr_dict.get("rpm", -1))
-                motor_voltage = int(attr_dict.get("voltage", -1))
-            except ValueError:
-                continue  # skip invalid records
-
-            if not (min_power <= motor_power <= max_power):
-                continue
-            if motor_rpm != rpm_val or motor_voltage != voltage_val:
-                continue
-            if attr_dict.get("brand") != brand:
-                continue
-
-            # Optional filters
-            if start_type and attr_dict.get("start_type") != start_type:
-                continue
-            if cooling_method and attr_dict.get("cooling_method") != cooling_method:
-                continue
-            if ip_rating and attr_dict.get("ip_rating") != ip_rating:
-                continue
-            if efficiency_class and attr_dict.get("efficiency_class") != efficiency_class:
-                continue
-            if painting_ral and attr_dict.get("painting_ral") != painting_ral:
-                continue
-            if thermal_protection and attr_dict.get("thermal_protection") != thermal_protection:
-                continue
-            if is_official and attr_dict.get("is_official") != is_official:
-                continue
-            if is_routine and attr_dict.get("is_routine") != is_routine:
-                continue
+        optional_filters = {
+            "start_type": start_type,
+            "cooling_method": cooling_method,
+            "ip_rating": ip_rating,
+            "efficiency_class": efficiency_class,
+            "painting_ral": painting_ral,
+            "thermal_protection": thermal_protection,
+            "is_official": is_official,
+            "is_routine": is_routine,
+        }
 
-            latest_supplier = max(motor.suppliers, key=lambda s: s.date if s.date else "", default=None)
+        query = (
+            ComponentQuery("Motor")
+            .number_between("power", min_power, max_power)
+            .number_equals("rpm", rpm_val)
+            .number_equals("voltage", voltage_val)
+            .equals("brand", brand)
+            .latest()
+        )
 
-            matching_motors.append({
-                "component": motor,
-                "attr_dict": attr_dict,
-                "latest_supplier": latest_supplier
-            })
+        # Optional filters
+        for key, value in optional_filters.items():
+            if value:
+                query.equals(key, value)
 
-        if not matching_motors:
+        latest = query.first()
+        if latest is None:
             return False, "❌ Motor not found"
 
-        latest = max(
-            matching_motors,
-            key=lambda item: item["latest_supplier"].date if item["latest_supplier"] else ""
-        )
-
-        supplier = latest["latest_supplier"]
-        attr = latest["attr_dict"]
-
         result = {
-            "id": latest["component"].id,
-            "power": attr.get("power"),
-            "rpm": attr.get("rpm"),
-            "voltage": attr.get("voltage"),
-            "brand": attr.get("brand"),
-            "start_type": attr.get("start_type", ""),
-            "cooling_method": attr.get("cooling_method", ""),
-            "ip_rating": attr.get("ip_rating", ""),
-            "efficiency_class": attr.get("efficiency_class", ""),
-            "painting_ral": attr.get("painting_ral", ""),
-            "thermal_protection": attr.get("thermal_protection", ""),
-            "is_official": attr.get("is_official", ""),
-            "is_routine": attr.get("is_routine", ""),
-            "supplier_name": supplier.supplier.name if supplier else "",
-            "price": supplier.price if supplier else 0,
-            "currency": supplier.currency if supplier else "",
-            "date": str(supplier.date) if supplier else "",
+            "id": latest.id,
+            "power": latest.get("power"),
+            "rpm": latest.get("rpm"),
+            "voltage": latest.get("voltage"),
+            "brand": latest.get("brand"),
+            "start_type": latest.get("start_type", ""),
+            "cooling_method": latest.get("cooling_method", ""),
+            "ip_rating": latest.get("ip_rating", ""),
+            "efficiency_class": latest.get("efficiency_class", ""),
+            "painting_ral": latest.get("painting_ral", ""),
+            "thermal_protection": latest.get("thermal_protection", ""),
+            "is_official": latest.get("is_official", ""),
+            "is_routine": latest.get("is_routine", ""),
+            "supplier_name": latest.supplier_name,
+            "price": latest.price,
+            "currency": latest.currency,
+            "date": latest.date,
         }
 
         return True, result
 
     except Exception as e:
-        session.rollback()
         print(str(e))
         return False, f"error {str(e)}"
-    finally:
-        session.close()
 
 
 def insert_motor_to_db(
@@ -211,31 +172,6 @@ def insert_motor_to_db(
     current_user = UserSession()
     session = SessionLocal()
     try:
-        existing_components = (
-            session.query(Component)
-            .filter(Component.type == "Motor")
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for component in existing_components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-            if (
-                attr_dict.get("power") == power and
-                attr_dict.get("rpm") == rpm and
-                attr_dict.get("voltage") == voltage and
-                attr_dict.get("brand") == brand and
-                attr_dict.get("start_type") == start_type and
-                attr_dict.get("cooling_method") == cooling_method and
-                attr_dict.get("ip_rating") == ip_rating and
-                attr_dict.get("efficiency_class") == efficiency_class and
-                attr_dict.get("painting_ral") == painting_ral and
-                attr_dict.get("thermal_protection") == thermal_protection and
-                attr_dict.get("is_official") == is_official and
-                attr_dict.get("is_routine") == is_routine
-            ):
-                return True, component.id  # Already exists
-
         attributes = [
             ComponentAttribute(key="power", value=power),
             ComponentAttribute(key="rpm", value=rpm),
@@ -265,10 +201,13 @@ def insert_motor_to_db(
             attributes=attributes
         )
 
-        session.add(new_motor)
-        session.flush()
-        session.commit()
-        return True, new_motor.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_motor))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_motor)
+        invalidate_catalog("Motor")
+        return True, component_id
 
     except Exception as e:
         session.rollback()
@@ -3,8 +3,11 @@ from sqlalchemy.orm import joinedload
 
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import get_user_names
 
 """
 attribute_keys:
@@ -21,6 +24,7 @@ attribute_keys:
 
 def get_all_electrical_panel():
     session = SessionLocal()
+    user_names = get_user_names(session)
 
     attribute_keys = ["type", "width", "height", "depth", "ip_rating", "brand", "order_number", "created_by_id"]
 
@@ -41,9 +45,7 @@ def get_all_electrical_panel():
 
         created_by = ""
         if created_by_id:
-            user = session.query(User).filter_by(id=int(created_by_id)).first()
-            if user:
-                created_by = f"{user.first_name} {user.last_name}"
+            created_by = user_names.get(int(created_by_id), created_by)
 
         for supplier in general.suppliers:
             general_data = {
@@ -65,76 +67,44 @@ def get_all_electrical_panel():
 
 def get_electrical_panel_by_spec(type, width=None, height=None, depth=None, ip_rating=None, brand=None, order_number=""):
 
-    session = SessionLocal()
     try:
-        panels = (
-            session.query(Component)
-            .filter(Component.type == type)
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-            .all()
-        )
-
-        matching_panels = []
-
-        for panel in panels:
-            attr_dict = {attr.key: attr.value for attr in panel.attributes}
-
-            if attr_dict.get("type") != type:
-                continue
-            if width and float(attr_dict.get("width")) != width:
-                continue
-            if height and float(attr_dict.get("height")) != height:
-                continue
-            if depth and float(attr_dict.get("depth")) != depth:
-                continue
-            if ip_rating and attr_dict.get("ip_rating") != ip_rating:
-                continue
-            if brand and attr_dict.get("brand") != brand:
-                continue
-            if order_number and attr_dict.get("order_number") != order_number:
-                continue
-
-            matching_panels.append({
-                "component": panel,
-                "attr_dict": attr_dict,
-                "latest_supplier": max(panel.suppliers, key=lambda s: s.date if s.date else "", default=None)
-            })
-
-        if not matching_panels:
+        query = ComponentQuery(type).equals("type", type).latest()
+        if width:
+            query.number_equals("width", width)
+        if height:
+            query.number_equals("height", height)
+        if depth:
+            query.number_equals("depth", depth)
+        if ip_rating:
+            query.equals("ip_rating", ip_rating)
+        if brand:
+            query.equals("brand", brand)
+        if order_number:
+            query.equals("order_number", order_number)
+
+        latest = query.first()
+        if latest is None:
             return False, "❌ Component not found"
 
-        latest = max(
-            matching_panels,
-            key=lambda item: item["latest_supplier"].date if item["latest_supplier"] else ""
-        )
-
-        supplier = latest["latest_supplier"]
-        attr = latest["attr_dict"]
         result = {
-            "id": latest["component"].id,
-            "type": attr.get("type"),
-            "width": attr.get("width"),
-            "height": attr.get("height"),
-            "depth": attr.get("depth"),
-            "ip_rating": attr.get("ip_rating", ""),
-            "brand": attr.get("brand"),
-            "order_number": attr.get("order_number"),
-            "supplier_name": supplier.supplier.name if supplier else "",
-            "price": supplier.price if supplier else 0,
-            "currency": supplier.currency if supplier else "",
-            "date": str(supplier.date) if supplier else "",
+            "id": latest.id,
+            "type": latest.get("type"),
+            "width": latest.get("width"),
+            "height": latest.get("height"),
+            "depth": latest.get("depth"),
+            "ip_rating": latest.get("ip_rating", ""),
+            "brand": latest.get("brand"),
+            "order_number": latest.get("order_number"),
+            "supplier_name": latest.supplier_name,
+            "price": latest.price,
+            "currency": latest.currency,
+            "date": latest.date,
         }
         return True, result
 
     except Exception as e:
-        session.rollback()
         print(str(e))
         return False, f"❌ Error get panel: {str(e)}"
-    finally:
-        session.close()
 
 
 
@@ -151,26 +121,6 @@ def insert_electrical_panel_to_db(
     current_user = UserSession()
     session = SessionLocal()
     try:
-        existing_components = (
-            session.query(Component)
-            .filter(Component.type == type)
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for component in existing_components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-            if (
-                    attr_dict.get("type") == type and
-                    attr_dict.get("width") == width and
-                    attr_dict.get("height") == height and
-                    attr_dict.get("depth") == depth and
-                    attr_dict.get("brand") == brand and
-                    attr_dict.get("order_number") == order_number and
-                    (not ip_rating or attr_dict.get("ip_rating") == ip_rating)
-            ):
-                return True, component.id
-
         attributes = [
             ComponentAttribute(key="type", value=type),
             ComponentAttribute(key="width", value=width),
@@ -188,10 +138,13 @@ def insert_electrical_panel_to_db(
             type=type,
             attributes=attributes
         )
-        session.add(new_panel)
-        session.flush()
-        session.commit()
-        return True, new_panel.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_panel))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_panel)
+        invalidate_catalog(type)
+        return True, component_id
 
     except Exception as e:
         session.rollback()
@@ -3,8 +3,11 @@ from sqlalchemy.orm import joinedload
 
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import get_user_names
 
 """
 attribute_keys:
@@ -18,6 +21,7 @@ attribute_keys:
 
 def get_all_generals():
     session = SessionLocal()
+    user_names = get_user_names(session)
 
     attribute_keys = ["type", "specification", "brand", "order_number", "created_by_id"]
 
@@ -38,9 +42,7 @@ def get_all_generals():
 
         created_by = ""
         if created_by_id:
-            user = session.query(User).filter_by(id=int(created_by_id)).first()
-            if user:
-                created_by = f"{user.first_name} {user.last_name}"
+            created_by = user_names.get(int(created_by_id), created_by)
 
         for supplier in general.suppliers:
             general_data = {
@@ -62,68 +64,35 @@ def get_all_generals():
 
 def get_general_by_spec(type, specification=None, brand=None, order_number=None):
     brand = brand.lower() if brand else None
-    session = SessionLocal()
     try:
-        generals = (
-            session.query(Component)
-            .filter(Component.type == "General")
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-            .all()
-        )
-
-        matching_generals = []
-
-        for general in generals:
-            attr_dict = {attr.key: attr.value for attr in general.attributes}
-
-            if attr_dict.get("type") != type:
-                continue
-
-            if specification and attr_dict.get("specification") != specification:
-                continue
-            if brand and attr_dict.get("brand") != brand:
-                continue
-            if order_number and attr_dict.get("order_number") != order_number:
-                continue
-
-            matching_generals.append({
-                "component": general,
-                "attr_dict": attr_dict,
-                "latest_supplier": max(general.suppliers, key=lambda s: s.date if s.date else "", default=None)
-            })
-
-        if not matching_generals:
+        query = ComponentQuery("General").equals("type", type).latest()
+        if specification:
+            query.equals("specification", specification)
+        if brand:
+            query.equals("brand", brand)
+        if order_number:
+            query.equals("order_number", order_number)
+
+        latest = query.first()
+        if latest is None:
             return False, "❌ General component not found"
 
-        latest = max(
-            matching_generals,
-            key=lambda item: item["latest_supplier"].date if item["latest_supplier"] else ""
-        )
-
-        supplier = latest["latest_supplier"]
-        attr = latest["attr_dict"]
         result = {
-            "id": latest["component"].id,
-            "type": attr.get("type"),
-            "specification": attr.get("specification"),
-            "brand": attr.get("brand", ""),
-            "order_number": attr.get("order_number", ""),
-            "supplier_name": supplier.supplier.name if supplier else "",
-            "price": supplier.price if supplier else 0,
-            "currency": supplier.currency if supplier else "",
-            "date": str(supplier.date) if supplier else "",
+            "id": latest.id,
+            "type": latest.get("type"),
+            "specification": latest.get("specification"),
+            "brand": latest.get("brand", ""),
+            "order_number": latest.get("order_number", ""),
+            "supplier_name": latest.supplier_name,
+            "price": latest.price,
+            "currency": latest.currency,
+            "date": latest.date,
         }
         return True, result
 
     except Exception as e:
-        session.rollback()
         print(str(e))
         return False, f"failed in get generals {str(e)}"
-    finally:
-        session.close()
 
 
 def insert_general_to_db(
@@ -136,23 +105,6 @@ def insert_general_to_db(
     current_user = UserSession()
     session = SessionLocal()
     try:
-        existing_components = (
-            session.query(Component)
-            .filter(Component.type == "General")
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for component in existing_components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-            if (
-                    attr_dict.get("type") == type and
-                    attr_dict.get("specification") == specification and
-                    attr_dict.get("brand") == brand and
-                    attr_dict.get("order_number") == order_number
-            ):
-                return True, component.id  # Already exists
-
         new_general = Component(
             type="General",
             attributes=[
@@ -164,10 +116,13 @@ def insert_general_to_db(
                 ComponentAttribute(key='created_at', value=today_shamsi),
             ]
         )
-        session.add(new_general)
-        session.flush()
-        session.commit()
-        return True, new_general.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_general))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_general)
+        invalidate_catalog("General")
+        return True, component_id
 
     except Exception as e:
         session.rollback()
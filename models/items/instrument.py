@@ -2,8 +2,11 @@ from sqlalchemy.orm import joinedload
 import jdatetime
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import get_user_names
 
 """
 attribute_keys:
@@ -17,6 +20,7 @@ attribute_keys:
 
 def get_all_instruments():
     session = SessionLocal()
+    user_names = get_user_names(session)
 
     attribute_keys = [
         "type", "hart_comminucation",
@@ -40,9 +44,7 @@ def get_all_instruments():
 
         created_by = ""
         if created_by_id:
-            user = session.query(User).filter_by(id=int(created_by_id)).first()
-            if user:
-                created_by = f"{user.first_name} {user.last_name}"
+            created_by = user_names.get(int(created_by_id), created_by)
 
         for supplier in instrument.suppliers:
             instrument_data = {
@@ -64,70 +66,35 @@ def get_all_instruments():
 
 def get_instrument_by_spec(type, hart_comminucation=None, brands=[], order_number=None):
     brands = [b.lower() for b in brands]
-    session = SessionLocal()
     try:
-        instruments = (
-            session.query(Component)
-            .filter(Component.type == "Instrument")
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-            .all()
-        )
-
-        matching_instruments = []
-
-        for instrument in instruments:
-            attr_dict = {attr.key: attr.value for attr in instrument.attributes}
-
-            if attr_dict.get("type") != type:
-                continue
-
-            if hart_comminucation is not None:
-                if attr_dict.get("hart_comminucation", "").lower() != str(hart_comminucation).lower():
-                    continue
-
-            if brands and attr_dict.get("brand") not in brands:
-                continue
-            if order_number and attr_dict.get("order_number") != order_number:
-                continue
-
-            matching_instruments.append({
-                "component": instrument,
-                "attr_dict": attr_dict,
-                "latest_supplier": max(instrument.suppliers, key=lambda s: s.date if s.date else "", default=None)
-            })
-
-        if not matching_instruments:
+        query = ComponentQuery("Instrument").equals("type", type).latest()
+        if hart_comminucation is not None:
+            query.equals_ignore_case("hart_comminucation", hart_comminucation)
+        if brands:
+            query.one_of("brand", brands)
+        if order_number:
+            query.equals("order_number", order_number)
+
+        latest = query.first()
+        if latest is None:
             return False, "❌ Instrument not found"
 
-        latest = max(
-            matching_instruments,
-            key=lambda item: item["latest_supplier"].date if item["latest_supplier"] else ""
-        )
-
-        supplier = latest["latest_supplier"]
-        attr = latest["attr_dict"]
         result = {
-            "id": latest["component"].id,
-            "type": attr.get("type"),
-            "hart_comminucation": attr.get("hart_comminucation"),
-            "brand": attr.get("brand"),
-            "order_number": attr.get("order_number"),
-            "supplier_name": supplier.supplier.name if supplier else "",
-            "price": supplier.price if supplier else 0,
-            "currency": supplier.currency if supplier else "",
-            "date": str(supplier.date) if supplier else "",
+            "id": latest.id,
+            "type": latest.get("type"),
+            "hart_comminucation": latest.get("hart_comminucation"),
+            "brand": latest.get("brand"),
+            "order_number": latest.get("order_number"),
+            "supplier_name": latest.supplier_name,
+            "price": latest.price,
+            "currency": latest.currency,
+            "date": latest.date,
         }
         return True, result
 
     except Exception as e:
-        session.rollback()
         print(str(e))
         return f"failed in get instrument\n{str(e)}"
-    finally:
-        session.close()
 
 
 def insert_instrument_to_db(
@@ -143,23 +110,6 @@ def insert_instrument_to_db(
     try:
         hart_value = "true" if hart_comminucation is True else "false"
 
-        existing_components = (
-            session.query(Component)
-            .filter(Component.type == "Instrument")
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for component in existing_components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-            if (
-                    attr_dict.get("type") == type and
-                    attr_dict.get("hart_comminucation") == hart_value and
-                    attr_dict.get("brand") == brand and
-                    attr_dict.get("order_number") == order_number
-            ):
-                return True, component.id  # Already exists
-
         new_instrument = Component(
             type="Instrument",
             attributes=[
@@ -171,10 +121,13 @@ def insert_instrument_to_db(
                 ComponentAttribute(key='created_at', value=today_shamsi),
             ]
         )
-        session.add(new_instrument)
-        session.flush()
-        session.commit()
-        return True, new_instrument.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_instrument))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_instrument)
+        invalidate_catalog("Instrument")
+        return True, component_id
 
     except Exception as e:
         session.rollback()
@@ -2,8 +2,11 @@ from sqlalchemy.orm import joinedload
 import jdatetime
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import get_user_names
 
 """
 attribute_keys:
@@ -16,6 +19,7 @@ attribute_keys:
 
 def get_all_mccbs():
     session = SessionLocal()
+    user_names = get_user_names(session)
 
     attribute_keys = [
         "rated_current", "breaking_capacity", "brand", "order_number", "created_by_id"
@@ -39,9 +43,7 @@ def get_all_mccbs():
         for supplier in mccb.suppliers:
             created_by_id = supplier.created_by_id
             if created_by_id:
-                user = session.query(User).filter_by(id=int(created_by_id)).first()
-                if user:
-                    created_by = f"{user.first_name} {user.last_name}"
+                created_by = user_names.get(int(created_by_id), created_by)
             mccb_data = {
                 "id": mccb.id,
                 "supplier_name": supplier.supplier.name,
@@ -61,68 +63,46 @@ def get_all_mccbs():
 
 def get_mccb_by_current(rated_current, brands=[], order_number=None):
     brands = [b.lower() for b in brands]
-    session = SessionLocal()
     try:
         current_val = float(rated_current)
         min_val = current_val * 1.25
 
-        mccbs = (
-            session.query(Component)
-            .filter(Component.type == "MCCB")
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-            .all()
-        )
-
-        matching_mccbs = []
-
-        for mccb in mccbs:
-            attr_dict = {attr.key: attr.value for attr in mccb.attributes}
-            rc = safe_float(attr_dict.get("rated_current"))
-            if rc is None or rc < min_val:
-                continue
-
-            brand = attr_dict.get("brand")
-            if brands and brand not in brands:
-                continue
-
-            if order_number and attr_dict.get("order_number") != order_number:
-                continue
-
-            matching_mccbs.append({
-                "component": mccb,
-                "attr_dict": attr_dict,
-                "rated_current": rc,
-                "latest_supplier": max(mccb.suppliers, key=lambda s: s.date if s.date else "", default=None)
-            })
-
-        if not matching_mccbs:
+        query = ComponentQuery("MCCB").at_least("rated_current", min_val)
+        if brands:
+            query.one_of("brand", brands)
+        if order_number:
+            query.equals("order_number", order_number)
+        best_match = query.first()
+        if best_match is None:
             return False, "❌ MCCB not found"
 
-        best_match = min(matching_mccbs, key=lambda item: item["rated_current"])
-
-        supplier = best_match["latest_supplier"]
-        attr = best_match["attr_dict"]
         result = {
-            "id": best_match["component"].id,
-            "rated_current": attr.get("rated_current"),
-            "breaking_capacity": attr.get("breaking_capacity"),
-            "brand": attr.get("brand"),
-            "order_number": attr.get("order_number"),
-            "supplier_name": supplier.supplier.name if supplier else "",
-            "price": supplier.price if supplier else 0,
-            "currency": supplier.currency if supplier else "",
-            "date": str(supplier.date) if supplier else "",
+            "id": best_match.id,
+            "rated_current": best_match.get("rated_current"),
+            "breaking_capacity": best_match.get("breaking_capacity"),
+            "brand": best_match.get("brand"),
+            "order_number": best_match.get("order_number"),
+            "supplier_name": best_match.supplier_name,
+            "price": best_match.price,
+            "currency": best_match.currency,
+            "date": best_match.date,
         }
         return True, result
 
     except Exception as e:
-        session.rollback()
         return False, f"get mccb error:\n{str(e)}"
-    finally:
-        session.close()
+
+
+def mccb_attributes(brand, order_number, rated_current, breaking_capacity):
+    """
+    Identifying attributes of an MCCB, normalized the way insert_mccb_to_db stores them.
+    """
+    return {
+        "brand": brand.lower(),
+        "order_number": order_number,
+        "rated_current": str(float(rated_current)),
+        "breaking_capacity": str(float(breaking_capacity)),
+    }
 
 
 def insert_mccb_to_db(
@@ -132,44 +112,25 @@ def insert_mccb_to_db(
         breaking_capacity,
         created_by_id=None):
 
-    brand = brand.lower()
     today_shamsi = jdatetime.datetime.today().strftime("%Y/%m/%d %H:%M")
     current_user = UserSession()
     session = SessionLocal()
     try:
-        existing_components = (
-            session.query(Component)
-            .filter(Component.type == "MCCB")
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for component in existing_components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-            if (
-                attr_dict.get("brand") == brand and
-                attr_dict.get("order_number") == order_number and
-                attr_dict.get("rated_current") == str(float(rated_current)) and
-                attr_dict.get("breaking_capacity") == str(float(breaking_capacity))
-            ):
-                return True, component.id  # Already exists
-
         created_by_id = created_by_id if created_by_id else str(current_user.id)
+        attributes = mccb_attributes(brand, order_number, rated_current, breaking_capacity)
+        attributes["created_by_id"] = created_by_id
+        attributes["created_at"] = today_shamsi
         new_mccb = Component(
             type="MCCB",
-            attributes=[
-                ComponentAttribute(key='brand', value=brand),
-                ComponentAttribute(key='order_number', value=order_number),
-                ComponentAttribute(key='rated_current', value=str(float(rated_current))),
-                ComponentAttribute(key='breaking_capacity', value=str(float(breaking_capacity))),
-                ComponentAttribute(key='created_by_id', value=created_by_id),
-                ComponentAttribute(key='created_at', value=today_shamsi),
-            ]
+            attributes=[ComponentAttribute(key=key, value=value) for key, value in attributes.items()]
         )
-        session.add(new_mccb)
-        session.flush()
-        session.commit()
-        return True, new_mccb.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_mccb))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_mccb)
+        invalidate_catalog("MCCB")
+        return True, component_id
 
     except Exception as e:
         session.rollback()
@@ -2,8 +2,11 @@ from sqlalchemy.orm import joinedload
 import jdatetime
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import get_user_names
 
 """
 attribute_keys:
@@ -18,6 +21,7 @@ attribute_keys:
 
 def get_all_mpcbs():
     session = SessionLocal()
+    user_names = get_user_names(session)
 
     attribute_keys = [
         "min_current", "max_current", "breaking_capacity", "trip_class",
@@ -42,9 +46,7 @@ def get_all_mpcbs():
         for supplier in mpcb.suppliers:
             created_by_id = supplier.created_by_id
             if created_by_id:
-                user = session.query(User).filter_by(id=int(created_by_id)).first()
-                if user:
-                    created_by = f"{user.first_name} {user.last_name}"
+                created_by = user_names.get(int(created_by_id), created_by)
             mpcb_data = {
                 "id": mpcb.id,
                 "supplier_name": supplier.supplier.name,
@@ -64,80 +66,49 @@ def get_all_mpcbs():
 
 def get_mpcb_by_current(rated_current, brands=[], order_number=None):
     brands = [b.lower() for b in brands]
-    session = SessionLocal()
     try:
         current_val = float(rated_current)
 
-        mpcbs = (
-            session.query(Component)
-            .filter(Component.type == "MPCB")
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-            .all()
-        )
-
-        matching_mpcbs = []
-
-        for mpcb in mpcbs:
-            attr_dict = {attr.key: attr.value for attr in mpcb.attributes}
-
-            min_c = safe_float(attr_dict.get("min_current"))
-            max_c = safe_float(attr_dict.get("max_current"))
-
-            print("\n\n", type(min_c), ":", min_c , type(max_c), ":", max_c, "\n\n")
-
-            if min_c is None or max_c is None:
-                continue
-
-            if not (min_c <= current_val <= max_c):
-                continue
-
-            brand = attr_dict.get("brand")
-            if brands and brand not in brands:
-                continue
-
-            if order_number and attr_dict.get("order_number") != order_number:
-                continue
-
-            matching_mpcbs.append({
-                "component": mpcb,
-                "attr_dict": attr_dict,
-                "range": max_c - min_c,
-                "latest_supplier": max(mpcb.suppliers, key=lambda s: s.date if s.date else "", default=None)
-            })
-
-        if not matching_mpcbs:
+        query = ComponentQuery("MPCB").covering(current_val)
+        if brands:
+            query.one_of("brand", brands)
+        if order_number:
+            query.equals("order_number", order_number)
+        best_match = query.first()
+        if best_match is None:
             return False, "❌ MPCB not found"
 
-        best_match = min(
-            matching_mpcbs,
-            key=lambda item: item["range"]
-        )
-
-        supplier = best_match["latest_supplier"]
-        attr = best_match["attr_dict"]
         result = {
-            "id": best_match["component"].id,
-            "min_current": attr.get("min_current"),
-            "max_current": attr.get("max_current"),
-            "breaking_capacity": attr.get("breaking_capacity"),
-            "trip_class": attr.get("trip_class"),
-            "brand": attr.get("brand"),
-            "order_number": attr.get("order_number"),
-            "supplier_name": supplier.supplier.name if supplier else "",
-            "price": supplier.price if supplier else 0,
-            "currency": supplier.currency if supplier else "",
-            "date": str(supplier.date) if supplier else "",
+            "id": best_match.id,
+            "min_current": best_match.get("min_current"),
+            "max_current": best_match.get("max_current"),
+            "breaking_capacity": best_match.get("breaking_capacity"),
+            "trip_class": best_match.get("trip_class"),
+            "brand": best_match.get("brand"),
+            "order_number": best_match.get("order_number"),
+            "supplier_name": best_match.supplier_name,
+            "price": best_match.price,
+            "currency": best_match.currency,
+            "date": best_match.date,
         }
         return True, result
 
     except Exception as e:
-        session.rollback()
         return False, f"get mpcb error:\n{str(e)}"
-    finally:
-        session.close()
+
+
+def mpcb_attributes(brand, order_number, min_current, max_current, breaking_capacity, trip_class):
+    """
+    Identifying attributes of an MPCB, normalized the way insert_mpcb_to_db stores them.
+    """
+    return {
+        "brand": brand.lower(),
+        "order_number": order_number,
+        "min_current": str(float(min_current)),
+        "max_current": str(float(max_current)),
+        "breaking_capacity": str(float(breaking_capacity)),
+        "trip_class": trip_class,
+    }
 
 
 def insert_mpcb_to_db(
@@ -149,50 +120,25 @@ def insert_mpcb_to_db(
         trip_class,
         created_by_id=None):
 
-    brand = brand.lower()
-
-
     today_shamsi = jdatetime.datetime.today().strftime("%Y/%m/%d %H:%M")
     current_user = UserSession()
     session = SessionLocal()
     try:
-        existing_components = (
-            session.query(Component)
-            .filter(Component.type == "MPCB")
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for component in existing_components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-            if (
-                attr_dict.get("brand") == brand and
-                attr_dict.get("order_number") == order_number and
-                attr_dict.get("min_current") == float(min_current) and
-                attr_dict.get("max_current") == max_current and
-                attr_dict.get("breaking_capacity") == breaking_capacity and
-                attr_dict.get("trip_class") == trip_class
-            ):
-                return True, component.id  # Already exists
-
         created_by_id = created_by_id if created_by_id else str(current_user.id)
+        attributes = mpcb_attributes(brand, order_number, min_current, max_current, breaking_capacity, trip_class)
+        attributes["created_by_id"] = created_by_id
+        attributes["created_at"] = today_shamsi
         new_mpcb = Component(
             type="MPCB",
-            attributes=[
-                ComponentAttribute(key='brand', value=brand),
-                ComponentAttribute(key='order_number', value=order_number),
-                ComponentAttribute(key='min_current', value=str(float(min_current))),
-                ComponentAttribute(key='max_current', value=str(float(max_current))),
-                ComponentAttribute(key='breaking_capacity', value=str(float(breaking_capacity))),
-                ComponentAttribute(key='trip_class', value=trip_class),
-                ComponentAttribute(key='created_by_id', value=created_by_id),
-                ComponentAttribute(key='created_at', value=today_shamsi),
-            ]
+            attributes=[ComponentAttribute(key=key, value=value) for key, value in attributes.items()]
         )
-        session.add(new_mpcb)
-        session.flush()
-        session.commit()
-        return True, new_mpcb.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_mpcb))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_mpcb)
+        invalidate_catalog("MPCB")
+        return True, component_id
 
     except Exception as e:
         session.rollback()
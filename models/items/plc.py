@@ -2,8 +2,11 @@ from sqlalchemy.orm import joinedload
 import jdatetime
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import User, get_user_names
 
 """
 attribute_keys:
@@ -25,6 +28,7 @@ attribute_keys:
 
 def get_all_plcs():
     session = SessionLocal()
+    user_names = get_user_names(session)
 
     attribute_keys = [
         "series", "model", "di_pins", "do_pins", "ai_pins", "ao_pins",
@@ -52,9 +56,7 @@ def get_all_plcs():
 
         created_by = ""
         if created_by_id:
-            user = session.query(User).filter_by(id=int(created_by_id)).first()
-            if user:
-                created_by = f"{user.first_name} {user.last_name}"
+            created_by = user_names.get(int(created_by_id), created_by)
 
         for supplier in plc.suppliers:
             plc_data = {
@@ -84,49 +86,26 @@ def get_plc_by_spec(series, **optional_filters):
     :param series: required attribute 'series' string
     :param optional_filters: other optional filters as key=value pairs
     """
-    session = SessionLocal()
-    try:
-        if not series:
-            return False, "Series is required"
-
-        query = (
-            session.query(Component)
-            .filter(Component.type == "PLC")
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-        )
+    if not series:
+        return False, "Series is required"
 
-        # Join once for series filter
-        alias_series = ComponentAttribute.__table__.alias("attr_series")
-        query = query.join(
-            alias_series,
-            (alias_series.c.component_id == Component.id) &
-            (alias_series.c.key == "series") &
-            (alias_series.c.value == str(series))
-        )
+    query = ComponentQuery("PLC").equals("series", str(series))
 
-        # Join for each optional filter if provided and value not None or empty
-        for i, (key, value) in enumerate(optional_filters.items()):
-            if value is None or (isinstance(value, str) and value.strip() == ""):
-                continue  # skip empty filters
+    # One filter for each optional filter if provided and value not None or empty
+    for key, value in optional_filters.items():
+        if value is None or (isinstance(value, str) and value.strip() == ""):
+            continue  # skip empty filters
 
-            val_str = str(value).lower() if isinstance(value, bool) else str(value)
-            alias = ComponentAttribute.__table__.alias(f"attr_opt_{i}")
-            query = query.join(
-                alias,
-                (alias.c.component_id == Component.id) &
-                (alias.c.key == key) &
-                (alias.c.value == val_str)
-            )
+        val_str = str(value).lower() if isinstance(value, bool) else str(value)
+        query.equals(key, val_str)
 
-        plc = query.first()
-        if not plc:
-            return False, "No matching PLC found"
+    plc = query.first()
+    if not plc:
+        return False, "No matching PLC found"
 
-        attr_dict = {attr.key: attr.value for attr in plc.attributes}
-        created_by_id = attr_dict.get("created_by_id")
+    session = SessionLocal()
+    try:
+        created_by_id = plc.get("created_by_id")
 
         created_by = ""
         if created_by_id:
@@ -134,20 +113,16 @@ def get_plc_by_spec(series, **optional_filters):
             if user:
                 created_by = f"{user.first_name} {user.last_name}"
 
-        plc_list = []
-        for supplier in plc.suppliers:
-            plc_data = {
-                "id": plc.id,
-                "supplier_name": supplier.supplier.name,
-                "price": supplier.price,
-                "currency": supplier.currency,
-                "date": str(supplier.date),
-                "created_by": created_by,
-            }
-            plc_data.update(attr_dict)
-            plc_list.append(plc_data)
-
-        return True, plc_list[0] if plc_list else attr_dict
+        plc_data = {
+            "id": plc.id,
+            "supplier_name": plc.supplier_name,
+            "price": plc.price,
+            "currency": plc.currency,
+            "date": plc.date,
+            "created_by": created_by,
+        }
+        plc_data.update(plc.attrs)
+        return True, plc_data
 
     finally:
         session.close()
@@ -173,22 +148,6 @@ def insert_plc_to_db(
     current_user = UserSession()
     session = SessionLocal()
     try:
-        existing_components = (
-            session.query(Component)
-            .filter(Component.type == "PLC")
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for component in existing_components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-            if (
-                    attr_dict.get("series") == series and
-                    attr_dict.get("model") == model and
-                    attr_dict.get("order_number") == order_number
-            ):
-                return True, component.id
-
         new_plc = Component(
             type="PLC",
             attributes=[
@@ -208,10 +167,13 @@ def insert_plc_to_db(
                 ComponentAttribute(key="created_at", value=today_shamsi),
             ]
         )
-        session.add(new_plc)
-        session.flush()
-        session.commit()
-        return True, new_plc.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_plc))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_plc)
+        invalidate_catalog("PLC")
+        return True, component_id
 
     except Exception as e:
         session.rollback()
@@ -0,0 +1,75 @@
+"""
+Batch spec resolution.
+
+A request is a (kind, spec) pair, e.g. ("Contactor", {"rated_current": 12.5, "brands": [...]}),
+where spec holds the keyword arguments of the matching *_by_* lookup.
+resolve_specs() warms every needed catalog type in one query, answers duplicate
+requests once, and returns the (success, result) pairs in request order.
+"""
+from collections.abc import Mapping
+
+from models.catalog import load_catalog
+from models.items.bimetal import get_bimetal_by_current
+from models.items.contactor import get_contactor_by_current
+from models.items.electric_motor import get_motor_by_spec
+from models.items.electrical_panel import get_electrical_panel_by_spec
+from models.items.general import get_general_by_spec
+from models.items.instrument import get_instrument_by_spec
+from models.items.mccb import get_mccb_by_current
+from models.items.mpcb import get_mpcb_by_current
+from models.items.vfd_softstarter import get_vfd_softstarter_by_power
+from models.items.wire_cable import get_wire_cable_by_spec
+
+
+# kind -> (lookup function, catalog type or None when the spec carries it as "type")
+RESOLVERS = {
+    "Contactor": (get_contactor_by_current, "Contactor"),
+    "MCCB": (get_mccb_by_current, "MCCB"),
+    "MPCB": (get_mpcb_by_current, "MPCB"),
+    "Bimetal": (get_bimetal_by_current, "Bimetal"),
+    "General": (get_general_by_spec, "General"),
+    "Instrument": (get_instrument_by_spec, "Instrument"),
+    "WireCable": (get_wire_cable_by_spec, "WireCable"),
+    "Motor": (get_motor_by_spec, "Motor"),
+    "VFD/SoftStarter": (get_vfd_softstarter_by_power, None),
+    "Electrical Panel": (get_electrical_panel_by_spec, None),
+}
+
+
+def resolve_specs(requests, cache=None):
+    """
+    Resolves a list of (kind, spec) requests with a single catalog pass.
+    With a cache (controllers' LookupCache) the lookups go through it.
+    """
+    requests = list(requests)
+    unknown = [kind for kind, _ in requests if kind not in RESOLVERS]
+    if unknown:
+        raise ValueError(f"Unknown lookup kind: {unknown[0]}")
+
+    load_catalog(_catalog_type(kind, spec) for kind, spec in requests)
+
+    resolved = {}
+    results = []
+    for kind, spec in requests:
+        key = (kind, freeze_key(spec))
+        if key not in resolved:
+            lookup = RESOLVERS[kind][0]
+            resolved[key] = cache.lookup(lookup, **spec) if cache is not None else lookup(**spec)
+        results.append(resolved[key])
+    return results
+
+
+def _catalog_type(kind, spec):
+    component_type = RESOLVERS[kind][1]
+    return component_type if component_type else spec["type"]
+
+
+def freeze_key(value):
+    """
+    Returns value as a hashable key: mappings become sorted (key, value) tuples, sequences tuples.
+    """
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, freeze_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(freeze_key(item) for item in value)
+    return value
@@ -3,8 +3,11 @@ from sqlalchemy.orm import joinedload
 
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import get_user_names
 
 """
 attribute_keys:
@@ -18,6 +21,7 @@ attribute_keys:
 
 def get_all_vfds_softstarters():
     session = SessionLocal()
+    user_names = get_user_names(session)
 
     attribute_keys = ["type", "power", "brand", "order_number", "created_by_id"]
 
@@ -38,9 +42,7 @@ def get_all_vfds_softstarters():
 
         created_by = ""
         if created_by_id:
-            user = session.query(User).filter_by(id=int(created_by_id)).first()
-            if user:
-                created_by = f"{user.first_name} {user.last_name}"
+            created_by = user_names.get(int(created_by_id), created_by)
 
         for supplier in general.suppliers:
             general_data = {
@@ -62,75 +64,39 @@ def get_all_vfds_softstarters():
 
 def get_vfd_softstarter_by_power(type, power, brands=[], order_number=None):
     brands = [b.lower() for b in brands]
-    session = SessionLocal()
     try:
-        components = (
-            session.query(Component)
-            .filter(Component.type == type)  # e.g., "VFD" or "Softstarter"
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-            .all()
-        )
-
-        matching_items = []
-
-        for component in components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-
-            # تطابق نوع
-            if attr_dict.get("type") != type:
-                continue
+        # e.g., "VFD" or "Softstarter"
+        # تطابق نوع و توان
+        query = ComponentQuery(type).equals("type", type).equals("power", power)
 
-            # تطابق توان
-            if attr_dict.get("power") != power:
-                continue
+        # تطابق برند (در صورت وجود لیست برند)
+        if brands:
+            query.one_of("brand", brands)
 
-            # تطابق برند (در صورت وجود لیست برند)
-            brand = attr_dict.get("brand")
-            if brands and brand not in brands:
-                continue
-
-            # تطابق شماره سفارش
-            if order_number and attr_dict.get("order_number") != order_number:
-                continue
-
-            matching_items.append({
-                "component": component,
-                "attr_dict": attr_dict,
-                "latest_supplier": max(component.suppliers, key=lambda s: s.date if s.date else "", default=None)
-            })
-
-        if not matching_items:
-            return False, f"❌ {type} not found"
+        # تطابق شماره سفارش
+        if order_number:
+            query.equals("order_number", order_number)
 
         # انتخاب با جدیدترین تأمین‌کننده
-        best_match = max(
-            matching_items,
-            key=lambda item: item["latest_supplier"].date if item["latest_supplier"] else ""
-        )
+        best_match = query.latest().first()
+        if best_match is None:
+            return False, f"❌ {type} not found"
 
-        supplier = best_match["latest_supplier"]
-        attr = best_match["attr_dict"]
         result = {
-            "id": best_match["component"].id,
-            "type": attr.get("type"),
-            "power": attr.get("power"),
-            "brand": attr.get("brand"),
-            "order_number": attr.get("order_number"),
-            "supplier_name": supplier.supplier.name if supplier else "",
-            "price": supplier.price if supplier else 0,
-            "currency": supplier.currency if supplier else "",
-            "date": str(supplier.date) if supplier else "",
+            "id": best_match.id,
+            "type": best_match.get("type"),
+            "power": best_match.get("power"),
+            "brand": best_match.get("brand"),
+            "order_number": best_match.get("order_number"),
+            "supplier_name": best_match.supplier_name,
+            "price": best_match.price,
+            "currency": best_match.currency,
+            "date": best_match.date,
         }
         return True, result
 
     except Exception as e:
-        session.rollback()
         return False, f"get {type} error:\n{str(e)}"
-    finally:
-        session.close()
 
 
 def insert_vfd_softstarter_to_db(
@@ -144,23 +110,6 @@ def insert_vfd_softstarter_to_db(
     current_user = UserSession()
     session = SessionLocal()
     try:
-        existing_components = (
-            session.query(Component)
-            .filter(Component.type == type)
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for component in existing_components:
-            attr_dict = {attr.key: attr.value for attr in component.attributes}
-            if (
-                    attr_dict.get("type") == type and
-                    attr_dict.get("power") == power and
-                    attr_dict.get("brand") == brand and
-                    attr_dict.get("order_number") == order_number
-            ):
-                return True, component.id  # Already exists
-
         new_component = Component(
             type=type,
             attributes=[
@@ -172,10 +121,13 @@ def insert_vfd_softstarter_to_db(
                 ComponentAttribute(key='created_at', value=today_shamsi),
             ]
         )
-        session.add(new_component)
-        session.flush()
-        session.commit()
-        return True, new_component.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_component))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_component)
+        invalidate_catalog(type)
+        return True, component_id
 
     except Exception as e:
         session.rollback()
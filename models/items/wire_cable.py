@@ -3,8 +3,11 @@ from sqlalchemy.orm import joinedload
 
 from controllers.user_session_controller import UserSession
 from models import Component, ComponentAttribute, ComponentSupplier
+from models.components import add_component_or_get_existing, find_component_by_fingerprint, fingerprint_component
+from models.catalog import invalidate_catalog
+from models.component_query import ComponentQuery
 from utils.database import SessionLocal
-from models.user_model import User
+from models.user_model import get_user_names
 
 """
 attribute_keys:
@@ -20,6 +23,7 @@ attribute_keys:
 
 def get_all_wire_cable():
     session = SessionLocal()
+    user_names = get_user_names(session)
     attribute_keys = ["type", "l_number", "l_size", "note", "brand", "order_number", "created_by_id"]
 
     components = (
@@ -39,9 +43,7 @@ def get_all_wire_cable():
 
         created_by = ""
         if created_by_id:
-            user = session.query(User).filter_by(id=int(created_by_id)).first()
-            if user:
-                created_by = f"{user.first_name} {user.last_name}"
+            created_by = user_names.get(int(created_by_id), created_by)
 
         for supplier in component.suppliers:
             item = {
@@ -72,75 +74,57 @@ def get_all_wire_cable():
 
 
 def get_wire_cable_by_spec(type, l_number, l_size=None, brand=None, note=None):
-    session = SessionLocal()
     try:
-        components = (
-            session.query(Component)
-            .filter(Component.type == "WireCable")
-            .options(
-                joinedload(Component.attributes),
-                joinedload(Component.suppliers).joinedload(ComponentSupplier.supplier)
-            )
-            .all()
+        query = (
+            ComponentQuery("WireCable")
+            .equals("type", type)
+            .number_equals("l_number", int(l_number))
+            .has_number("l_size")
+            .latest()
         )
+        if l_size:
+            query.number_equals("l_size", float(l_size))
+        if brand:
+            query.equals("brand", brand)
+        if note:
+            query.equals("note", note)
 
-        matches = []
-        for comp in components:
-            attr_dict = {attr.key: attr.value for attr in comp.attributes}
-
-            if attr_dict.get("type") != type:
-                continue
-
-            try:
-                l_number_db = int(attr_dict.get("l_number", 0))
-                l_size_db = float(attr_dict.get("l_size", 0))
-            except (ValueError, TypeError):
-                continue
-
-            if l_number_db != int(l_number):
-                continue
-            if l_size and l_size_db != float(l_size):
-                continue
-            if brand and attr_dict.get("brand") != brand:
-                continue
-            if note and attr_dict.get("note") != note:
-                continue
-
-            latest_supplier = max(comp.suppliers, key=lambda s: s.date if s.date else "", default=None)
-            matches.append({
-                "component": comp,
-                "attr_dict": attr_dict,
-                "latest_supplier": latest_supplier
-            })
-
-        if not matches:
+        latest = query.first()
+        if latest is None:
             return False, "❌ Component not found"
 
-        latest = max(matches, key=lambda x: x["latest_supplier"].date if x["latest_supplier"] else "")
-        supplier = latest["latest_supplier"]
-        attr = latest["attr_dict"]
-
         result = {
-            "id": latest["component"].id,
-            "type": attr.get("type"),
-            "l_number": int(attr.get("l_number", 0)),
-            "l_size": float(attr.get("l_size", 0)),
-            "brand": attr.get("brand"),
-            "note": attr.get("note", ""),
-            "order_number": attr.get("order_number", ""),
-            "supplier_name": supplier.supplier.name if supplier else "",
-            "price": supplier.price if supplier else 0,
-            "currency": supplier.currency if supplier else "",
-            "date": str(supplier.date) if supplier else "",
+            "id": latest.id,
+            "type": latest.get("type"),
+            "l_number": int(latest.number("l_number")),
+            "l_size": latest.number("l_size"),
+            "brand": latest.get("brand"),
+            "note": latest.get("note", ""),
+            "order_number": latest.get("order_number", ""),
+            "supplier_name": latest.supplier_name,
+            "price": latest.price,
+            "currency": latest.currency,
+            "date": latest.date,
         }
         return True, result
 
     except Exception as e:
-        session.rollback()
         print(str(e))
         return False, f"❌ Error get wire/cable: {str(e)}"
-    finally:
-        session.close()
+
+
+def wire_cable_attributes(type, l_number, l_size, brand, note=None):
+    """
+    Identifying attributes of a wire/cable, as insert_wire_cable_to_db stores them.
+    """
+    return {
+        "type": type,
+        "l_number": l_number,
+        "l_size": l_size,
+        "brand": brand,
+        "order_number": "",
+        "note": note if note else None,
+    }
 
 
 def insert_wire_cable_to_db(type, l_number, l_size, brand, note=None, created_by_id=None):
@@ -148,47 +132,24 @@ def insert_wire_cable_to_db(type, l_number, l_size, brand, note=None, created_by
     current_user = UserSession()
     session = SessionLocal()
     try:
-        existing = (
-            session.query(Component)
-            .filter(Component.type == "WireCable")
-            .options(joinedload(Component.attributes))
-            .all()
-        )
-
-        for comp in existing:
-            attr_dict = {attr.key: attr.value for attr in comp.attributes}
-            if (
-                    attr_dict.get("type") == type and
-                    attr_dict.get("l_number") == l_number and
-                    attr_dict.get("l_size") == l_size and
-                    attr_dict.get("brand") == brand and
-                    attr_dict.get("order_number") == ""
-            ):
-                if note and attr_dict.get("note") != note:
-                    continue
-                return True, comp.id
-
         created_by_id = created_by_id if created_by_id else str(current_user.id)
-        attributes = [
-            ComponentAttribute(key="type", value=type),
-            ComponentAttribute(key="l_number", value=l_number),
-            ComponentAttribute(key="l_size", value=l_size),
-            ComponentAttribute(key="brand", value=brand),
-            ComponentAttribute(key="order_number", value=""),
-            ComponentAttribute(key="created_by_id", value=str(created_by_id)),
-            ComponentAttribute(key="created_at", value=today_shamsi),
-        ]
-        if note:
-            attributes.append(ComponentAttribute(key="note", value=note))
+        attributes = wire_cable_attributes(type, l_number, l_size, brand, note)
+        attributes["created_by_id"] = str(created_by_id)
+        attributes["created_at"] = today_shamsi
 
+        # a wire/cable without a note has no note attribute
         new_component = Component(
             type="WireCable",
-            attributes=attributes
+            attributes=[ComponentAttribute(key=key, value=value)
+                        for key, value in attributes.items() if value is not None]
         )
-        session.add(new_component)
-        session.flush()
-        session.commit()
-        return True, new_component.id
+        existing_id = find_component_by_fingerprint(session, fingerprint_component(new_component))
+        if existing_id:
+            return True, existing_id  # Already exists
+
+        component_id = add_component_or_get_existing(session, new_component)
+        invalidate_catalog("WireCable")
+        return True, component_id
 
     except Exception as e:
         session.rollback()
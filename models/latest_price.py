@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, Float, ForeignKey
+
+from models import Base
+
+
+class LatestPrice(Base):
+    """
+    One row per component holding its current supplier price.
+    Maintained by update_latest_price() in the same transaction as the price history insert.
+    """
+    __tablename__ = 'latest_price'
+    component_id = Column(Integer, ForeignKey('components.id'), primary_key=True)
+    component_supplier_id = Column(Integer, ForeignKey('component_supplier.id'))
+    supplier_id = Column(Integer, ForeignKey('supplier.id'))
+    price = Column(Float)
+    currency = Column(String)
+    date = Column(String)
+    date_epoch = Column(Integer, index=True)
+
+
+def update_latest_price(session, supplier_link):
+    """
+    Copies the component's newest ComponentSupplier row (see get_latest_supplier_link) into latest_price.
+    Does not commit; the caller owns the transaction.
+    """
+    current = session.get(LatestPrice, supplier_link.component_id)
+    if current is None:
+        current = LatestPrice(component_id=supplier_link.component_id)
+        session.add(current)
+
+    current.component_supplier_id = supplier_link.id
+    current.supplier_id = supplier_link.supplier_id
+    current.price = supplier_link.price
+    current.currency = supplier_link.currency
+    current.date = supplier_link.date
+    current.date_epoch = supplier_link.date_epoch
+    return current
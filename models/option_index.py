@@ -0,0 +1,141 @@
+"""
+Per-type option dictionaries.
+
+For every component type the distinct values of each attribute (brand, coil_voltage,
+ip_rating, efficiency_class, l_size, ...) are counted with one grouped query, both for
+the whole type and per subtype (the "type" attribute, e.g. Instrument --> "Pressure Gauge").
+Combo boxes fill from here with the values that actually exist for that type.
+
+A type is cached with the catalog_version it was built at; load_options() rebuilds only
+the types whose version moved, so writes from any process show up on the next load.
+"""
+import threading
+
+from sqlalchemy import text
+
+from models.catalog_version import get_catalog_versions
+from models.components import get_component_types
+from utils.database import SessionLocal
+
+_options = {}  # component type -> {(subtype, key): {value: count}}, subtype None = whole type
+_versions = {}  # component type -> catalog_version it was built at
+_options_lock = threading.RLock()
+
+_OPTIONS_SQL = """
+    SELECT c.type, t.value AS subtype, a.key, a.value, COUNT(*) AS count
+    FROM components c
+    JOIN component_attributes a ON a.component_id = c.id
+    LEFT JOIN component_attributes t ON t.component_id = c.id AND t.key = 'type'
+    WHERE c.type IN ({types}) AND a.value IS NOT NULL AND TRIM(a.value) != ''
+    GROUP BY c.type, t.value, a.key, a.value
+"""
+
+
+def get_options(component_type, key, subtype=None):
+    """
+    Returns the distinct values of an attribute for a component type (optionally one
+    subtype), most used first. The type is built on first use.
+    """
+    with _options_lock:
+        options = _options.get(component_type)
+        if options is None:
+            options = _build_options([component_type])[component_type]
+            _options[component_type] = options
+        counts = options.get((subtype, key), {})
+    return _most_used_first(counts)
+
+
+def get_option_index(component_types=None):
+    """
+    Returns (True, {component type: {(subtype, key): values, most used first}}) for several
+    component types (default: all of them), loaded as load_options() does; or (False, message).
+    """
+    try:
+        load_options(component_types)
+        with _options_lock:
+            if component_types is None:
+                component_types = list(_options)
+            return True, {t: {scope: _most_used_first(counts) for scope, counts in _options.get(t, {}).items()}
+                          for t in dict.fromkeys(component_types)}
+    except Exception as e:
+        return False, f"❌ Error loading options: {str(e)}"
+
+
+def get_all_options(key):
+    """
+    Returns the distinct values of an attribute across every component type, spelled
+    as most used and compared case-insensitively ("Siemens" and "siemens" are one value).
+    """
+    load_options()
+    counts = {}
+    with _options_lock:
+        for options in _options.values():
+            for value, count in options.get((None, key), {}).items():
+                counts.setdefault(value.lower(), {}).setdefault(value, 0)
+                counts[value.lower()][value] += count
+    spellings = [max(values, key=values.get) for values in counts.values()]
+    return sorted(spellings, key=str.lower)
+
+
+def load_options(component_types=None):
+    """
+    Builds the dictionaries of several component types (default: all of them) with a
+    single query, first dropping the cached types another write has changed.
+    """
+    with _options_lock:
+        session = SessionLocal()
+        try:
+            versions = get_catalog_versions(session)
+            if component_types is None:
+                component_types = get_component_types(session)
+        finally:
+            session.close()
+
+        for component_type in list(_options):
+            if _versions.get(component_type) != versions.get(component_type, 0):
+                invalidate_options(component_type)
+
+        missing = [t for t in dict.fromkeys(component_types) if t not in _options]
+        if missing:
+            _options.update(_build_options(missing, versions))
+
+
+def invalidate_options(component_type=None):
+    """
+    Drops one component type's dictionaries, or all of them.
+    """
+    with _options_lock:
+        if component_type is None:
+            _options.clear()
+            _versions.clear()
+        else:
+            _options.pop(component_type, None)
+            _versions.pop(component_type, None)
+
+
+def _most_used_first(counts):
+    return sorted(counts, key=lambda value: (-counts[value], value.lower()))
+
+
+def _build_options(component_types, versions=None):
+    params = {f"type_{i}": t for i, t in enumerate(component_types)}
+    statement = text(_OPTIONS_SQL.format(types=", ".join(f":{name}" for name in params)))
+
+    session = SessionLocal()
+    try:
+        if versions is None:
+            versions = get_catalog_versions(session)
+        rows = session.execute(statement, params).all()
+    finally:
+        session.close()
+
+    options = {t: {} for t in component_types}
+    for component_type, subtype, key, value, count in rows:
+        type_options = options[component_type]
+        for scope in ((None, key), (subtype, key)) if subtype is not None else ((None, key),):
+            counts = type_options.setdefault(scope, {})
+            counts[value] = counts.get(value, 0) + count
+
+    for component_type in component_types:
+        _versions[component_type] = versions.get(component_type, 0)
+    return options
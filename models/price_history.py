@@ -0,0 +1,152 @@
+"""
+Price history over component_supplier.
+
+Every price row ever saved (data entry, bulk imports, the elica/barghsan updaters) is
+kept in component_supplier; these helpers read it over a date range as a DataFrame and
+compute statistics with pandas/NumPy.
+
+Dates are Jalali strings as stored ("1404/03/28 11:36") or epoch seconds; filtering
+and sorting use the indexed date_epoch column.
+Currencies are compared case-insensitively, as in models/exchange_rate.py.
+Results follow the (success, result) convention.
+"""
+import calendar
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+
+from config import BASE_CURRENCY
+from models import Component, ComponentSupplier, Supplier
+from models.exchange_rate import normalize_currencies
+from utils.database import SessionLocal
+from utils.jalali import jalali_to_epoch
+
+SECONDS_PER_YEAR = 365.2425 * 24 * 3600
+
+HISTORY_COLUMNS = [
+    "component_id", "type", "supplier_id", "supplier_name", "price", "currency", "date", "date_epoch"
+]
+
+
+def get_price_history(component_id=None, component_type=None, date_from=None, date_to=None):
+    """
+    Returns (True, DataFrame) with one row per saved price, oldest first, filtered by
+    component and/or component type and an inclusive date range. Currency codes are
+    upper-cased, and a missing code is BASE_CURRENCY.
+    """
+    epoch_from, epoch_to = _to_epoch(date_from), _to_epoch(date_to)
+    for date, epoch in ((date_from, epoch_from), (date_to, epoch_to)):
+        if date is not None and epoch is None:
+            return False, f"❌ Unrecognized date: {date}"
+
+    session = SessionLocal()
+    try:
+        statement = (
+            select(
+                ComponentSupplier.component_id,
+                Component.type,
+                ComponentSupplier.supplier_id,
+                Supplier.name.label("supplier_name"),
+                ComponentSupplier.price,
+                ComponentSupplier.currency,
+                ComponentSupplier.date,
+                ComponentSupplier.date_epoch,
+            )
+            .join(Component, Component.id == ComponentSupplier.component_id)
+            .outerjoin(Supplier, Supplier.id == ComponentSupplier.supplier_id)
+            .order_by(ComponentSupplier.date_epoch, ComponentSupplier.id)
+        )
+        if component_id is not None:
+            statement = statement.where(ComponentSupplier.component_id == component_id)
+        if component_type is not None:
+            statement = statement.where(Component.type == component_type)
+        if epoch_from is not None:
+            statement = statement.where(ComponentSupplier.date_epoch >= epoch_from)
+        if epoch_to is not None:
+            statement = statement.where(ComponentSupplier.date_epoch <= epoch_to)
+
+        rows = session.execute(statement).all()
+        history = pd.DataFrame(rows, columns=HISTORY_COLUMNS)
+        history["currency"] = normalize_currencies(history["currency"])
+        return True, history
+    except Exception as e:
+        return False, f"❌ Error loading price history: {str(e)}"
+    finally:
+        session.close()
+
+
+def get_supplier_price_stats(component_id=None, component_type=None, date_from=None, date_to=None):
+    """
+    Returns (True, DataFrame) with count/min/median/max and first/last date per supplier and currency.
+    """
+    success, history = get_price_history(component_id, component_type, date_from, date_to)
+    if not success:
+        return False, history
+
+    grouped = history.groupby(["supplier_name", "currency"], dropna=False)
+    stats = grouped["price"].agg(["count", "min", "median", "max"])
+    stats["first_date"] = grouped["date"].first()
+    stats["last_date"] = grouped["date"].last()
+    return True, stats.reset_index()
+
+
+def get_price_trend(component_id=None, component_type=None, date_from=None, date_to=None, currency=BASE_CURRENCY):
+    """
+    Fits log(price) against time over the history, one intercept per component, so a
+    type-wide trend is not skewed by mixing cheap and expensive parts.
+
+    Returns (True, {"annual_rate", "components", "samples"}) where annual_rate is the
+    yearly inflation as a fraction (0.35 --> +35% per year), or (False, message) when
+    the history is too short to fit.
+    """
+    success, history = get_price_history(component_id, component_type, date_from, date_to)
+    if not success:
+        return False, history
+
+    in_currency = history["currency"] == currency.upper()
+    history = history[in_currency & (history["price"] > 0) & history["date_epoch"].notna()]
+    if history.empty:
+        return False, "❌ No price history in this range"
+
+    years = history["date_epoch"].to_numpy(dtype=float) / SECONDS_PER_YEAR
+    log_price = np.log(history["price"].to_numpy(dtype=float))
+    groups = history["component_id"].to_numpy()
+
+    # within-component deviations remove each component's own price level
+    years -= pd.Series(years).groupby(groups).transform("mean").to_numpy()
+    log_price -= pd.Series(log_price).groupby(groups).transform("mean").to_numpy()
+
+    spread = np.dot(years, years)
+    if spread == 0:
+        return False, "❌ Not enough dated prices to compute a trend"
+
+    slope = np.dot(years, log_price) / spread
+    return True, {
+        "annual_rate": float(np.expm1(slope)),
+        "components": int(history["component_id"].nunique()),
+        "samples": int(len(history)),
+    }
+
+
+def project_price(price, annual_rate, to_date, from_date=None):
+    """
+    Compounds a price from from_date (default: now) to to_date at annual_rate and returns
+    (True, projected price) or (False, message). Works element-wise on NumPy arrays and
+    pandas Series as well as plain numbers.
+    """
+    # epochs are wall clock, like jalali_to_epoch
+    start = _to_epoch(from_date) if from_date is not None else calendar.timegm(datetime.now().timetuple())
+    end = _to_epoch(to_date)
+    for date, epoch in ((from_date, start), (to_date, end)):
+        if epoch is None:
+            return False, f"❌ Unrecognized date: {date}"
+    return True, price * (1 + annual_rate) ** ((end - start) / SECONDS_PER_YEAR)
+
+
+def _to_epoch(value):
+    """Epoch seconds of a Jalali date or epoch; None when value is None or not a date."""
+    if value is None or isinstance(value, (int, float, np.integer, np.floating)):
+        return value
+    return jalali_to_epoch(value)
@@ -3,6 +3,7 @@ from sqlalchemy.ext.declarative import declarative_base
 import json
 from models.abs_motor import Motor
 from utils.database import SessionLocal
+from utils.jalali import jalali_to_epoch
 import jdatetime
 import traceback
 
@@ -21,6 +22,7 @@ class Project(Base):
     revision = Column(Integer)
     modified_by_id = Column(Integer)
     modified_at = Column(String)
+    modified_at_epoch = Column(Integer, index=True)
     project_electrical_specs = Column(Text)
 
     def serialize_project_data(self, data: dict) -> dict:
@@ -47,6 +49,7 @@ def save_project(current_project):
     saving_project.revision = current_project.revision
     saving_project.modified_by_id = current_project.modified_by_id
     saving_project.modified_at = today_shamsi
+    saving_project.modified_at_epoch = jalali_to_epoch(today_shamsi)
     saving_project.set_data(current_project.project_electrical_specs)
 
     session = SessionLocal()
@@ -55,6 +58,7 @@ def save_project(current_project):
             session.query(Project).filter(Project.id == saving_project.id).update({
                 Project.modified_by_id: saving_project.modified_by_id,
                 Project.modified_at: saving_project.modified_at,
+                Project.modified_at_epoch: saving_project.modified_at_epoch,
                 Project.project_electrical_specs: saving_project.project_electrical_specs,
             })
         else:  # save new revision as new record
@@ -87,7 +91,7 @@ def get_project(project_id=None, code=None, unique_no=None, revision=None):
         if revision is not None:
             query = query.filter(Project.revision == revision)
         else:
-            query = query.order_by(Project.revision.desc())
+            query = query.order_by(Project.revision.desc(), Project.modified_at_epoch.desc())
 
         project = query.first()
 
@@ -1,7 +1,7 @@
 import jdatetime
 from sqlalchemy import Column, String, Integer
 from utils.database import SessionLocal
-from views.message_box_view import show_message
+from utils.jalali import jalali_epoch_default
 from models import Base
 import hashlib
 
@@ -22,10 +22,21 @@ class User(Base):
     email = Column(String, unique=True, nullable=True)
     role = Column(String, nullable=False)
     created_at = Column(String, nullable=False, default=now_jalali)
+    created_at_epoch = Column(Integer, index=True, default=jalali_epoch_default("created_at"))
 
     def __repr__(self):
         return f"<User(username='{self.username}', role='{self.role}')>"
 
+def get_user_names(session):
+    """
+    Returns {user id: "first last"} for every user with a single query.
+    """
+    return {
+        user_id: f"{first_name} {last_name}"
+        for user_id, first_name, last_name in session.query(User.id, User.first_name, User.last_name)
+    }
+
+
 def get_all_users():
     session = SessionLocal()
     try:
@@ -33,6 +44,7 @@ def get_all_users():
         return True, users
     except Exception as e:
         session.rollback()
+        from views.message_box_view import show_message  # Qt only when there is a message to show
         show_message(f"Something went wrong while fetching users:\n{str(e)}", "Error")
         return False, []
     finally:
@@ -41,6 +53,8 @@ def get_all_users():
 
 
 def get_user_by_username(username: str, password: str):
+    from views.message_box_view import show_message  # login runs inside the Qt app
+
     session = SessionLocal()
     try:
         user = session.query(User).filter_by(username=username).first()
@@ -0,0 +1,25 @@
+import pytest
+from sqlalchemy import create_engine, event
+
+from models import Base
+from utils.database import SessionLocal, engine as app_engine
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Points SessionLocal at an empty database; yields (engine, list of the statements it executes)."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    SessionLocal.configure(bind=engine)
+
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    try:
+        yield engine, statements
+    finally:
+        SessionLocal.configure(bind=app_engine)
+        engine.dispose()
@@ -0,0 +1,65 @@
+"""
+bulk_upsert_components must keep a dated price row per imported item, like row-by-row saving.
+"""
+from sqlalchemy import select
+
+from models import ComponentSupplier, LatestPrice, Supplier
+from models.bulk_import import bulk_upsert_components
+from models.items.contactor import contactor_attributes, insert_contactor_to_db
+from models.items.mccb import insert_mccb_to_db, mccb_attributes
+from models.items.mpcb import insert_mpcb_to_db, mpcb_attributes
+from models.items.wire_cable import insert_wire_cable_to_db, wire_cable_attributes
+from utils.database import SessionLocal
+
+
+def contactor(order_number, price):
+    return {
+        "attributes": {"brand": "schneider electric", "order_number": order_number,
+                       "rated_current": "9.0", "coil_voltage": "220.0"},
+        "supplier_id": 1,
+        "price": price,
+        "currency": "IRR",
+    }
+
+
+def test_reimport_records_every_price(database):
+    session = SessionLocal()
+    session.add(Supplier(id=1, name="supplier"))
+    session.commit()
+
+    assert bulk_upsert_components("Contactor", [contactor("LC1D09", 100), contactor("LC1D12", 200)], 1) \
+        == (True, {"inserted": 2, "updated": 0, "unchanged": 0})
+    assert bulk_upsert_components("Contactor", [contactor("LC1D09", 100), contactor("LC1D12", 250)], 1) \
+        == (True, {"inserted": 0, "updated": 1, "unchanged": 1})
+
+    prices = session.execute(
+        select(ComponentSupplier.component_id, ComponentSupplier.price).order_by(ComponentSupplier.id)
+    ).all()
+    latest = dict(session.execute(select(LatestPrice.component_id, LatestPrice.component_supplier_id)).all())
+    newest = dict(session.execute(
+        select(ComponentSupplier.component_id, ComponentSupplier.id).order_by(ComponentSupplier.id)
+    ).all())
+    session.close()
+
+    assert [price for _, price in prices] == [100, 200, 100, 250]
+    assert latest == newest  # latest_price follows the newest row, also for the unchanged price
+
+
+def test_import_finds_components_saved_one_by_one(database):
+    session = SessionLocal()
+    session.add(Supplier(id=1, name="supplier"))
+    session.commit()
+    session.close()
+
+    saved = {
+        "Contactor": (insert_contactor_to_db, contactor_attributes, ("Schneider Electric", "LC1D09", 9, "220")),
+        "MCCB": (insert_mccb_to_db, mccb_attributes, ("ABB", "XT1", "160", 36)),
+        "MPCB": (insert_mpcb_to_db, mpcb_attributes, ("Siemens", "3RV2011", "1.1", 1.6, 100, "10")),
+        "WireCable": (insert_wire_cable_to_db, wire_cable_attributes, ("Power", "4", "16", "Kabl Sazi", None)),
+    }
+    for component_type, (insert_to_db, attributes, values) in saved.items():
+        success, component_id = insert_to_db(*values, created_by_id=1)
+        assert success, component_id
+        item = {"attributes": attributes(*values), "supplier_id": 1, "price": 100, "currency": "IRR"}
+        assert bulk_upsert_components(component_type, [item], 1) \
+            == (True, {"inserted": 0, "updated": 1, "unchanged": 0}), component_type
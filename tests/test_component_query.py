@@ -0,0 +1,51 @@
+"""
+The SQL path and the catalog path of ComponentQuery must agree.
+"""
+import pytest
+from sqlalchemy import create_engine, literal, select
+
+import models.catalog as catalog
+from models import Component, ComponentAttribute, LatestPrice
+from models.catalog import _parse_number
+from models.component_query import ComponentQuery, _numeric
+from utils.database import SessionLocal
+
+VALUES = ["12", " 12.5 ", "1,250", "-3", "+4", "5.", ".5", "1e3", "2.5E-2", "\t7\n",
+          "", " ", ".", "+", "-", "e", "E5", "1e", "1e+", "1.2.3", "--1", "1-2", "12A", "abc", "1 2", "inf", "nan",
+          "1_000"]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_numeric_matches_parse_number(value):
+    number, is_number = _numeric(literal(value))
+    with create_engine("sqlite://").connect() as connection:
+        sql_number, sql_is_number = connection.execute(select(number, is_number)).one()
+
+    expected = _parse_number(value)
+    assert bool(sql_is_number) == (expected is not None)
+    if expected is not None:
+        assert sql_number == expected
+
+
+def test_latest_orders_by_epoch(database, monkeypatch):
+    monkeypatch.setattr(catalog, "get_catalog_snapshot", lambda *args, **kwargs: None)
+    # the display strings sort the other way round ("1404/9/05" > "1404/10/01")
+    dates = {1: ("1404/9/05 10:00", 1000), 2: ("1404/10/01 10:00", 2000), 3: (None, None)}
+    session = SessionLocal()
+    for component_id, (date, epoch) in dates.items():
+        session.add(Component(id=component_id, type="General", fingerprint=str(component_id),
+                              attributes=[ComponentAttribute(key="brand", value="abb")]))
+        if date:
+            session.add(LatestPrice(component_id=component_id, price=1, currency="IRR", date=date, date_epoch=epoch))
+    session.commit()
+    session.close()
+
+    catalog.invalidate_catalog()
+    try:
+        from_database = ComponentQuery("General").latest().first()
+        catalog.load_catalog(["General"])
+        from_catalog = ComponentQuery("General").latest().first()
+    finally:
+        catalog.invalidate_catalog()
+
+    assert from_database.id == from_catalog.id == 2
@@ -0,0 +1,40 @@
+"""
+Currency codes convert case-insensitively, whichever side spells them lower-case.
+"""
+import pandas as pd
+
+from models.exchange_rate import convert_amount, convert_currency, get_exchange_rates, insert_exchange_rate_to_db
+
+
+def test_saved_rates_convert_any_spelling(database):
+    assert insert_exchange_rate_to_db("usd", 1000, date="1404/01/01 10:00") == (True, None)
+    assert insert_exchange_rate_to_db("Eur", 1200, date="1404/01/01 10:00") == (True, None)
+    success, rates = get_exchange_rates()
+    assert success and rates == {"USD": 1000.0, "EUR": 1200.0, "IRR": 1.0}
+
+    df = pd.DataFrame({"price": [2, 3, 5, 7], "total_price": [4, 3, 5, 7], "currency": ["usd", "USD", "eur", ""]})
+    success, converted = convert_currency(df, rates)
+    assert success
+    assert converted["total_price"].tolist() == [4000, 3000, 6000, 7]
+    assert set(converted["currency"]) == {"IRR"}
+
+    assert convert_amount(2, "Usd", {"usd": 1000, "irr": 1}) == (True, 2000)
+
+
+def test_missing_rate_is_reported_upper_case():
+    df = pd.DataFrame({"price": [1], "total_price": [1], "currency": ["gbp"]})
+    assert convert_currency(df, {"IRR": 1.0}) == (False, "❌ No exchange rate for GBP")
+
+
+def test_empty_table_converts():
+    df = pd.DataFrame({"price": [], "total_price": [], "currency": pd.Categorical([])})
+    success, converted = convert_currency(df, {"IRR": 1.0})
+    assert success and converted.empty
+
+
+def test_set_rate_is_not_saved_when_migrations_fail(database, monkeypatch, capsys):
+    import batch_pricing
+    monkeypatch.setattr(batch_pricing, "run_migrations", lambda: (False, "❌ Database migration failed:\nboom"))
+    assert batch_pricing.main(["--set-rate", "USD=1000"]) == 1
+    assert "boom" in capsys.readouterr().err
+    assert get_exchange_rates() == (True, {"IRR": 1.0})
@@ -0,0 +1,92 @@
+"""
+The get_all_* listings must run a fixed number of queries, however many components and
+price rows they list (no per-row lookup of creator names or suppliers).
+"""
+import pytest
+
+from models import Base, Component, ComponentAttribute, ComponentSupplier, Supplier, User
+from models.items.bimetal import get_all_bimetals
+from models.items.contactor import get_all_contactors
+from models.items.electric_motor import get_all_motors
+from models.items.electrical_panel import get_all_electrical_panel
+from models.items.general import get_all_generals
+from models.items.instrument import get_all_instruments
+from models.items.mccb import get_all_mccbs
+from models.items.mpcb import get_all_mpcbs
+from models.items.plc import get_all_plcs
+from models.items.vfd_softstarter import get_all_vfds_softstarters
+from models.items.wire_cable import get_all_wire_cable
+from utils.database import SessionLocal
+
+# listing -> component type it lists
+LISTINGS = {
+    get_all_bimetals: "Bimetal",
+    get_all_contactors: "Contactor",
+    get_all_motors: "Motor",
+    get_all_electrical_panel: "Electrical Panel",
+    get_all_generals: "General",
+    get_all_instruments: "Instrument",
+    get_all_mccbs: "MCCB",
+    get_all_mpcbs: "MPCB",
+    get_all_plcs: "PLC",
+    get_all_vfds_softstarters: "VFD",
+    get_all_wire_cable: "WireCable",
+}
+PRICES_PER_COMPONENT = 2
+
+
+def seed(session, count):
+    users = [User(id=i, username=f"user{i}", password="-", first_name="First", last_name=f"Last{i}", role="admin")
+             for i in range(1, 4)]
+    suppliers = [Supplier(name=f"supplier {i}") for i in range(3)]
+    session.add_all(users + suppliers)
+    session.flush()
+
+    for component_type in LISTINGS.values():
+        for n in range(count):
+            creator = users[n % len(users)].id
+            component = Component(type=component_type, fingerprint=f"{component_type}-{n}")
+            component.attributes = [
+                ComponentAttribute(key="brand", value="brand"),
+                ComponentAttribute(key="order_number", value=f"{component_type}-{n}"),
+                ComponentAttribute(key="rated_current", value="10"),
+                ComponentAttribute(key="coil_voltage", value="220"),
+                ComponentAttribute(key="l_number", value="3"),
+                ComponentAttribute(key="l_size", value="2.5"),
+                ComponentAttribute(key="created_by_id", value=str(creator)),
+            ]
+            component.suppliers = [
+                ComponentSupplier(supplier=suppliers[p % len(suppliers)], price=1000 + p, currency="IRR",
+                                  date=f"1404/01/{p + 1:02d} 10:00", date_epoch=p, created_by_id=creator)
+                for p in range(PRICES_PER_COMPONENT)
+            ]
+            session.add(component)
+    session.commit()
+
+
+def query_count(statements, listing):
+    statements.clear()
+    rows = listing()
+    return len(statements), rows
+
+
+@pytest.mark.parametrize("listing", list(LISTINGS), ids=lambda listing: listing.__name__)
+def test_listing_query_count_is_constant(database, listing):
+    engine, statements = database
+    counts = []
+    for count in (1, 20):
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        session = SessionLocal()
+        try:
+            seed(session, count)
+        finally:
+            session.close()
+
+        queries, rows = query_count(statements, listing)
+        assert len(rows) == count * PRICES_PER_COMPONENT
+        assert {row["created_by"] for row in rows} <= {f"First Last{i}" for i in range(1, 4)}
+        counts.append(queries)
+
+    assert counts[0] == counts[1], f"{listing.__name__} ran {counts[0]} queries for 1 component, {counts[1]} for 20"
+    assert counts[1] <= 2
@@ -0,0 +1,14 @@
+"""
+Every lookup of a build, the electric motor's included, goes through the build's LookupCache.
+"""
+from controllers.tender_application.lookup_cache_controller import LookupCache
+from controllers.tender_application.panel_build_controller import build_panels
+from controllers.tender_application.project_session_controller import ProjectSession, freeze_specs
+
+
+def test_electric_motor_lookup_is_memoized(database):
+    specs = freeze_specs(ProjectSession().project_electrical_specs)
+    lookup_cache = LookupCache(specs["project_info"]["proj_avl"])
+    for _ in range(2):
+        build_panels(specs, with_electric_motor=True, lookup_cache=lookup_cache, names=[])
+    assert lookup_cache.stats()["functions"]["get_motor_by_spec"] == (1, 1)
@@ -0,0 +1,46 @@
+"""
+The option index the combo boxes fill from, per type and per subtype, most used first.
+"""
+from models import Component, ComponentAttribute
+from models.option_index import get_option_index, invalidate_options
+from utils.database import SessionLocal
+
+
+def add(session, component_type, **attributes):
+    component = Component(type=component_type, fingerprint=f"{component_type}-{len(session.new)}-{attributes}")
+    component.attributes = [ComponentAttribute(key=key, value=value) for key, value in attributes.items()]
+    session.add(component)
+
+
+def test_option_index_per_type_and_subtype(database):
+    session = SessionLocal()
+    try:
+        add(session, "Instrument", type="Pressure Gauge", brand="wika")
+        add(session, "Instrument", type="Pressure Gauge", brand="DBL")
+        add(session, "Instrument", type="Level Switch", brand="DBL")
+        add(session, "Motor", brand="Siemens")
+        session.commit()
+    finally:
+        session.close()
+
+    invalidate_options()
+    try:
+        success, option_index = get_option_index(["Instrument", "Motor"])
+        assert success, option_index
+        assert option_index["Instrument"][(None, "brand")] == ["DBL", "wika"]
+        assert option_index["Instrument"][("Pressure Gauge", "brand")] == ["DBL", "wika"]
+        assert option_index["Instrument"][("Level Switch", "brand")] == ["DBL"]
+        assert option_index["Motor"][(None, "brand")] == ["Siemens"]
+    finally:
+        invalidate_options()
+
+
+def test_option_index_reports_errors(database, monkeypatch):
+    import models.option_index as option_index
+
+    def fail(component_types, versions=None):
+        raise RuntimeError("no such table")
+
+    monkeypatch.setattr(option_index, "_build_options", fail)
+    invalidate_options()
+    assert get_option_index(["Motor"]) == (False, "❌ Error loading options: no such table")
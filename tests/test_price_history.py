@@ -0,0 +1,77 @@
+"""
+Price history reads every saved price row; currencies compare case-insensitively.
+"""
+import pytest
+
+from models import Component, ComponentSupplier, Supplier
+from models.price_history import get_price_history, get_price_trend, get_supplier_price_stats, project_price
+from utils.database import SessionLocal
+from utils.jalali import jalali_to_epoch
+
+# component -> [(supplier, price, currency, date)]; every price doubles in a year
+PRICES = {
+    "Contactor-1": [("elica", 100, "irr", "1402/01/01 10:00"), ("elica", 200, "IRR", "1403/01/01 10:00")],
+    "Contactor-2": [("barghsan", 1000, "Irr", "1402/01/01 10:00"), ("barghsan", 2000, "", "1403/01/01 10:00"),
+                    ("barghsan", 30, "usd", "1402/06/01 10:00")],
+}
+
+
+@pytest.fixture
+def history(database):
+    session = SessionLocal()
+    try:
+        suppliers = {name: Supplier(name=name) for name in ("elica", "barghsan")}
+        for fingerprint, prices in PRICES.items():
+            component = Component(type="Contactor", fingerprint=fingerprint)
+            component.suppliers = [ComponentSupplier(supplier=suppliers[supplier], price=price, currency=currency,
+                                                     date=date) for supplier, price, currency, date in prices]
+            session.add(component)
+        session.commit()
+    finally:
+        session.close()
+
+
+def test_price_history_is_filtered_and_oldest_first(history):
+    success, rows = get_price_history(component_type="Contactor")
+    assert success, rows
+    assert len(rows) == 5
+    assert rows["date_epoch"].is_monotonic_increasing
+    assert set(rows["currency"]) == {"IRR", "USD"}
+
+    success, rows = get_price_history(component_type="Contactor", date_from="1402/03/01 00:00",
+                                      date_to=jalali_to_epoch("1402/12/29 00:00"))
+    assert success and rows["price"].tolist() == [30]
+
+    success, rows = get_price_history(component_type="Motor")
+    assert success and rows.empty
+
+
+def test_supplier_price_stats(history):
+    success, stats = get_supplier_price_stats(component_type="Contactor")
+    assert success, stats
+    stats = stats.set_index(["supplier_name", "currency"])
+    assert stats.loc[("barghsan", "IRR"), ["count", "min", "median", "max"]].tolist() == [2, 1000, 1500, 2000]
+    assert stats.loc[("barghsan", "USD"), "count"] == 1
+    assert stats.loc[("elica", "IRR"), "first_date"] == "1402/01/01 10:00"
+    assert stats.loc[("elica", "IRR"), "last_date"] == "1403/01/01 10:00"
+
+
+def test_price_trend_matches_any_currency_spelling(history):
+    success, trend = get_price_trend(component_type="Contactor", currency="irr")
+    assert success, trend
+    assert trend["components"] == 2 and trend["samples"] == 4
+    assert trend["annual_rate"] == pytest.approx(1.0, abs=0.01)
+
+    assert get_price_trend(component_type="Contactor", currency="EUR") == (False, "❌ No price history in this range")
+
+
+def test_project_price(history):
+    start = jalali_to_epoch("1403/01/01 00:00")
+    success, price = project_price(100, 1.0, start + 2 * 365.2425 * 24 * 3600, from_date=start)
+    assert success and price == pytest.approx(400)
+
+
+def test_bad_dates_are_reported(history):
+    assert get_price_history(date_from="someday") == (False, "❌ Unrecognized date: someday")
+    assert get_supplier_price_stats(date_to="1403/13/45") == (False, "❌ Unrecognized date: 1403/13/45")
+    assert project_price(100, 0.3, "someday") == (False, "❌ Unrecognized date: someday")
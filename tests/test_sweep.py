@@ -0,0 +1,46 @@
+"""
+A sweep never returns a matrix priced across two catalog versions.
+"""
+import copy
+from itertools import chain, repeat
+
+import models.catalog as catalog
+from controllers.tender_application import sweep_controller
+from controllers.tender_application.project_session_controller import ProjectSession
+from controllers.tender_application.sweep_controller import MAX_ATTEMPTS, sweep
+
+RATES = {"IRR": 1.0}
+GRID = {"project_info.l_voltage": [380, 400]}
+
+
+def specs():
+    return copy.deepcopy(ProjectSession().project_electrical_specs)
+
+
+def run(monkeypatch, versions):
+    monkeypatch.setattr(catalog, "get_catalog_snapshot", lambda *args, **kwargs: None)
+    reads = []
+
+    def catalog_versions():
+        reads.append(None)
+        return next(versions)
+
+    monkeypatch.setattr(sweep_controller, "_catalog_versions", catalog_versions)
+    try:
+        return sweep(specs(), GRID, RATES), len(reads)
+    finally:
+        catalog.invalidate_catalog()
+
+
+def test_sweep_reruns_when_the_catalog_changes(database, monkeypatch):
+    # changed between the first start and end, stable from then on
+    (success, result), reads = run(monkeypatch, chain([{"Contactor": 1}], repeat({"Contactor": 2})))
+    assert success, result
+    assert result["total"].shape == (2,)
+    assert reads == 4  # two attempts
+
+
+def test_sweep_fails_when_the_catalog_keeps_changing(database, monkeypatch):
+    (success, message), reads = run(monkeypatch, ({"Contactor": n} for n in range(100)))
+    assert not success and "catalog changed" in message
+    assert reads == 2 * MAX_ATTEMPTS
@@ -0,0 +1,13 @@
+def add_combo_options(combo, values):
+    """
+    Appends the values a QComboBox does not list yet, compared case-insensitively, so the
+    static items (and the placeholder at index 0) stay in place. Filler values such as
+    "-" are skipped. Adding items does not change the current selection.
+    """
+    existing = {combo.itemText(i).strip().lower() for i in range(combo.count())}
+    for value in values:
+        value = value.strip()
+        if value.lower() in existing or not any(ch.isalnum() for ch in value):
+            continue
+        combo.addItem(value)
+        existing.add(value.lower())
@@ -1,7 +1,8 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from config import DATABASE_PATH
+from sqlalchemy.pool import QueuePool
+from config import DATABASE_PATH, DATABASE_ECHO, DATABASE_POOL_SIZE, DATABASE_MAX_OVERFLOW, DATABASE_PRAGMAS
 
 
 # Database URL—for SQLite, a file named 'database.db' is used
@@ -9,13 +10,28 @@ DATABASE_URL = DATABASE_PATH
 
 # Create the engine without auto-creating database
 engine = create_engine(
-    DATABASE_URL, 
-    echo=True, 
+    DATABASE_URL,
+    echo=DATABASE_ECHO,
     connect_args={"check_same_thread": False},
-    poolclass=None  # Prevents pool creation for non-existent database
+    poolclass=QueuePool,
+    pool_size=DATABASE_POOL_SIZE,
+    max_overflow=DATABASE_MAX_OVERFLOW,
 )
 
 
+@event.listens_for(engine, "connect")
+def _apply_pragmas(dbapi_connection, connection_record):
+    """
+    Applies the configured PRAGMA profile to every new pooled connection.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in DATABASE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+    finally:
+        cursor.close()
+
+
 # Create a configured "Session" class with autocommit disabled to enforce transactions
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -0,0 +1,62 @@
+"""
+Canonical component fingerprints.
+
+A fingerprint is a hash of the component type plus its normalized identifying attributes.
+It is stored in components.fingerprint (unique index), so de-duplication before insert
+is a single indexed probe instead of a scan over every component of the type.
+"""
+import hashlib
+
+
+# component type -> attribute keys that identify a component of that type
+IDENTITY_KEYS = {
+    "Contactor": ("brand", "order_number", "rated_current", "coil_voltage"),
+    "MCCB": ("brand", "order_number", "rated_current", "breaking_capacity"),
+    "MPCB": ("brand", "order_number", "min_current", "max_current", "breaking_capacity", "trip_class"),
+    "Bimetal": ("brand", "order_number", "min_current", "max_current", "class", "trip_time"),
+    "Motor": ("power", "rpm", "voltage", "brand", "start_type", "cooling_method", "ip_rating",
+              "efficiency_class", "painting_ral", "thermal_protection", "is_official", "is_routine"),
+    "General": ("type", "specification", "brand", "order_number"),
+    "Instrument": ("type", "hart_comminucation", "brand", "order_number"),
+    "PLC": ("series", "model", "order_number"),
+    "WireCable": ("type", "l_number", "l_size", "brand", "order_number", "note"),
+    "VFD": ("type", "power", "brand", "order_number"),
+    "SoftStarter": ("type", "power", "brand", "order_number"),
+    "Electrical Panel": ("type", "width", "height", "depth", "brand", "order_number", "ip_rating"),
+    "Local Box": ("type", "width", "height", "depth", "brand", "order_number", "ip_rating"),
+    "Junction Box": ("type", "width", "height", "depth", "brand", "order_number", "ip_rating"),
+}
+
+# bookkeeping attributes never take part in identity
+NON_IDENTITY_KEYS = {"created_by_id", "created_at"}
+
+NUMERIC_KEYS = {
+    "rated_current", "coil_voltage", "min_current", "max_current", "breaking_capacity",
+    "power", "rpm", "voltage", "width", "height", "depth", "l_number", "l_size",
+}
+
+
+def normalize_value(key, value):
+    if value is None:
+        return ""
+    text = str(value).strip()
+    if key in NUMERIC_KEYS:
+        try:
+            number = float(text.replace('٬', '').replace(',', ''))
+            return str(int(number)) if number.is_integer() else repr(number)
+        except ValueError:
+            pass
+    return text
+
+
+def component_fingerprint(component_type, attrs):
+    """
+    Returns the fingerprint of a component given its type and {key: value} attributes.
+    """
+    keys = IDENTITY_KEYS.get(component_type)
+    if keys is None:
+        keys = sorted(key for key in attrs if key not in NON_IDENTITY_KEYS)
+    canonical = "\x1f".join(
+        [component_type] + [f"{key}={normalize_value(key, attrs.get(key))}" for key in keys]
+    )
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,36 @@
+"""
+Helpers for the Jalali date strings stored in the database ("YYYY/MM/DD HH:MM",
+users.created_at uses "YYYY-MM-DD HH:MM:SS").
+"""
+import calendar
+
+import jdatetime
+
+
+JALALI_FORMATS = ("%Y/%m/%d %H:%M", "%Y/%m/%d %H:%M:%S", "%Y/%m/%d", "%Y-%m-%d %H:%M:%S")
+
+
+def jalali_to_epoch(value):
+    """
+    Converts a stored Jalali date string to sortable epoch seconds (wall clock, no timezone).
+    Returns None for empty or unparsable values.
+    """
+    if not value:
+        return None
+    text = str(value).strip()
+    for fmt in JALALI_FORMATS:
+        try:
+            gregorian = jdatetime.datetime.strptime(text, fmt).togregorian()
+        except ValueError:
+            continue
+        return calendar.timegm(gregorian.timetuple())
+    return None
+
+
+def jalali_epoch_default(column):
+    """
+    Column default for an epoch companion column: the epoch of the row's Jalali date column.
+    """
+    def default(context):
+        return jalali_to_epoch(context.get_current_parameters().get(column))
+    return default
@@ -0,0 +1,335 @@
+"""
+Schema migrations for the GriinPower SQLite database.
+
+Each migration is a (version, description, steps) entry; steps are SQL strings or
+callables taking a DBAPI connection. Applied versions are tracked in PRAGMA user_version,
+so run_migrations() is cheap to call on every start-up.
+"""
+from utils.database import engine
+from utils.fingerprint import component_fingerprint
+from utils.jalali import jalali_to_epoch
+
+# ----------------------------------------------------------------------
+# Pivoted per-type views
+# ----------------------------------------------------------------------
+
+# view name -> (component types, {attribute key: column affinity})
+PIVOT_VIEWS = {
+    "contactor_view": (["Contactor"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "rated_current": "REAL", "coil_voltage": "REAL",
+    }),
+    "mccb_view": (["MCCB"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "rated_current": "REAL", "breaking_capacity": "REAL",
+    }),
+    "mpcb_view": (["MPCB"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "min_current": "REAL", "max_current": "REAL", "breaking_capacity": "REAL", "trip_class": "TEXT",
+    }),
+    "bimetal_view": (["Bimetal"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "min_current": "REAL", "max_current": "REAL", "class": "TEXT", "trip_time": "TEXT",
+    }),
+    "motor_view": (["Motor"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "power": "REAL", "rpm": "REAL", "voltage": "REAL", "start_type": "TEXT", "cooling_method": "TEXT",
+        "ip_rating": "TEXT", "efficiency_class": "TEXT", "painting_ral": "TEXT", "thermal_protection": "TEXT",
+        "is_official": "TEXT", "is_routine": "TEXT",
+    }),
+    "vfd_softstarter_view": (["VFD", "SoftStarter"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "power": "REAL",
+    }),
+    "electrical_panel_view": (["Electrical Panel", "Local Box", "Junction Box"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "width": "REAL", "height": "REAL", "depth": "REAL", "ip_rating": "TEXT",
+    }),
+    "wire_cable_view": (["WireCable"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "type": "TEXT", "l_number": "REAL", "l_size": "REAL", "note": "TEXT",
+    }),
+    "general_view": (["General"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "type": "TEXT", "specification": "TEXT",
+    }),
+    "instrument_view": (["Instrument"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "type": "TEXT", "hart_comminucation": "TEXT",
+    }),
+    "plc_view": (["PLC"], {
+        "brand": "TEXT", "order_number": "TEXT",
+        "series": "TEXT", "model": "TEXT",
+        "di_pins": "REAL", "do_pins": "REAL", "ai_pins": "REAL", "ao_pins": "REAL",
+        "has_profinet": "TEXT", "has_profibus": "TEXT", "has_hart": "TEXT", "has_mpi": "TEXT",
+    }),
+}
+
+
+def _pivot_column(key, affinity):
+    value = f"MAX(CASE WHEN a.key = '{key}' THEN a.value END)"
+    if affinity == "REAL":
+        # values are stored as text, sometimes with thousand separators
+        value = f"CAST(NULLIF(TRIM(REPLACE(REPLACE({value}, ',', ''), '٬', '')), '') AS REAL)"
+    return f'{value} AS "{key}"'
+
+
+def pivot_view_sql(view_name):
+    types, columns = PIVOT_VIEWS[view_name]
+    type_list = ", ".join(f"'{t}'" for t in types)
+    select_columns = ",\n    ".join(_pivot_column(key, affinity) for key, affinity in columns.items())
+    return (
+        f"CREATE VIEW IF NOT EXISTS {view_name} AS\n"
+        f"SELECT\n    c.id AS component_id,\n    c.type AS type_name,\n    {select_columns}\n"
+        f"FROM components c\n"
+        f"LEFT JOIN component_attributes a ON a.component_id = c.id\n"
+        f"WHERE c.type IN ({type_list})\n"
+        f"GROUP BY c.id"
+    )
+
+
+def _create_pivot_views(connection):
+    for view_name in PIVOT_VIEWS:
+        connection.execute(f"DROP VIEW IF EXISTS {view_name}")
+        connection.execute(pivot_view_sql(view_name))
+
+
+# ----------------------------------------------------------------------
+# Latest price
+# ----------------------------------------------------------------------
+
+def _backfill_latest_price(connection):
+    connection.create_function("jalali_epoch", 1, jalali_to_epoch, deterministic=True)
+    connection.execute("""
+        INSERT OR REPLACE INTO latest_price
+            (component_id, component_supplier_id, supplier_id, price, currency, date, date_epoch)
+        SELECT component_id, id, supplier_id, price, currency, date, date_epoch
+        FROM (
+            SELECT cs.*, jalali_epoch(cs.date) AS date_epoch,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY cs.component_id
+                       ORDER BY jalali_epoch(cs.date) DESC, cs.id DESC
+                   ) AS rn
+            FROM component_supplier cs
+        )
+        WHERE rn = 1
+    """)
+
+
+# ----------------------------------------------------------------------
+# Component fingerprints
+# ----------------------------------------------------------------------
+
+def _backfill_fingerprints(connection):
+    attrs_by_component = {}
+    for component_id, key, value in connection.execute(
+            "SELECT component_id, key, value FROM component_attributes"):
+        attrs_by_component.setdefault(component_id, {})[key] = value
+
+    # existing duplicates keep a NULL fingerprint; the lowest id stays the canonical row
+    seen = set()
+    for component_id, component_type in connection.execute(
+            "SELECT id, type FROM components ORDER BY id").fetchall():
+        fingerprint = component_fingerprint(component_type, attrs_by_component.get(component_id, {}))
+        if fingerprint in seen:
+            continue
+        seen.add(fingerprint)
+        connection.execute("UPDATE components SET fingerprint = ? WHERE id = ?", (fingerprint, component_id))
+
+
+# ----------------------------------------------------------------------
+# Epoch companion columns
+# ----------------------------------------------------------------------
+
+def _backfill_epochs(connection):
+    connection.create_function("jalali_epoch", 1, jalali_to_epoch, deterministic=True)
+    connection.execute("UPDATE component_supplier SET date_epoch = jalali_epoch(date)")
+    connection.execute("UPDATE projects SET modified_at_epoch = jalali_epoch(modified_at)")
+    connection.execute("UPDATE users SET created_at_epoch = jalali_epoch(created_at)")
+
+
+# ----------------------------------------------------------------------
+# Catalog version counters
+# ----------------------------------------------------------------------
+
+def _bump_version(type_sql):
+    return (
+        f"INSERT INTO catalog_version (component_type, version) {type_sql} "
+        f"ON CONFLICT (component_type) DO UPDATE SET version = version + 1;"
+    )
+
+
+def _catalog_version_triggers():
+    """
+    AFTER INSERT/UPDATE/DELETE triggers on components, component_attributes and
+    component_supplier that bump the version of the affected component type.
+    """
+    statements = []
+    for event, row in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD")):
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS tr_components_{event.lower()}_version "
+            f"AFTER {event} ON components BEGIN "
+            f"{_bump_version(f'SELECT {row}.type, 1 WHERE {row}.type IS NOT NULL')} END"
+        )
+        for table in ("component_attributes", "component_supplier"):
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS tr_{table}_{event.lower()}_version "
+                f"AFTER {event} ON {table} BEGIN "
+                f"{_bump_version(f'SELECT type, 1 FROM components WHERE id = {row}.component_id')} END"
+            )
+    return statements
+
+
+# ----------------------------------------------------------------------
+# Full-text search
+# ----------------------------------------------------------------------
+
+# attribute keys indexed in component_search, besides the component type
+SEARCH_KEYS = ["order_number", "brand", "type", "specification", "note"]
+
+
+def _search_rows_sql(where):
+    columns = ", ".join(f"MAX(CASE WHEN a.key = '{key}' THEN a.value END)" for key in SEARCH_KEYS)
+    return (
+        f"SELECT c.id, {columns}, c.type "
+        f"FROM components c JOIN component_attributes a ON a.component_id = c.id "
+        f"WHERE {where} GROUP BY c.id"
+    )
+
+
+def _reindex_search_sql(component_id):
+    return (
+        f"DELETE FROM component_search WHERE rowid = {component_id}; "
+        f"INSERT INTO component_search (rowid, {', '.join(SEARCH_KEYS)}, component_type) "
+        f"{_search_rows_sql(f'c.id = {component_id}')};"
+    )
+
+
+def _search_triggers():
+    """
+    Keeps component_search in sync with component_attributes and components.
+    """
+    keys = ", ".join(f"'{key}'" for key in SEARCH_KEYS)
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS tr_component_attributes_insert_search "
+        f"AFTER INSERT ON component_attributes WHEN NEW.key IN ({keys}) BEGIN "
+        f"{_reindex_search_sql('NEW.component_id')} END",
+        f"CREATE TRIGGER IF NOT EXISTS tr_component_attributes_update_search "
+        f"AFTER UPDATE ON component_attributes WHEN NEW.key IN ({keys}) OR OLD.key IN ({keys}) BEGIN "
+        f"{_reindex_search_sql('OLD.component_id')} {_reindex_search_sql('NEW.component_id')} END",
+        f"CREATE TRIGGER IF NOT EXISTS tr_component_attributes_delete_search "
+        f"AFTER DELETE ON component_attributes WHEN OLD.key IN ({keys}) BEGIN "
+        f"{_reindex_search_sql('OLD.component_id')} END",
+        f"CREATE TRIGGER IF NOT EXISTS tr_components_update_search "
+        f"AFTER UPDATE OF type ON components BEGIN "
+        f"{_reindex_search_sql('NEW.id')} END",
+        f"CREATE TRIGGER IF NOT EXISTS tr_components_delete_search "
+        f"AFTER DELETE ON components BEGIN "
+        f"DELETE FROM component_search WHERE rowid = OLD.id; END",
+    ]
+
+
+# ----------------------------------------------------------------------
+# Migration list
+# ----------------------------------------------------------------------
+
+MIGRATIONS = [
+    (1, "EAV indexes and pivoted per-type views", [
+        "CREATE INDEX IF NOT EXISTS ix_component_attributes_key_value_component "
+        "ON component_attributes (key, value, component_id)",
+        "CREATE INDEX IF NOT EXISTS ix_component_attributes_component_id "
+        "ON component_attributes (component_id)",
+        "CREATE INDEX IF NOT EXISTS ix_components_type ON components (type)",
+        _create_pivot_views,
+    ]),
+    (2, "Materialized latest price per component", [
+        "CREATE TABLE IF NOT EXISTS latest_price ("
+        "component_id INTEGER NOT NULL PRIMARY KEY REFERENCES components (id), "
+        "component_supplier_id INTEGER REFERENCES component_supplier (id), "
+        "supplier_id INTEGER REFERENCES supplier (id), "
+        "price REAL, "
+        "currency TEXT, "
+        "date TEXT, "
+        "date_epoch INTEGER)",
+        "CREATE INDEX IF NOT EXISTS ix_latest_price_date_epoch ON latest_price (date_epoch)",
+        "CREATE INDEX IF NOT EXISTS ix_component_supplier_component_id ON component_supplier (component_id)",
+        _backfill_latest_price,
+    ]),
+    (3, "Component fingerprints for indexed de-duplication", [
+        "ALTER TABLE components ADD COLUMN fingerprint TEXT",
+        _backfill_fingerprints,
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_components_fingerprint ON components (fingerprint)",
+    ]),
+    (4, "Sortable epoch columns next to the Jalali dates", [
+        "ALTER TABLE component_supplier ADD COLUMN date_epoch INTEGER",
+        "ALTER TABLE projects ADD COLUMN modified_at_epoch INTEGER",
+        "ALTER TABLE users ADD COLUMN created_at_epoch INTEGER",
+        _backfill_epochs,
+        "CREATE INDEX IF NOT EXISTS ix_component_supplier_component_date "
+        "ON component_supplier (component_id, date_epoch)",
+        "CREATE INDEX IF NOT EXISTS ix_projects_modified_at_epoch ON projects (modified_at_epoch)",
+        "CREATE INDEX IF NOT EXISTS ix_users_created_at_epoch ON users (created_at_epoch)",
+    ]),
+    (5, "Cross-process catalog version counters", [
+        "CREATE TABLE IF NOT EXISTS catalog_version ("
+        "component_type TEXT NOT NULL PRIMARY KEY, "
+        "version INTEGER NOT NULL DEFAULT 0)",
+        "INSERT OR IGNORE INTO catalog_version (component_type, version) "
+        "SELECT type, 1 FROM components WHERE type IS NOT NULL GROUP BY type",
+        *_catalog_version_triggers(),
+    ]),
+    (6, "FTS5 search over order numbers, brands and specifications", [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS component_search USING fts5("
+        f"{', '.join(SEARCH_KEYS)}, component_type, tokenize = 'trigram')",
+        f"INSERT INTO component_search (rowid, {', '.join(SEARCH_KEYS)}, component_type) "
+        f"{_search_rows_sql('1 = 1')}",
+        *_search_triggers(),
+    ]),
+    (7, "Dated exchange rates for currency normalization", [
+        "CREATE TABLE IF NOT EXISTS exchange_rate ("
+        "id INTEGER NOT NULL PRIMARY KEY, "
+        "currency VARCHAR NOT NULL, "
+        "rate FLOAT NOT NULL, "
+        "date VARCHAR, "
+        "date_epoch INTEGER, "
+        "created_by_id INTEGER)",
+        "CREATE INDEX IF NOT EXISTS ix_exchange_rate_currency_date ON exchange_rate (currency, date_epoch)",
+    ]),
+]
+
+
+def get_schema_version(connection):
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_migrations(bind=engine):
+    """
+    Applies every pending migration, each inside its own transaction.
+    Returns (True, applied_versions) or (False, error message).
+    """
+    raw = bind.raw_connection()
+    applied = []
+    try:
+        connection = raw.driver_connection
+        current = get_schema_version(connection)
+        for version, description, steps in MIGRATIONS:
+            if version <= current:
+                continue
+            connection.execute("BEGIN")
+            try:
+                for step in steps:
+                    if callable(step):
+                        step(connection)
+                    else:
+                        connection.execute(step)
+                connection.execute(f"PRAGMA user_version = {int(version)}")
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            applied.append(version)
+        return True, applied
+    except Exception as e:
+        return False, f"❌ Database migration failed:\n{str(e)}"
+    finally:
+        raw.close()
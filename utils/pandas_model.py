@@ -36,6 +36,10 @@ class PandasModel(QAbstractTableModel):
             except (ValueError, TypeError):
                 return str(value)
 
+        # quantities are stored as floats; show whole numbers without ".0"
+        if column_name.lower() == "quantity" and isinstance(value, float) and value.is_integer():
+            return str(int(value))
+
         return str(value)
 
     def setData(self, index, value, role=Qt.EditRole):
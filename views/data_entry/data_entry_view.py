@@ -1,12 +1,17 @@
 from PyQt5 import uic
 from PyQt5.QtCore import QSettings
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QIcon, QStandardItemModel
 from PyQt5.QtWidgets import QMainWindow
 from PyQt5.QtWidgets import QTableView
 
+from controllers.prefetch_controller import CatalogPrefetch
 from controllers.user_session_controller import UserSession
+from models.component_search import search_components
+from models.option_index import get_option_index
 from models.supplier import get_all_suppliers
+from utils.combo_options import add_combo_options
+from utils.pandas_model import PandasModel
 from views.data_entry.bimetal_data_entry_view import BimetalDataEntryView
 from views.data_entry.contactor_data_entry_view import ContactorDataEntryView
 from views.data_entry.electrical_panel_data_entry_view import ElectricalPanelDataEntryView
@@ -18,8 +23,10 @@ from views.data_entry.mpcb_data_entry_view import MPCBDataEntryView
 from views.data_entry.plc_data_entry_view import PLCDataEntryView
 from views.data_entry.vfd_softstarter_data_entry_view import VFDSoftStarterDataEntryView
 from views.data_entry.wire_cable_data_entry_view import WireCableDataEntryView
+from views.message_box_view import show_message
 from views.supplier_view import SupplierEntry
 import jdatetime
+import pandas as pd
 import re
 
 class DataEntry(QMainWindow):
@@ -54,7 +61,18 @@ class DataEntry(QMainWindow):
         self.history_table_headers = ["brand", "order_number", "supplier_name", "price", "currency", "date",
                                       "created_by"]
 
+        self.search_table_headers = ["component_type", "type", "brand", "order_number", "specification", "note",
+                                     "supplier_name", "price", "currency", "date"]
+
+        # search as the user types, once typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)
+        self.search_timer.timeout.connect(self.search_components_func)
+        self.component_search.textChanged.connect(self.search_timer.start)
+
         self.load_suppliers()
+        self.load_options()
 
         self.display_entry(0)
         self.show()
@@ -88,11 +106,27 @@ class DataEntry(QMainWindow):
         elif index == 10:
             GeneralDataEntryView(self)
 
+    def search_components_func(self):
+        query = self.component_search.text().strip()
+        if not query:
+            # back to the history of the selected item
+            self.display_entry(self.item_stack.currentIndex())
+            return
+
+        success, results = search_components(query)
+        if not success:
+            show_message(results, "Error")
+            return
+
+        df = pd.DataFrame(results, columns=self.search_table_headers).fillna("")
+        self.history_list.setModel(PandasModel(df))
+        self.history_list.resizeColumnsToContents()
+
     def add_supplier(self):
         self.venor_application_window = SupplierEntry(parent=self)
 
     def load_suppliers(self):
-        success, all_supplier = get_all_suppliers()
+        success, all_supplier = CatalogPrefetch().take("suppliers", get_all_suppliers)
 
         suppliers_name = ["--------"] + [s.name for s in all_supplier]
         self.plc_supplier_list.addItems(suppliers_name)
@@ -106,8 +140,36 @@ class DataEntry(QMainWindow):
         self.wire_cable_supplier.addItems(suppliers_name)
         self.electrical_panel_supplier.addItems(suppliers_name)
 
-    # def load_brands(self):
-    #     success, all_brands = get_all_brands()
+    def load_options(self):
+        """Adds the brands, ratings and types already in the database to the static combo items."""
+        combo_options = {
+            self.motor_brand: [("Motor", "brand")],
+            self.motor_ip: [("Motor", "ip_rating")],
+            self.motor_efficiency_class: [("Motor", "efficiency_class")],
+            self.plc_brand: [("PLC", "brand")],
+            self.instrument_brand: [("Instrument", "brand")],
+            self.instrument_type: [("Instrument", "type")],
+            self.contactor_brand: [("Contactor", "brand")],
+            self.mpcb_brand: [("MPCB", "brand")],
+            self.mccb_brand: [("MCCB", "brand")],
+            self.bimetal_brand: [("Bimetal", "brand")],
+            self.vfd_softstarter_brand: [("VFD", "brand"), ("SoftStarter", "brand")],
+            self.wire_cable_type: [("WireCable", "type")],
+            self.electrical_panel_ip_rating: [("Electrical Panel", "ip_rating"), ("Junction Box", "ip_rating"),
+                                              ("Local Box", "ip_rating")],
+            self.general_type: [("General", "type")],
+        }
+
+        component_types = {component_type for sources in combo_options.values() for component_type, _ in sources}
+        success, option_index = CatalogPrefetch().take("options", lambda: get_option_index(component_types))
+        if not success:
+            # the static items are still usable
+            show_message(option_index, "Error")
+            return
+
+        for combo, sources in combo_options.items():
+            for component_type, key in sources:
+                add_combo_options(combo, option_index.get(component_type, {}).get((None, key), []))
 
     def hide_show_item_stack_btn_func(self):
         # Toggle visibility of motor_list table view
@@ -8,8 +8,12 @@ from PyQt5.QtWidgets import QWidget, QSpinBox, QComboBox, QLineEdit, QCheckBox
 from docx import Document
 import jdatetime
 
+from controllers.prefetch_controller import CatalogPrefetch
 from controllers.tender_application.project_session_controller import ProjectSession
+from controllers.tender_application.spec_change_controller import SpecChangeTracker
 from controllers.user_session_controller import UserSession
+from models.option_index import get_option_index
+from utils.combo_options import add_combo_options
 from views.message_box_view import show_message
 
 
@@ -23,9 +27,46 @@ class ElectricalTab(QWidget):
         self.electrical_specs = self.current_project.project_electrical_specs
 
         self._initialize_components()
+        self._load_brand_options()
 
         self.set_electrical_ui_values()
 
+    def _load_brand_options(self):
+        """Adds the brands in the database for each instrument and motor to its brand combo box."""
+        brand_sources = {
+            self.bagfilter_dpt_brand: ("Instrument", "Delta Pressure Transmitter"),
+            self.bagfilter_dps_brand: ("Instrument", "Delta Pressure Switch"),
+            self.bagfilter_pt_brand: ("Instrument", "Pressure Transmitter"),
+            self.bagfilter_ps_brand: ("Instrument", "Pressure Switch"),
+            self.bagfilter_pg_brand: ("Instrument", "Pressure Gauge"),
+            self.bagfilter_inlet_tt_brand: ("Instrument", "Temperature Transmitter"),
+            self.bagfilter_outlet_tt_brand: ("Instrument", "Temperature Transmitter"),
+            self.transport_zs_brand: ("Instrument", "Proximity Switch"),
+            self.transport_spd_brand: ("Instrument", "Speed Detector"),
+            self.transport_ls_bin_brand: ("Instrument", "Level Switch"),
+            self.transport_lt_brand: ("Instrument", "Level Transmitter"),
+            self.damper_zs_brand: ("Instrument", "Proximity Switch"),
+            self.freshair_zs_brand: ("Instrument", "Proximity Switch"),
+            self.freshair_tt_brand: ("Instrument", "Temperature Transmitter"),
+            self.hopper_heater_ptc_brand: ("Instrument", "Ptc"),
+            self.fan_pt_brand: ("Instrument", "Pressure Transmitter"),
+            self.fan_tt_brand: ("Instrument", "Temperature Transmitter"),
+            self.pt100_brand: ("Instrument", "Temperature Transmitter"),
+            self.fan_bearing_tt_brand: ("Instrument", "Temperature Transmitter"),
+            self.fan_bearing_vt_brand: ("Instrument", "Vibration Transmitter"),
+            self.fan_brand: ("Motor", None),
+            self.damper_brand: ("Motor", None),
+        }
+
+        success, option_index = CatalogPrefetch().take("options", lambda: get_option_index(["Instrument", "Motor"]))
+        if not success:
+            # the static items are still usable
+            show_message(option_index, "Error")
+            return
+
+        for combo, (component_type, subtype) in brand_sources.items():
+            add_combo_options(combo, option_index.get(component_type, {}).get((subtype, "brand"), []))
+
     def _initialize_components(self):
         """Initialize all UI components with their event handlers"""
 
@@ -202,10 +243,10 @@ class ElectricalTab(QWidget):
             required_switches = value * 2
             if self.transport_zs_qty.value() < required_switches:
                 self.transport_zs_qty.setValue(required_switches)
-                self.electrical_specs["transport"]["instruments"]["proximity_switch"]["qty"] = required_switches
+                self._update_project_value(["transport", "instruments", "proximity_switch", "qty"], required_switches)
         else:
             self.transport_zs_qty.setValue(0)
-            self.electrical_specs["transport"]["instruments"]["proximity_switch"]["qty"] = 0
+            self._update_project_value(["transport", "instruments", "proximity_switch", "qty"], 0)
 
     def _handle_slide_gate_kw_changed(self):
         self._handle_combobox_float_kilo(["transport", "motors", "slide_gate", "power"])
@@ -265,7 +306,7 @@ class ElectricalTab(QWidget):
             required_switches = self.freshair_motor_qty.value() * 2
             if self.freshair_zs_qty.value() < required_switches:
                 self.freshair_zs_qty.setValue(required_switches)
-                self.electrical_specs["fresh_air"]["instruments"]["proximity_switch"]["qty"] = required_switches
+                self._update_project_value(["fresh_air", "instruments", "proximity_switch", "qty"], required_switches)
 
     def _handle_freshair_motor_kw_changed(self):
         self._handle_combobox_float_kilo(["fresh_air", "motors", "freshair_motor", "power"])
@@ -312,7 +353,7 @@ class ElectricalTab(QWidget):
 
         """ ------------Update PTC qty based on heater qty ------------ """
         ptc_qty = value * 2
-        self.electrical_specs["hopper_heater"]["instruments"]["ptc"]["qty"] = ptc_qty
+        self._update_project_value(["hopper_heater", "instruments", "ptc", "qty"], ptc_qty)
         self.hopper_heater_ptc_qty.setText(f"Qty: {ptc_qty}")
 
     def _handle_hopper_heater_kw_changed(self):
@@ -444,7 +485,7 @@ class ElectricalTab(QWidget):
             return
 
         """ ------------Update the tender_application details ------------ """
-        self.electrical_specs["transport"]["motors"][motor_type]["qty"] = widget.value()
+        self._update_project_value(["transport", "motors", motor_type, "qty"], widget.value())
 
         """ ------------Calculate total rotary/screw motors ------------ """
         total_motors = (self.rotary_qty.value() +
@@ -454,18 +495,19 @@ class ElectricalTab(QWidget):
         """ ------------Update speed detector quantity based on total motors ------------ """
         if total_motors == 0:
             self.transport_spd_qty.setValue(0)
-            self.electrical_specs["transport"]["instruments"]["speed_detector"]["qty"] = 0
+            self._update_project_value(["transport", "instruments", "speed_detector", "qty"], 0)
         elif self.transport_spd_qty.value() < total_motors:
             self.transport_spd_qty.setValue(total_motors)
-            self.electrical_specs["transport"]["instruments"]["speed_detector"]["qty"] = total_motors
+            self._update_project_value(["transport", "instruments", "speed_detector", "qty"], total_motors)
 
     def _handle_transport_checkbox_changed(self, state):
         """Handle transport section enabling/disabling"""
         enabled = state == Qt.Checked
-        self.electrical_specs["transport"]["status"] = enabled
+        self._update_project_value(["transport", "status"], enabled)
 
         if not enabled:
             self._reset_qtys(self.electrical_specs["transport"])
+            SpecChangeTracker().mark_dirty(["transport"])
 
         self._reset_section_widgets(self.transport_gbox, enabled)
         self.transport_checkbox.setEnabled(True)
@@ -473,10 +515,11 @@ class ElectricalTab(QWidget):
     def _handle_vibration_checkbox_changed(self, state):
         """Handle vibration section enabling/disabling"""
         enabled = state == Qt.Checked
-        self.electrical_specs["vibration"]["status"] = enabled
+        self._update_project_value(["vibration", "status"], enabled)
 
         if not enabled:
             self._reset_qtys(self.electrical_specs["vibration"])
+            SpecChangeTracker().mark_dirty(["vibration"])
 
         self._reset_section_widgets(self.vibration_gbox, enabled)
         self.vibration_checkbox.setEnabled(True)
@@ -484,10 +527,11 @@ class ElectricalTab(QWidget):
     def _handle_freshair_checkbox_changed(self, state):
         """Handle fresh air section enabling/disabling"""
         enabled = state == Qt.Checked
-        self.electrical_specs["fresh_air"]["status"] = enabled
+        self._update_project_value(["fresh_air", "status"], enabled)
 
         if not enabled:
             self._reset_qtys(self.electrical_specs["fresh_air"])
+            SpecChangeTracker().mark_dirty(["fresh_air"])
 
         self._reset_section_widgets(self.freshair_gbox, enabled)
         self.freshair_checkbox.setEnabled(True)
@@ -495,10 +539,11 @@ class ElectricalTab(QWidget):
     def _handle_hopper_heater_checkbox_changed(self, state):
         """Handle hopper heater section enabling/disabling"""
         enabled = state == Qt.Checked
-        self.electrical_specs["hopper_heater"]["status"] = enabled
+        self._update_project_value(["hopper_heater", "status"], enabled)
 
         if not enabled:
             self._reset_qtys(self.electrical_specs["hopper_heater"])
+            SpecChangeTracker().mark_dirty(["hopper_heater"])
 
         self._reset_section_widgets(self.hopper_heater_gbox, enabled)
         self.hopper_heater_checkbox.setEnabled(True)
@@ -506,11 +551,12 @@ class ElectricalTab(QWidget):
     def _handle_damper_checkbox_changed(self, state):
         """Handle damper section enabling/disabling"""
         enabled = state == Qt.Checked
-        self.electrical_specs["damper"]["status"] = enabled
-        self.electrical_specs["damper"]["motors"]["damper"]["qty"] = 1 if enabled else 0
+        self._update_project_value(["damper", "status"], enabled)
+        self._update_project_value(["damper", "motors", "damper", "qty"], 1 if enabled else 0)
 
         if not enabled:
             self._reset_qtys(self.electrical_specs["damper"])
+            SpecChangeTracker().mark_dirty(["damper"])
 
         """ ------------Enable/disable individual damper widgets ------------ """
         self.damper_kw.setEnabled(enabled)
@@ -530,11 +576,12 @@ class ElectricalTab(QWidget):
     def _handle_fan_checkbox_changed(self, state):
         """Handle fan section enabling/disabling"""
         enabled = state == Qt.Checked
-        self.electrical_specs["fan"]["status"] = enabled
-        self.electrical_specs["fan"]["motors"]["fan"]["qty"] = 1 if enabled else 0
+        self._update_project_value(["fan", "status"], enabled)
+        self._update_project_value(["fan", "motors", "fan", "qty"], 1 if enabled else 0)
 
         if not enabled:
             self._reset_qtys(self.electrical_specs["fan"])
+            SpecChangeTracker().mark_dirty(["fan"])
 
         """ ------------Enable/disable individual fan widgets ------------ """
         fan_widgets = [
@@ -734,6 +781,7 @@ class ElectricalTab(QWidget):
 
         """ ------------Set the value ------------ """
         target[path_list[-1]] = value
+        SpecChangeTracker().mark_dirty(path_list)
 
     def _handle_combobox_float_kilo(self, path_list):
 
@@ -3,11 +3,13 @@ from PyQt5.QtWidgets import QWidget
 
 from controllers.tender_application.installation_controller import InstallationController
 from controllers.tender_application.project_session_controller import ProjectSession
+from controllers.tender_application.spec_change_controller import SpecChangeTracker
 import pandas as pd
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QHeaderView, QTableView
 
 from controllers.tender_application.panel_controller import PanelController
+from models.exchange_rate import convert_currency, get_exchange_rates
 from models.items.electrical_panel import get_electrical_panel_by_spec
 from utils.pandas_model import PandasModel
 from views.message_box_view import show_message
@@ -27,21 +29,26 @@ class InstallationTab(QWidget):
         self.depth_field.valueChanged.connect(self.depth_field_value_handler)
         self.ccr_field.valueChanged.connect(self.ccr_field_value_handler)
 
+        self.installation_panel = None
         self.update_table.clicked.connect(self.generate_result)
         self.set_installation_ui_values()
 
 
     def depth_field_value_handler(self):
         self.electrical_specs["installation"]["depth"] = self.depth_field.value()
+        SpecChangeTracker().mark_dirty(["installation", "depth"])
 
     def width_field_value_handler(self):
         self.electrical_specs["installation"]["width"] = self.width_field.value()
+        SpecChangeTracker().mark_dirty(["installation", "width"])
 
     def height_field_value_handler(self):
         self.electrical_specs["installation"]["height"] = self.height_field.value()
+        SpecChangeTracker().mark_dirty(["installation", "height"])
 
     def ccr_field_value_handler(self):
         self.electrical_specs["installation"]["ccr"] = self.ccr_field.value()
+        SpecChangeTracker().mark_dirty(["installation", "ccr"])
 
     def _setup_result_table(self):
         self.installation_panel.setAlternatingRowColors(True)
@@ -54,10 +61,24 @@ class InstallationTab(QWidget):
         self.installation_panel.verticalHeader().setVisible(False)
 
     def generate_result(self):
-        installation_controller = InstallationController()
-        self.installation_panel = installation_controller.build_panel()
-
-        df = pd.DataFrame(self.installation_panel)
+        # rebuild only when a spec it reads, or a motor of the last panel build, changed
+        if SpecChangeTracker().take_dirty(["installation_panel"]) or self.installation_panel is None:
+            installation_controller = InstallationController()
+            lookup_cache = self._result_lookup_cache()
+            if lookup_cache is not None:
+                installation_controller.lookup_cache = lookup_cache
+            self.installation_panel = installation_controller.build_panel()
+
+        df = self.installation_panel.to_frame()
+        success, rates = get_exchange_rates()
+        if not success:
+            show_message(rates, "Error")
+        else:
+            success, converted = convert_currency(df, rates)
+            if success:
+                df = converted
+            else:
+                show_message(converted, "Error")
         df = self._add_summary_row(df)
         model = PandasModel(df)
         self.installation_panel_table.setModel(model)
@@ -72,6 +93,20 @@ class InstallationTab(QWidget):
         self.installation_panel_table.resizeRowsToContents()
         self.installation_panel_table.setColumnHidden(2, True)  # hide order_number column
 
+    def _result_lookup_cache(self):
+        """
+        The lookup cache of the Result tab's last panel build, while the catalog is still the
+        one it was filled from (entries are keyed by arguments and proj_avl, so spec changes
+        do not stale it).
+        """
+        result_tab = getattr(self.main_view, "result_tab", None)
+        if result_tab is None or result_tab.lookup_cache is None:
+            return None
+        versions = SpecChangeTracker().catalog_versions()
+        if versions is None or versions != result_tab.lookup_cache_catalog:
+            return None
+        return result_tab.lookup_cache
+
     def _add_summary_row(self, df):
         summary = {
             col: df[col].sum() if col == "total_price" else ("Total" if col.lower() == "type" else "")
@@ -1,6 +1,7 @@
 from PyQt5 import uic
 from PyQt5.QtWidgets import QWidget, QComboBox, QSpinBox, QLineEdit, QCheckBox
 from controllers.tender_application.project_session_controller import ProjectSession
+from controllers.tender_application.spec_change_controller import SpecChangeTracker
 from views.message_box_view import show_message
 
 
@@ -87,6 +88,7 @@ class ProjectInformationTab(QWidget):
 
         # Set the value
         target[path_list[-1]] = value
+        SpecChangeTracker().mark_dirty(path_list)
 
     """ --------------------------- Project Information --------------------------- """
 
@@ -185,18 +187,21 @@ class ProjectInformationTab(QWidget):
             self.electrical_specs["project_info"]["proj_avl"].append("siemens")
         elif not self.proj_avl_siemens.isChecked() and "siemens" in self.electrical_specs["project_info"]["proj_avl"]:
             self.electrical_specs["project_info"]["proj_avl"].remove("siemens")
+        SpecChangeTracker().mark_dirty(["project_info", "proj_avl"])
 
     def _handle_proj_avl_schneider_changed(self):
         if self.proj_avl_schneider.isChecked() and "schneider electric" not in self.electrical_specs["project_info"]["proj_avl"]:
             self.electrical_specs["project_info"]["proj_avl"].append("schneider electric")
         elif not self.proj_avl_schneider.isChecked() and "schneider electric" in self.electrical_specs["project_info"]["proj_avl"]:
             self.electrical_specs["project_info"]["proj_avl"].remove("schneider electric")
+        SpecChangeTracker().mark_dirty(["project_info", "proj_avl"])
 
     def _handle_proj_avl_hyundai_changed(self):
         if self.proj_avl_hyundai.isChecked() and "Hyundai" not in self.electrical_specs["project_info"]["proj_avl"]:
             self.electrical_specs["project_info"]["proj_avl"].append("hyundai")
         elif not self.proj_avl_hyundai.isChecked() and "Hyundai" in self.electrical_specs["project_info"]["proj_avl"]:
             self.electrical_specs["project_info"]["proj_avl"].remove("hyundai")
+        SpecChangeTracker().mark_dirty(["project_info", "proj_avl"])
 
     def check_info_tab_ui_rules(self):
         if self.project_m_voltage.currentIndex() == 0:
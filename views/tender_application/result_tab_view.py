@@ -8,19 +8,18 @@ from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QTreeWidget, QTreeWidgetItem,
     QPushButton, QVBoxLayout, QFileDialog
 )
-from PyQt5.QtWidgets import QTableView, QHeaderView
+from PyQt5.QtWidgets import QTableView, QHeaderView, QApplication
 from openpyxl.styles import Font, PatternFill
 
-from controllers.tender_application.bagfilter_controller import BagfilterController
-from controllers.tender_application.electric_motor_controller import ElectricMotorController
-from controllers.tender_application.fan_damper_controller import FanDamperController
-from controllers.tender_application.fresh_air_controller import FreshAirController
-from controllers.tender_application.hopper_heater_controller import HopperHeaterController
+from controllers.prefetch_controller import CatalogPrefetch
+from controllers.tender_application.lookup_cache_controller import LookupCache
+from controllers.tender_application.panel_build_controller import PANEL_CONTROLLERS, build_panels, store_motors
 from controllers.tender_application.project_session_controller import ProjectSession
-from controllers.tender_application.transport_controller import TransportController
-from controllers.tender_application.vibration_controller import VibrationController
+from controllers.tender_application.spec_change_controller import SpecChangeTracker
+from config import BASE_CURRENCY
 from utils.pandas_model import PandasModel
 from models import projects
+from models.exchange_rate import convert_amount, convert_currency, get_exchange_rates
 from views.message_box_view import show_message, confirmation
 
 
@@ -43,7 +42,12 @@ class ResultTab(QWidget):
             "summary_panel_table": self.summary_panel_table
         }
 
-        self.panels = {}
+        self.boms = {}  # panel name -> BOM of the last build, in supplier currencies
+        self.panels = {}  # panel name -> DataFrame shown, in BASE_CURRENCY
+        self.electric_motor_price_and_effective_date = None
+        self.rates = {BASE_CURRENCY: 1.0}
+        self.lookup_cache = None
+        self.lookup_cache_catalog = None  # catalog versions the lookup cache was filled from
 
         self._setup_result_table()
 
@@ -77,22 +81,54 @@ class ResultTab(QWidget):
             table.verticalHeader().setVisible(False)
 
     def generate_panels(self):
-
-        bagfilter_controller = BagfilterController()
-        self.panels["bagfilter_panel"] = bagfilter_controller.build_panel()
-        fan_damper_controller = FanDamperController()
-        self.panels["fan_damper_panel"] = fan_damper_controller.build_panel()
-        transport_controller = TransportController()
-        self.panels["transport_panel"] = transport_controller.build_panel()
-        fresh_air_controller = FreshAirController()
-        self.panels["fresh_air_panel"] = fresh_air_controller.build_panel()
-        vibration_controller = VibrationController()
-        self.panels["vibration_panel"] = vibration_controller.build_panel()
-        hopper_heater_controller = HopperHeaterController()
-        self.panels["hopper_heater_panel"] = hopper_heater_controller.build_panel()
-        if self.main_view.electrical_tab.fan_checkbox.isChecked():
-            electric_motor_controller = ElectricMotorController()
-            electric_motor_price_and_effective_date = electric_motor_controller.calculate_price()
+        # the catalog is normally warm by now; only wait if the prefetch is still running
+        prefetch = CatalogPrefetch()
+        if not prefetch.is_done():
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                prefetch.wait()
+            finally:
+                QApplication.restoreOverrideCursor()
+        success, message = prefetch.catalog_status()
+        if not success:
+            # lookups still fall back to the database
+            show_message(message, "Error")
+
+        # one set of rates for the whole build
+        success, rates = get_exchange_rates()
+        if success:
+            self.rates = rates
+        else:
+            show_message(rates, "Error")
+
+        # rebuild only what the changes since the last build affect
+        tracker = SpecChangeTracker()
+        dirty = tracker.take_dirty(list(PANEL_CONTROLLERS) + ["electric_motor"])
+        dirty |= set(PANEL_CONTROLLERS) - set(self.boms)
+        with_electric_motor = self.main_view.electrical_tab.fan_checkbox.isChecked() and (
+                "electric_motor" in dirty or self.electric_motor_price_and_effective_date is None)
+        names = [name for name in PANEL_CONTROLLERS if name in dirty]
+
+        if names or with_electric_motor:
+            # identical lookups across the panels hit the database once per build
+            self.lookup_cache = LookupCache(self.electrical_specs["project_info"]["proj_avl"])
+            self.lookup_cache_catalog = tracker.catalog_versions()
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                panels, motors, electric_motor_price_and_effective_date = build_panels(
+                    ProjectSession().snapshot(), with_electric_motor=with_electric_motor,
+                    lookup_cache=self.lookup_cache, names=names)
+            except Exception:
+                tracker.mark_panels_dirty(dirty)
+                raise
+            finally:
+                QApplication.restoreOverrideCursor()
+            store_motors(self.electrical_specs, motors)
+            self.boms.update(panels)
+            if with_electric_motor:
+                self.electric_motor_price_and_effective_date = electric_motor_price_and_effective_date
+
+        self._normalize_currencies()
 
         self.generate_table(self.panels["bagfilter_panel"], self.tables["bagfilter_panel_table"])
         self.generate_table(self.panels["fan_damper_panel"], self.tables["fan_damper_panel_table"])
@@ -101,13 +137,29 @@ class ResultTab(QWidget):
         self.generate_table(self.panels["vibration_panel"], self.tables["vibration_panel_table"])
         self.generate_table(self.panels["hopper_heater_panel"], self.tables["hopper_heater_panel_table"])
         if self.main_view.electrical_tab.fan_checkbox.isChecked():
-            summary_data = self.generate_summary_panel(electric_motor_price_and_effective_date)
+            summary_data = self.generate_summary_panel(self.electric_motor_price_and_effective_date)
         else:
             summary_data = self.generate_summary_panel()
         self.generate_table(summary_data, self.tables["summary_panel_table"])
 
-    def generate_table(self, panel, table):
-        df = pd.DataFrame(panel)
+    def _normalize_currencies(self):
+        """
+        Converts every panel BOM to a DataFrame in BASE_CURRENCY so the totals add up;
+        a panel with an unknown currency is kept unconverted.
+        """
+        errors = []
+        for name, bom in self.boms.items():
+            df = bom.to_frame()
+            success, converted = convert_currency(df, self.rates)
+            if success:
+                df = converted
+            elif converted not in errors:
+                errors.append(converted)
+            self.panels[name] = df
+        if errors:
+            show_message("\n".join(errors), "Error")
+
+    def generate_table(self, df, table):
         df = self._add_summary_row(df)
         model = PandasModel(df)
         table.setModel(model)
@@ -150,15 +202,19 @@ class ResultTab(QWidget):
 
         for name, panel in self.panels.items():
             summary["title"].append(name.replace("_", " ").title())
-            panel_df = pd.DataFrame(panel)
-            panel_total = panel_df["total_price"].sum() if "total_price" in panel_df.columns else 0
+            panel_total = panel["total_price"].sum() if "total_price" in panel.columns else 0
             summary["Price"].append(panel_total)
             summary["Note"].append("")
             total_sum += panel_total
 
         if self.electrical_specs["fan"]["status"]:
             summary["title"].append("ELECTRIC MOTOR")
-            motor_price = electric_motor_price_and_effective_date[0]
+            motor_price, _, motor_currency = electric_motor_price_and_effective_date
+            success, converted = convert_amount(motor_price, motor_currency, self.rates)
+            if success:
+                motor_price = converted
+            else:
+                show_message(converted, "Error")
             total_sum += motor_price
             summary["Price"].append(motor_price)
             summary["Note"].append(electric_motor_price_and_effective_date[1])
@@ -167,7 +223,7 @@ class ResultTab(QWidget):
         summary["Price"].append(total_sum)
         summary["Note"].append("")
 
-        return summary
+        return pd.DataFrame(summary)
 
     def _export_to_excel(self):
 
@@ -182,7 +238,7 @@ class ResultTab(QWidget):
                 if model is None:
                     continue
 
-                df = model._data.copy()
+                df = model._data.copy(deep=False)  # only the index is replaced
                 df.index = range(1, len(df) + 1)
 
                 df.to_excel(writer, sheet_name=name, index=True, startrow=1)
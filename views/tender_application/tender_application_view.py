@@ -6,6 +6,7 @@ from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QMainWindow
 
 from controllers.tender_application.project_session_controller import ProjectSession
+from controllers.tender_application.spec_change_controller import SpecChangeTracker
 from models.projects import get_project
 from views.tender_application.electrical_tab_view import ElectricalTab
 from views.tender_application.installation_tab_view import InstallationTab
@@ -25,6 +26,7 @@ class TenderApplication(QMainWindow):
 
         self.current_project = ProjectSession()
         self.electrical_specs = ProjectSession().project_electrical_specs
+        SpecChangeTracker().mark_all_dirty()  # nothing built for this project yet
 
         self.project_information_tab = ProjectInformationTab(self)
         self.tabWidget.addTab(self.project_information_tab, "Project Information")